@@ -0,0 +1,91 @@
+"""
+Benchmark: line classification strategies of the Gardener.
+
+Compares trying one regex per level, a single combined alternation, and the
+combined alternation behind the first-character prefilter.
+
+Builds configs with a growing number of levels and prunes a synthetic legal
+code where most lines are body text. Run with:
+
+    python -m benchmarks.bench_classifier
+"""
+
+import random
+import time
+
+from doc23 import Config, Gardener, LevelConfig
+from doc23.patterns import LineClassifier
+
+KEYWORDS = ["BOOK", "TITLE", "PART", "CHAPTER", "SECTION", "SUBSECTION", "ARTICLE", "CLAUSE", "ITEM", "POINT"]
+BODY = [
+    "The provisions of this code apply to every person within the territory.",
+    "Nothing in this section shall be construed to limit the powers of the court.",
+    "Any agreement to the contrary shall be void and of no effect.",
+    "The competent authority shall publish the decision within thirty days.",
+]
+
+
+def make_config(n_levels: int) -> Config:
+    levels = {}
+    parent = None
+    for keyword in KEYWORDS[:n_levels]:
+        name = keyword.lower()
+        levels[name] = LevelConfig(
+            pattern=rf"^{keyword}\s+(\w+)\.?\s*(.*)$",
+            name=name,
+            title_field="title",
+            description_field="description",
+            sections_field="sections",
+            paragraph_field="paragraphs",
+            parent=parent,
+        )
+        parent = name
+    return Config("code", "sections", "description", levels)
+
+
+def make_text(n_levels: int, n_lines: int = 40_000, heading_ratio: float = 0.1) -> str:
+    rng = random.Random(23)
+    lines = []
+    for i in range(n_lines):
+        if rng.random() < heading_ratio:
+            lines.append(f"{rng.choice(KEYWORDS[:n_levels])} {i}. Heading")
+        else:
+            lines.append(rng.choice(BODY))
+    return "\n".join(lines)
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    strategies = {
+        "sequential": dict(combine=False, prefilter=False),
+        "combined": dict(combine=True, prefilter=False),
+        "prefiltered": dict(combine=True, prefilter=True),
+    }
+    print(f"{'levels':>6}" + "".join(f"{name:>14}" for name in strategies) + f"{'speedup':>10}")
+    for n_levels in (1, 2, 4, 6, 8, 10):
+        text = make_text(n_levels)
+        timings = []
+        expected = None
+        for options in strategies.values():
+            gardener = Gardener(make_config(n_levels))
+            gardener.classifier = LineClassifier(gardener.classifier.levels, **options)
+            result = gardener.prune(text)
+            assert expected is None or result == expected
+            expected = result
+            timings.append(best_of(lambda: gardener.prune(text)))
+        print(
+            f"{n_levels:>6}" + "".join(f"{t * 1000:>12.1f}ms" for t in timings)
+            + f"{timings[0] / timings[-1]:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: memory held by dictionary trees vs. compact trees.
+
+Prunes a synthetic code with many short leaf articles and reports the memory
+retained by the result of `prune` and of `prune_compact`. Run with:
+
+    python -m benchmarks.bench_compact [n_articles]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from doc23 import Config, Gardener, LevelConfig
+
+
+def make_config() -> Config:
+    return Config(
+        root_name="code",
+        sections_field="sections",
+        description_field="description",
+        levels={
+            "chapter": LevelConfig(
+                pattern=r"^CHAPTER\s+(\w+)\.?\s*(.*)$",
+                name="chapter",
+                title_field="title",
+                description_field="description",
+                sections_field="articles",
+            ),
+            "article": LevelConfig(
+                pattern=r"^ARTICLE\s+(\d+)\.\s*(.*)$",
+                name="article",
+                title_field="number",
+                description_field="heading",
+                paragraph_field="paragraphs",
+                parent="chapter",
+            ),
+        },
+    )
+
+
+def make_text(n_articles: int) -> str:
+    lines = []
+    for i in range(n_articles):
+        if i % 100 == 0:
+            lines.append(f"CHAPTER {i // 100 + 1}. General provisions")
+        lines.append(f"ARTICLE {i + 1}. Scope")
+        lines.append("This article applies to every contract.")
+    return "\n".join(lines)
+
+
+def retained(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, size
+
+
+def main() -> None:
+    n_articles = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    text = make_text(n_articles)
+    gardener = Gardener(make_config())
+
+    tree, tree_time, tree_size = retained(lambda: gardener.prune(text))
+    compact, compact_time, compact_size = retained(lambda: gardener.prune_compact(text))
+    assert compact.to_dict() == tree
+
+    print(f"{n_articles} articles")
+    print(f"{'mode':>8} {'time':>9} {'retained':>12}")
+    print(f"{'dict':>8} {tree_time:>8.2f}s {tree_size / 1024 / 1024:>9.1f} MB")
+    print(f"{'compact':>8} {compact_time:>8.2f}s {compact_size / 1024 / 1024:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Regression benchmark: free text collected into descriptions must scale linearly.
+
+Prunes a document whose preamble and single section are long runs of unstructured
+lines, at 25k and 50k lines. Doubling the input should roughly double the time;
+the script exits with an error if it grows much faster (e.g. quadratic string
+concatenation). Run with:
+
+    python -m benchmarks.bench_description
+"""
+
+import sys
+import time
+
+from doc23 import Config, Gardener, LevelConfig
+
+LINE = "Whereas the parties have agreed to the terms set out in the following provisions."
+MAX_RATIO = 3.0
+
+
+def make_config() -> Config:
+    return Config(
+        root_name="document",
+        sections_field="sections",
+        description_field="description",
+        levels={
+            "title": LevelConfig(
+                pattern=r"^TITLE\s+(.+)$",
+                name="title",
+                title_field="title",
+                description_field="description",
+                sections_field="sections",
+            ),
+            "article": LevelConfig(
+                pattern=r"^ARTICLE\s+(\d+)\.\s*(.*)$",
+                name="article",
+                title_field="number",
+                description_field="text",
+                paragraph_field="paragraphs",
+                parent="title",
+            ),
+        },
+    )
+
+
+def make_text(n_lines: int) -> str:
+    half = n_lines // 2
+    return "\n".join([LINE] * half + ["TITLE I"] + [LINE] * half)
+
+
+def best_of(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    gardener = Gardener(make_config())
+    timings = {}
+    for n_lines in (25_000, 50_000):
+        text = make_text(n_lines)
+        timings[n_lines] = best_of(lambda: gardener.prune(text))
+        print(f"{n_lines:>7} lines: {timings[n_lines] * 1000:8.1f}ms")
+
+    ratio = timings[50_000] / timings[25_000]
+    print(f"scaling for 2x input: {ratio:.2f}x (limit {MAX_RATIO}x)")
+    return 0 if ratio < MAX_RATIO else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
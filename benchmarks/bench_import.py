@@ -0,0 +1,51 @@
+"""
+Benchmark: cost of `import doc23` in a fresh interpreter.
+
+Runs `python -X importtime -c "import doc23"` several times, reports the best
+cumulative import time of the package and its slowest dependencies, and lists
+the extractor backends that were imported (there should be none). Run with:
+
+    python -m benchmarks.bench_import [runs]
+"""
+
+import subprocess
+import sys
+
+# Third-party backends that should only be imported when a file type needs them
+BACKENDS = ("pdfplumber", "pdf2image", "docx2txt", "odf", "striprtf", "markdown", "magic", "pytesseract", "PIL")
+
+
+def import_times() -> dict:
+    """Map every module imported by `import doc23` to (cumulative time in microseconds, nesting depth)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import doc23"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # -X importtime indents each module by two spaces per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(cumulative), depth)
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    samples = [import_times() for _ in range(runs)]
+    best = min(samples, key=lambda times: times["doc23"][0])
+
+    print(f"import doc23: {best['doc23'][0] / 1000:.1f} ms (best of {runs})")
+    print("slowest imports made by doc23/__init__.py:")
+    direct = {name: t for name, (t, depth) in best.items() if depth == 1}
+    for name, t in sorted(direct.items(), key=lambda item: -item[1])[:8]:
+        print(f"  {name:<30} {t / 1000:>7.1f} ms")
+
+    loaded = [name for name in BACKENDS if name in best]
+    print(f"extractor backends imported: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: single-process prune vs. prune_parallel on one large document.
+
+Builds a synthetic code of the requested size and prunes it with `prune` and
+with `prune_parallel` for several worker counts. Run with:
+
+    python -m benchmarks.bench_parallel [size_mb] [max_workers]
+"""
+
+import os
+import sys
+import time
+
+from doc23 import Config, Gardener, LevelConfig
+
+
+def make_config() -> Config:
+    return Config(
+        root_name="code",
+        sections_field="sections",
+        description_field="description",
+        levels={
+            "title": LevelConfig(
+                pattern=r"^TITLE\s+(\w+)\.?\s*(.*)$",
+                name="title",
+                title_field="number",
+                description_field="heading",
+                sections_field="chapters",
+            ),
+            "chapter": LevelConfig(
+                pattern=r"^CHAPTER\s+(\w+)\.?\s*(.*)$",
+                name="chapter",
+                title_field="number",
+                description_field="heading",
+                sections_field="articles",
+                parent="title",
+            ),
+            "article": LevelConfig(
+                pattern=r"^ARTICLE\s+(\d+)\.\s*(.*)$",
+                name="article",
+                title_field="number",
+                description_field="heading",
+                paragraph_field="paragraphs",
+                parent="chapter",
+            ),
+        },
+    )
+
+
+def make_text(size_mb: float) -> str:
+    target = int(size_mb * 1024 * 1024)
+    lines = ["Preamble of the code.", "It is split into titles."]
+    size = 0
+    article = 0
+    while size < target:
+        if article % 500 == 0:
+            lines.append(f"TITLE {article // 500 + 1}. General provisions")
+        if article % 50 == 0:
+            lines.append(f"CHAPTER {article // 50 + 1}. Scope")
+        article += 1
+        lines.append(f"ARTICLE {article}. Definitions")
+        for _ in range(3):
+            lines.append("Every contract concluded under this code shall be made in writing.")
+        size += sum(len(line) + 1 for line in lines[-4:])
+    return "\n".join(lines)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 100
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    text = make_text(size_mb)
+    gardener = Gardener(make_config())
+
+    expected, baseline = timed(lambda: gardener.prune(text))
+    print(f"{len(text) / 1024 / 1024:.0f} MB, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'time':>9} {'speedup':>8}")
+    print(f"{'prune':>8} {baseline:>8.2f}s {1:>7.2f}x")
+
+    workers = 2
+    while workers <= max_workers:
+        tree, elapsed = timed(lambda: gardener.prune_parallel(text, workers=workers))
+        assert tree == expected
+        print(f"{workers:>8} {elapsed:>8.2f}s {baseline / elapsed:>7.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: pdfplumber vs. pdfium text extraction in PDFExtractor.
+
+Extracts the text layer of a corpus of PDFs with each engine and reports
+pages/s and how similar the pdfium text is to the pdfplumber text, page by
+page (difflib ratio over words). Without arguments, a synthetic corpus of
+text, mixed and scanned pages is generated. Run with:
+
+    python -m benchmarks.bench_pdf_engines [pdf_or_glob ...]
+"""
+
+import glob
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from typing import List
+
+from doc23.extractors.pdf import ENGINES, PDFExtractor
+
+WORDS = ("contract", "article", "shall", "party", "law", "the", "of", "under", "provisions", "agreement")
+
+
+def make_pdf(pages: int, seed: int) -> bytes:
+    """Build a PDF of text pages, pages with a text caption over a picture, and image-only pages."""
+    rng = random.Random(seed)
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+               b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+               b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"]
+    kids = []
+    for page in range(pages):
+        kind = page % 10
+        ops = []
+        if kind >= 7:
+            ops.append(b"q 600 0 0 400 0 0 cm /Im1 Do Q")
+        if kind != 9:
+            ops.append(b"BT /F1 10 Tf 12 TL 50 760 Td")
+            for _ in range(30 if kind < 7 else 8):
+                line = " ".join(rng.choice(WORDS) for _ in range(12)).encode()
+                ops.append(b"(%s) Tj T*" % line)
+            ops.append(b"ET")
+        else:
+            ops.append(b"q 600 0 0 800 0 0 cm /Im1 Do Q")
+        content = b"\n".join(ops)
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 600 800] /Resources "
+                       b"<< /Font << /F1 3 0 R >> /XObject << /Im1 4 0 R >> >> /Contents %d 0 R >>"
+                       % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def similarity(a: str, b: str) -> float:
+    """Similarity of two page texts, from 0 to 1, compared word by word."""
+    a_words, b_words = a.split(), b.split()
+    if not a_words and not b_words:
+        return 1.0
+    return SequenceMatcher(None, a_words, b_words, autojunk=False).ratio()
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        corpus = [path for pattern in sys.argv[1:] for path in sorted(glob.glob(pattern, recursive=True))]
+    else:
+        corpus = [make_pdf(pages, seed) for seed, pages in enumerate((5, 20, 50, 100))]
+
+    texts = {}
+    print(f"{len(corpus)} documents")
+    print(f"{'engine':>11} {'pages':>6} {'time':>8} {'pages/s':>9}")
+    for engine in ENGINES:
+        pages: List[str] = []
+        start = time.perf_counter()
+        for document in corpus:
+            extractor = PDFExtractor(document, engine=engine)
+            pages.extend(extractor._text_layer(extractor.file_obj))
+        elapsed = time.perf_counter() - start
+        texts[engine] = pages
+        print(f"{engine:>11} {len(pages):>6} {elapsed:>7.2f}s {len(pages) / elapsed:>9.1f}")
+
+    reference, other = texts["pdfplumber"], texts["pdfium"]
+    scores = [similarity(a, b) for a, b in zip(reference, other)]
+    print(f"pdfium vs pdfplumber similarity: mean {sum(scores) / len(scores):.3f}, min {min(scores):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: line scanning vs. whole-buffer scanning in Gardener.prune.
+
+Reports wall time and peak traced memory on a large synthetic legal code where
+the leaf level keeps no free text, so buffer mode never slices most body text.
+Run with:
+
+    python -m benchmarks.bench_scan [size_in_mb]
+"""
+
+import sys
+import time
+import tracemalloc
+
+from doc23 import Config, Gardener, LevelConfig
+
+BODY = "The competent authority shall publish the decision within thirty days of receipt."
+
+
+def make_config() -> Config:
+    return Config(
+        root_name="code",
+        sections_field="sections",
+        description_field="description",
+        levels={
+            "chapter": LevelConfig(
+                pattern=r"^CHAPTER\s+(\w+)\.?\s*(.*)$",
+                name="chapter",
+                title_field="title",
+                description_field="description",
+                sections_field="articles",
+            ),
+            "article": LevelConfig(
+                pattern=r"^ARTICLE\s+(\d+)\.\s*(.*)$",
+                name="article",
+                title_field="number",
+                sections_field="sections",
+                parent="chapter",
+            ),
+        },
+    )
+
+
+def make_text(size_mb: float) -> str:
+    lines = []
+    size = 0
+    article = 0
+    while size < size_mb * 1024 * 1024:
+        if article % 50 == 0:
+            lines.append(f"CHAPTER {article // 50 + 1}. General provisions")
+        article += 1
+        lines.append(f"ARTICLE {article}. Heading of article {article}")
+        lines.extend([BODY] * 8)
+        size += 9 * (len(BODY) + 1)
+    return "\n".join(lines)
+
+
+def measure(gardener: Gardener, text: str, scan: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = gardener.prune(text, scan=scan)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main() -> None:
+    size_mb = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    text = make_text(size_mb)
+    gardener = Gardener(make_config())
+
+    line_result, line_time, line_peak = measure(gardener, text, "lines")
+    buffer_result, buffer_time, buffer_peak = measure(gardener, text, "buffer")
+    assert line_result == buffer_result
+
+    print(f"input: {len(text) / 1024 / 1024:.1f} MB")
+    print(f"{'scan':>8} {'time':>10} {'peak memory':>14}")
+    print(f"{'lines':>8} {line_time:>9.2f}s {line_peak / 1024 / 1024:>11.1f} MB")
+    print(f"{'buffer':>8} {buffer_time:>9.2f}s {buffer_peak / 1024 / 1024:>11.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,11 @@ Basic usage:
 For text extraction only:
     >>> from doc23 import extract_text
     >>> text = extract_text('document.pdf', scan_or_image='auto')
+
+For many documents at once, in a pool of worker processes:
+    >>> from doc23 import process_many
+    >>> for result in process_many(paths, config, workers=8):
+    ...     print(result.file, result.tree if result.ok else result.error)
 """
 
 import logging
@@ -21,8 +26,11 @@ from pathlib import Path
 from io import BytesIO
 
 from doc23.allowed_types import AllowedTypes
+from doc23.batch import BatchResult, process_many
+from doc23.cache import ExtractionCache
+from doc23.compact import CompactTree
 from doc23.config_tree import Config, LevelConfig
-from doc23.core import Doc23, extract_text
+from doc23.core import Doc23, Doc23Processor, aextract_text, extract_text
 from doc23.exceptions import (
     Doc23Error, 
     FileTypeError, 
@@ -31,13 +39,18 @@ from doc23.exceptions import (
     OCRError, 
     ParsingError
 )
-from doc23.gardener import Gardener
+from doc23.gardener import Gardener, PruneHandler
 from doc23.logging import configure_logging, get_logger
 
 __all__ = [
     # Core classes
     "Doc23",
+    "Doc23Processor",
     "Gardener",
+    "PruneHandler",
+    "CompactTree",
+    "ExtractionCache",
+    "BatchResult",
     
     # Configuration
     "Config",
@@ -55,9 +68,8 @@ __all__ = [
     # Utilities
     "configure_logging",
     "extract_text",
+    "aextract_text",
+    "process_many",
 ]
 
 __version__ = "0.2.0"
-
-# Configure basic logging
-configure_logging()
@@ -0,0 +1,8 @@
+"""Allow `python -m doc23`, equivalent to the `doc23` command."""
+
+import sys
+
+from doc23.cli import main
+
+
+sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+Processing many documents in a pool of worker processes.
+
+`process_many` spreads type detection, extraction and pruning of a batch of
+documents over several processes, and yields one `BatchResult` per document.
+A document that fails does not stop the batch: its result carries the error.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from doc23.cache import ExtractionCache
+from doc23.config_tree import Config
+from doc23.core import Doc23Processor, _extract
+from doc23.exceptions import Doc23Error
+from doc23.inputs import FileInput
+
+if TYPE_CHECKING:
+    from doc23.compact import CompactTree
+
+
+class DocumentStats(NamedTuple):
+    """
+    Where the time went while processing one document.
+
+    Attributes:
+        pages: Number of pages, for documents that have pages (PDF), else None
+        extract_seconds: Time spent detecting the type and extracting the text,
+                         excluding OCR
+        ocr_seconds: Time spent running Tesseract
+        prune_seconds: Time spent structuring the text
+    """
+    pages: Optional[int]
+    extract_seconds: float
+    ocr_seconds: float
+    prune_seconds: float
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of processing one document of a batch.
+
+    Attributes:
+        index: Position of the document in the input
+        file: The document, as given in the input
+        tree: The structured document, or None if processing failed
+        error: The error that stopped processing, or None on success
+        stats: Timings and page count of the document
+    """
+    index: int
+    file: FileInput
+    tree: Optional[Union[Dict[str, Any], "CompactTree"]]
+    error: Optional[Doc23Error]
+    stats: Optional[DocumentStats] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the document was processed successfully."""
+        return self.error is None
+
+
+class _BatchOptions(NamedTuple):
+    """Settings shared by every document of a batch, shipped to the workers."""
+    config: Config
+    ocr_language: str
+    cache: Optional[ExtractionCache]
+    scan_or_image: Union[bool, str]
+    scan: str
+    compact: bool
+    spans: bool
+    pdf_engine: str
+
+
+def process_many(
+    files: Iterable[FileInput],
+    config: Config,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    chunksize: int = 1,
+    scan_or_image: Union[bool, str] = "auto",
+    scan: str = "lines",
+    compact: bool = False,
+    spans: bool = False,
+    ocr_language: str = 'eng',
+    cache: Optional[ExtractionCache] = None,
+    executor: Optional[Executor] = None,
+    pdf_engine: str = "pdfplumber"
+) -> Iterator[BatchResult]:
+    """
+    Process many documents in parallel, like `Doc23Processor(config).process` on each.
+
+    Documents are sent to the workers in chunks of `chunksize`, which amortizes
+    the cost of inter-process communication when documents are small. Input is
+    consumed lazily: only a few chunks per worker are in flight at a time, so
+    `files` can be a generator over millions of paths.
+
+        >>> for result in process_many(paths, config, workers=32, ordered=False):
+        ...     if result.ok:
+        ...         store(result.file, result.tree)
+
+    Any exception raised while processing a document is reported in its result,
+    as a Doc23Error (exceptions of other types are wrapped in one). The crash of
+    a worker process still aborts the batch.
+
+    Args:
+        files: Paths or in-memory data (bytes, bytearray) of the documents;
+               streams cannot be sent to other processes
+        config: Configuration for document parsing
+        workers: Number of worker processes (defaults to the CPU count); with 1
+                 and no executor, documents are processed in this process
+        ordered: If True (default), yield results in input order; otherwise as
+                 soon as they complete
+        chunksize: Number of documents sent to a worker at once
+        scan_or_image: Controls OCR behavior, 'auto' by default, see Doc23.extract_text()
+        scan: 'lines' (default) or 'buffer', see Doc23.prune()
+        compact: Return CompactTrees, see Doc23.prune()
+        spans: Record the source span (and PDF pages) of every node, see Doc23.prune()
+        ocr_language: The language to use for OCR, default is English ('eng')
+        cache: Optional on-disk cache of extracted text, shared by the workers
+        executor: An existing executor to run the chunks on, instead of a process
+                  pool created for this call
+        pdf_engine: 'pdfplumber' (default) or 'pdfium', see PDFExtractor
+
+    Yields:
+        BatchResult: The outcome of each document
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if scan not in ("lines", "buffer"):
+        raise ValueError("scan must be 'lines' or 'buffer'")
+    workers = workers or os.cpu_count() or 1
+    options = _BatchOptions(config, ocr_language, cache, scan_or_image, scan, compact, spans, pdf_engine)
+    chunks = _chunks(enumerate(files), chunksize)
+
+    if executor is not None:
+        yield from _run(executor, chunks, options, workers, ordered)
+    elif workers == 1:
+        for chunk in chunks:
+            yield from _results(chunk, _process_chunk(options, [file for _, file in chunk]))
+    else:
+        # Imported here: multiprocessing is slow to import and rarely needed
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from _run(pool, chunks, options, workers, ordered)
+
+
+def _run(
+    executor: Executor,
+    chunks: Iterator[List[Tuple[int, FileInput]]],
+    options: _BatchOptions,
+    workers: int,
+    ordered: bool
+) -> Iterator[BatchResult]:
+    """Submit chunks to the executor, keeping a bounded number in flight, and yield their results."""
+    pending: Dict[Future, List[Tuple[int, FileInput]]] = {}
+    # Results of chunks completed ahead of their turn, by the index of their first document
+    done_early: Dict[int, List[BatchResult]] = {}
+    next_index = 0
+
+    def submit(count: int) -> None:
+        for chunk in islice(chunks, max(count, 0)):
+            future = executor.submit(_process_chunk, options, [file for _, file in chunk])
+            pending[future] = chunk
+
+    limit = workers * 2
+    submit(limit)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        ready: List[BatchResult] = []
+        for future in done:
+            chunk = pending.pop(future)
+            results = list(_results(chunk, future.result()))
+            if not ordered:
+                ready.extend(results)
+            else:
+                done_early[chunk[0][0]] = results
+
+        while next_index in done_early:
+            results = done_early.pop(next_index)
+            next_index = results[-1].index + 1
+            ready.extend(results)
+
+        # Chunks completed ahead of their turn still count against the limit, so
+        # a slow document cannot make the results buffered behind it pile up
+        submit(limit - len(pending) - len(done_early))
+        yield from ready
+
+
+def _chunks(items: Iterator[Tuple[int, FileInput]], size: int) -> Iterator[List[Tuple[int, FileInput]]]:
+    """Group numbered documents into lists of `size` (the last one may be shorter)."""
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _results(
+    chunk: List[Tuple[int, FileInput]],
+    outcomes: List[Tuple[Optional[Union[Dict[str, Any], "CompactTree"]], Optional[Doc23Error], DocumentStats]]
+) -> Iterator[BatchResult]:
+    """Pair the outcomes of a chunk with the documents they belong to."""
+    for (index, file), (tree, error, stats) in zip(chunk, outcomes):
+        yield BatchResult(index, file, tree, error, stats)
+
+
+def _process_chunk(
+    options: _BatchOptions,
+    files: List[FileInput]
+) -> List[Tuple[Optional[Union[Dict[str, Any], "CompactTree"]], Optional[Doc23Error], DocumentStats]]:
+    """
+    Process a chunk of documents in a worker process.
+
+    Args:
+        options: The settings of the batch
+        files: The documents of the chunk
+
+    Returns:
+        List[Tuple[Optional[Union[Dict[str, Any], "CompactTree"]], Optional[Doc23Error], DocumentStats]]:
+        The tree or the error of each document, and its statistics
+    """
+    # The worker's compiled-config cache makes this cheap after the first chunk
+    processor = Doc23Processor(options.config, options.ocr_language, options.cache, options.pdf_engine)
+    prune = processor.gardener.prune_compact if options.compact else processor.gardener.prune
+    outcomes = []
+    for file in files:
+        tree = error = page_starts = pruning = None
+        start = time.perf_counter()
+        ocr_start = _ocr_seconds()
+        try:
+            file_type = processor.detect_type(file)
+            text, page_starts = _extract(
+                file, file_type, options.scan_or_image, options.ocr_language, options.cache,
+                options.pdf_engine
+            )
+            pruning = time.perf_counter()
+            tree = prune(text, scan=options.scan, spans=options.spans, page_starts=page_starts)
+        except Doc23Error as e:
+            error = e
+        except Exception as e:
+            error = Doc23Error(f"{type(e).__name__}: {e}")
+
+        end = time.perf_counter()
+        pruning = pruning or end
+        ocr = _ocr_seconds() - ocr_start
+        stats = DocumentStats(
+            len(page_starts) if page_starts else None, pruning - start - ocr, ocr, end - pruning
+        )
+        outcomes.append((tree, error, stats))
+    return outcomes
+
+
+def _ocr_seconds() -> float:
+    """Time this process has spent in Tesseract so far."""
+    # The OCR module is only loaded once a document needed OCR
+    module = sys.modules.get("doc23.ocr.processor")
+    return module.ocr_seconds() if module is not None else 0.0
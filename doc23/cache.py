@@ -0,0 +1,231 @@
+"""
+Persistent, content-addressed cache of extracted text.
+
+Extraction, and OCR above all, is by far the slowest step of processing a
+document. `ExtractionCache` stores extracted text on disk under a key derived
+from the file content and every setting that affects extraction, so the same
+document is never extracted twice with the same settings, across runs and
+processes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from doc23.inputs import BUFFER_TYPES, FileInput
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the entries changes
+CACHE_FORMAT = "1"
+
+_SUFFIX = ".z"
+
+# Eviction shrinks the cache to this fraction of max_size, so that one sweep
+# of the directory makes room for many writes
+_LOW_WATER_MARK = 0.9
+
+
+class ExtractionCache:
+    """
+    On-disk cache of extracted text, keyed by file content and extraction settings.
+
+    Entries are zlib-compressed JSON files spread over 256 subdirectories. They are
+    written to a temporary file and renamed into place, so concurrent readers never
+    see a partial entry. When the cache grows beyond `max_size` bytes, the least
+    recently used entries are removed until it is back under 90% of `max_size`.
+
+        >>> cache = ExtractionCache("~/.cache/doc23", max_size=2 * 1024**3)
+        >>> Doc23("scan.pdf", config, cache=cache).prune()
+
+    Attributes:
+        directory: The cache directory
+        max_size: The total size of the entries, in bytes, above which old entries
+                  are evicted (None for no limit)
+    """
+
+    def __init__(self, directory: Union[str, Path], max_size: Optional[int] = 1024 ** 3):
+        """
+        Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory: The cache directory
+            max_size: The size limit in bytes (None for no limit), default 1 GiB
+        """
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Sent to worker processes without the lock; the size is recounted there
+        return {"directory": self.directory, "max_size": self.max_size}
+
+    def __setstate__(self, state: dict) -> None:
+        self.directory = state["directory"]
+        self.max_size = state["max_size"]
+        self._size = None
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        file: FileInput,
+        file_type: str,
+        extractor: str,
+        scan_or_image: Union[bool, str],
+        ocr_language: str
+    ) -> str:
+        """
+        Compute the cache key of an extraction.
+
+        Args:
+            file: Path to the file, its content, or a seekable file-like object
+            file_type: The file type
+            extractor: Name and version of the extractor
+            scan_or_image: The OCR mode
+            ocr_language: The OCR language
+
+        Returns:
+            str: A hex digest identifying the extraction
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(
+            [CACHE_FORMAT, file_type, extractor, scan_or_image, ocr_language]
+        ).encode("utf-8"))
+        digest.update(b"\0")
+
+        if isinstance(file, BUFFER_TYPES):
+            digest.update(file)
+        elif isinstance(file, (str, Path)):
+            with open(file, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+        else:
+            file.seek(0)
+            for block in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(block)
+            file.seek(0)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[List[int]]]]:
+        """
+        Look up an entry, marking it as recently used.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The extracted text and page start offsets, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = json.loads(zlib.decompress(f.read()).decode("utf-8"))
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning(f"Discarding unreadable extraction cache entry {path}: {e}")
+            self._remove(path)
+            return None
+        return data["text"], data["page_starts"]
+
+    def put(self, key: str, text: str, page_starts: Optional[List[int]] = None) -> None:
+        """
+        Store an entry, evicting old entries if the cache grows too large.
+
+        Failing to write is logged and otherwise ignored: the cache never makes
+        an extraction fail.
+
+        Args:
+            key: The cache key
+            text: The extracted text
+            page_starts: The page start offsets, if any
+        """
+        path = self._path(key)
+        payload = zlib.compress(
+            json.dumps({"text": text, "page_starts": page_starts}).encode("utf-8")
+        )
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # An entry written again for the same key replaces the old one
+            try:
+                replaced = path.stat().st_size
+            except FileNotFoundError:
+                replaced = 0
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp, path)
+            except BaseException:
+                self._remove(Path(tmp))
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry {path}: {e}")
+            return
+
+        with self._lock:
+            if self._size is not None:
+                self._size += len(payload) - replaced
+        if self.max_size is not None and self.size() > self.max_size:
+            self.evict()
+
+    def size(self) -> int:
+        """Return the total size of the entries in bytes."""
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            return self._size
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in 90% of `max_size`."""
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+            target = None if self.max_size is None else int(self.max_size * _LOW_WATER_MARK)
+            for path, size, _ in entries:
+                if target is None or total <= target:
+                    break
+                if self._remove(path):
+                    total -= size
+            self._size = total
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            for path, _, _ in self._entries():
+                self._remove(path)
+            self._size = 0
+
+    def _path(self, key: str) -> Path:
+        """Return the file an entry is stored in."""
+        return self.directory / key[:2] / (key + _SUFFIX)
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        """List (path, size, last use) for every entry."""
+        entries = []
+        for path in self.directory.glob(f"*/*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        """Delete a file, returning whether it was there."""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,201 @@
+"""
+Command-line interface for bulk ingestion.
+
+    $ doc23 config.yaml ./documents --workers 16 --output trees.jsonl
+
+Every document found in the given directories, globs or files is processed in
+parallel with `process_many`, and written as one JSON line:
+`{"file": ..., "tree": {...}}` on success, `{"file": ..., "error": {...}}` on
+failure. Throughput statistics are printed to stderr at the end.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TextIO
+
+from doc23.batch import BatchResult, process_many
+from doc23.cache import ExtractionCache
+from doc23.config_tree import Config
+from doc23.core import KNOWN_EXTENSIONS
+
+
+OCR_MODES = {"auto": "auto", "always": True, "never": False}
+
+# ENGINES of doc23.extractors.pdf, not imported from there: that module loads pdfplumber
+PDF_ENGINES = ("pdfplumber", "pdfium")
+
+
+def load_config(path: str) -> Config:
+    """
+    Load a Config from a JSON or YAML file (see Config.from_dict).
+
+    Args:
+        path: Path to the file; '.json' files are read as JSON, anything else as YAML
+
+    Returns:
+        Config: The configuration
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file does not describe a valid configuration; the
+                    message names the file
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            try:
+                data = json.load(f)
+            except ValueError as e:
+                raise ValueError(f"{path}: invalid JSON: {e}") from e
+        else:
+            import yaml
+
+            try:
+                data = yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise ValueError(f"{path}: invalid YAML: {e}") from e
+    try:
+        return Config.from_dict(data)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"{path}: {e}") from e
+
+
+def find_documents(sources: Sequence[str], recursive: bool = False) -> Iterator[Path]:
+    """
+    Yield the documents named by files, directories and glob patterns.
+
+    Directories yield the files with a supported extension, in name order.
+    Files and glob matches are yielded whatever their extension.
+
+    Args:
+        sources: Files, directories or glob patterns
+        recursive: Also look into subdirectories of directories
+
+    Yields:
+        Path: Each document
+    """
+    for source in sources:
+        if glob.has_magic(source):
+            for match in sorted(glob.iglob(source, recursive=True)):
+                if os.path.isfile(match):
+                    yield Path(match)
+            continue
+
+        path = Path(source)
+        if path.is_dir():
+            files = path.rglob("*") if recursive else path.iterdir()
+            for file in sorted(files):
+                if file.is_file() and file.suffix[1:].lower() in KNOWN_EXTENSIONS:
+                    yield file
+        else:
+            # Missing files are reported as failed documents
+            yield path
+
+
+def _record(result: BatchResult) -> Dict[str, Any]:
+    """The JSON line of a document."""
+    record: Dict[str, Any] = {"file": str(result.file)}
+    if result.ok:
+        record["tree"] = result.tree
+    else:
+        record["error"] = {"type": type(result.error).__name__, "message": str(result.error)}
+    return record
+
+
+def _print_stats(results: List[BatchResult], elapsed: float, out: TextIO) -> None:
+    """Print throughput statistics of a run."""
+    failed = sum(1 for result in results if not result.ok)
+    stats = [result.stats for result in results if result.stats is not None]
+    pages = sum(s.pages or 0 for s in stats)
+    rate = 1 / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{len(results)} documents ({failed} failed), {pages} pages in {elapsed:.2f}s: "
+        f"{len(results) * rate:.2f} docs/s, {pages * rate:.2f} pages/s",
+        file=out
+    )
+    print(
+        f"time in workers: extraction {sum(s.extract_seconds for s in stats):.2f}s, "
+        f"OCR {sum(s.ocr_seconds for s in stats):.2f}s, "
+        f"prune {sum(s.prune_seconds for s in stats):.2f}s",
+        file=out
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the `doc23` command."""
+    parser = argparse.ArgumentParser(
+        prog="doc23",
+        description="Extract and structure documents in parallel, writing one JSON line per document."
+    )
+    parser.add_argument("config", help="configuration file (JSON, or YAML)")
+    parser.add_argument("sources", nargs="+", help="documents, directories or glob patterns")
+    parser.add_argument("-o", "--output", help="JSONL file to write (default: stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=1,
+                        help="documents sent to a worker at once (default: 1)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="look into subdirectories of directories")
+    parser.add_argument("--ordered", action="store_true",
+                        help="write documents in input order instead of as they complete")
+    parser.add_argument("--ocr", choices=sorted(OCR_MODES), default="auto",
+                        help="when to run OCR (default: auto)")
+    parser.add_argument("--ocr-language", default="eng", help="Tesseract language (default: eng)")
+    parser.add_argument("--pdf-engine", choices=PDF_ENGINES, default="pdfplumber",
+                        help="library that reads the text layer of PDFs (default: pdfplumber)")
+    parser.add_argument("--cache", metavar="DIR", help="directory of an extraction cache")
+    parser.add_argument("--spans", action="store_true", help="record the source span of every node")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not print statistics")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the `doc23` command.
+
+    Args:
+        argv: The command-line arguments (sys.argv[1:] if None)
+
+    Returns:
+        int: The exit status: 0 if every document succeeded, 1 otherwise
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+    try:
+        config = load_config(args.config)
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot load configuration: {e}")
+
+    cache = ExtractionCache(args.cache) if args.cache else None
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    results: List[BatchResult] = []
+    start = time.perf_counter()
+    try:
+        for result in process_many(
+            find_documents(args.sources, args.recursive), config,
+            workers=args.workers, ordered=args.ordered, chunksize=args.chunksize,
+            scan_or_image=OCR_MODES[args.ocr], spans=args.spans,
+            ocr_language=args.ocr_language, cache=cache, pdf_engine=args.pdf_engine
+        ):
+            out.write(json.dumps(_record(result), ensure_ascii=False) + "\n")
+            # Keep the statistics only: trees can be large
+            results.append(result._replace(tree=None))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if not args.quiet:
+        _print_stats(results, time.perf_counter() - start, sys.stderr)
+    return 0 if all(result.ok for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
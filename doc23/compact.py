@@ -0,0 +1,401 @@
+"""
+Compact, array-backed representation of pruned documents.
+
+`Gardener.prune` returns nested dictionaries, which cost several hundred bytes per
+node. `Gardener.prune_compact` instead records the tree in a handful of parallel
+arrays (level, parent, first child, next sibling and free-text range per node)
+and exposes it through read-only mapping views. The dictionary form is only built
+on demand with `to_dict()`.
+"""
+
+from array import array
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from doc23.config_tree import Config
+from doc23.gardener import Gardener, LevelPlan, PruneHandler, page_range
+
+
+class CompactTree(Mapping):
+    """
+    A pruned document stored as parallel arrays.
+
+    Node 0 is the root; every other node is stored in document order. The tree
+    itself is a mapping view of the root node, so it can be read like the
+    dictionary `Gardener.prune` returns:
+
+        >>> tree = gardener.prune_compact(text)
+        >>> tree["sections"][0]["title"]
+
+    Attributes:
+        levels: Rank of each node's level (-1 for the root)
+        parents: Index of each node's parent (-1 for the root)
+        first_child: Index of each node's first child, or -1
+        next_sibling: Index of each node's next sibling, or -1
+        text_start: Start of each node's free text in `lines`
+        text_end: End of each node's free text in `lines`
+        titles: Title captured from each node's heading, or None
+        tails: Description captured from each node's heading, or None
+        lines: Free-text lines of all nodes, in document order
+        span_start: Start offset of each node in the source text, or None when
+                    the document was pruned without spans
+        span_end: End offset of each node in the source text, or None
+        page_starts: Offsets where each page of the source text starts, or None
+    """
+
+    def __init__(
+        self,
+        cfg: Config,
+        plans: Dict[str, LevelPlan],
+        spans: bool = False,
+        page_starts: Optional[Sequence[int]] = None
+    ):
+        """
+        Initialize an empty tree holding only the root node.
+
+        Args:
+            cfg: The configuration the document was pruned with
+            plans: The Gardener's level plans, in rank order
+            spans: Record the source span of every node
+            page_starts: Offsets where each page of the source text starts
+        """
+        self.cfg = cfg
+        self.plans: Tuple[LevelPlan, ...] = tuple(plans.values())
+        self.levels = array("h", [-1])
+        self.parents = array("i", [-1])
+        self.first_child = array("i", [-1])
+        self.next_sibling = array("i", [-1])
+        self.text_start = array("i", [0])
+        self.text_end = array("i", [0])
+        self.titles: List[Optional[str]] = [None]
+        self.tails: List[Optional[str]] = [None]
+        self.lines: List[str] = []
+        self.span_start: Optional[array] = array("q", [0]) if spans else None
+        self.span_end: Optional[array] = array("q", [0]) if spans else None
+        self.page_starts = page_starts
+
+    @property
+    def root(self) -> "CompactNode":
+        """Mapping view of the root node."""
+        return CompactNode(self, 0)
+
+    def node(self, index: int) -> "CompactNode":
+        """
+        Return a mapping view of a node.
+
+        Args:
+            index: The node index (0 is the root)
+
+        Returns:
+            CompactNode: A read-only view of the node
+        """
+        if not 0 <= index < len(self.levels):
+            raise IndexError(f"node index out of range: {index}")
+        return CompactNode(self, index)
+
+    def children(self, index: int) -> Iterator[int]:
+        """
+        Iterate over the indices of a node's children, in document order.
+
+        Args:
+            index: The node index
+
+        Returns:
+            Iterator[int]: The child indices
+        """
+        child = self.first_child[index]
+        while child >= 0:
+            yield child
+            child = self.next_sibling[child]
+
+    def span(self, index: int) -> Tuple[int, int]:
+        """
+        Return the (start, end) offsets a node covers in the source text.
+
+        Args:
+            index: The node index (0 is the root, which covers the whole text)
+
+        Returns:
+            Tuple[int, int]: The start and end offsets
+
+        Raises:
+            ValueError: If the document was pruned without spans
+        """
+        if self.span_start is None or self.span_end is None:
+            raise ValueError("The document was pruned without spans")
+        return self.span_start[index], self.span_end[index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Materialize the whole document as the dictionary `Gardener.prune` returns.
+
+        Returns:
+            Dict[str, Any]: The nested dictionary tree
+        """
+        return self._build(0, self.to_dict_node)
+
+    def to_dict_node(self, index: int) -> Dict[str, Any]:
+        """
+        Materialize a single node (and its descendants) as a dictionary.
+
+        Args:
+            index: The node index
+
+        Returns:
+            Dict[str, Any]: The node as `Gardener.prune` would have built it
+        """
+        return self._build(index, self.to_dict_node)
+
+    def _build(self, index: int, child_value) -> Dict[str, Any]:
+        """
+        Assemble the fields of a node.
+
+        Args:
+            index: The node index
+            child_value: Called with a child index to produce the value stored for it
+
+        Returns:
+            Dict[str, Any]: The node's fields
+        """
+        lines = self.lines[self.text_start[index]:self.text_end[index]]
+
+        if index == 0:
+            return {
+                "document_name": self.cfg.root_name,
+                self.cfg.description_field: " ".join(lines),
+                self.cfg.sections_field: [child_value(child) for child in self.children(0)],
+            }
+
+        plan = self.plans[self.levels[index]]
+        node: Dict[str, Any] = {"type": plan.name}
+        if plan.title_field:
+            node[plan.title_field] = self.titles[index]
+        if plan.description_field is not None:
+            tail = self.tails[index]
+            if lines and not plan.text_is_paragraph:
+                tail = " ".join([tail, *lines]) if tail else " ".join(lines)
+            node[plan.description_field] = tail
+        if plan.paragraph_field is not None:
+            node[plan.paragraph_field] = lines if plan.text_is_paragraph else []
+        if plan.sections_field is not None:
+            node[plan.sections_field] = []
+
+        for child in self.children(index):
+            field = self.plans[self.levels[child]].insert_field[plan.rank]
+            node.setdefault(field, []).append(child_value(child))
+        if self.span_start is not None:
+            start, end = self.span(index)
+            node["span"] = (start, end)
+            if self.page_starts:
+                node["pages"] = page_range(self.page_starts, start, end)
+        return node
+
+    def _field_names(self, index: int) -> List[str]:
+        """
+        List the fields of a node, in the order `_build` creates them.
+
+        Args:
+            index: The node index
+
+        Returns:
+            List[str]: The field names
+        """
+        if index == 0:
+            names = ["document_name"]
+            candidates: List[Optional[str]] = [self.cfg.description_field, self.cfg.sections_field]
+        else:
+            plan = self.plans[self.levels[index]]
+            names = ["type"]
+            candidates = [
+                plan.title_field or None, plan.description_field,
+                plan.paragraph_field, plan.sections_field,
+            ]
+            candidates.extend(self.plans[self.levels[child]].insert_field[plan.rank]
+                              for child in self.children(index))
+            if self.span_start is not None:
+                candidates.append("span")
+                if self.page_starts:
+                    candidates.append("pages")
+        for name in candidates:
+            if name is not None and name not in names:
+                names.append(name)
+        return names
+
+    def _field(self, index: int, key: str, child_value) -> Any:
+        """
+        Compute a single field of a node, without assembling the others.
+
+        Args:
+            index: The node index
+            key: The field name
+            child_value: Called with a child index to produce the value stored for it
+
+        Returns:
+            Any: The value `_build` would store under `key`
+
+        Raises:
+            KeyError: If the node has no such field
+        """
+        cfg = self.cfg
+        if index == 0:
+            if key == cfg.sections_field:
+                return [child_value(child) for child in self.children(0)]
+            if key == cfg.description_field:
+                return " ".join(self.lines[self.text_start[0]:self.text_end[0]])
+            if key == "document_name":
+                return cfg.root_name
+            raise KeyError(key)
+
+        if self.span_start is not None:
+            if key == "span":
+                return self.span(index)
+            if key == "pages" and self.page_starts:
+                return page_range(self.page_starts, *self.span(index))
+
+        plan = self.plans[self.levels[index]]
+        value: Any = None
+        found = True
+        if key == plan.sections_field:
+            value = []
+        elif key == plan.paragraph_field:
+            lines = self.lines[self.text_start[index]:self.text_end[index]]
+            value = lines if plan.text_is_paragraph else []
+        elif key == plan.description_field:
+            lines = self.lines[self.text_start[index]:self.text_end[index]]
+            value = self.tails[index]
+            if lines and not plan.text_is_paragraph:
+                value = " ".join([value, *lines]) if value else " ".join(lines)
+        elif plan.title_field and key == plan.title_field:
+            value = self.titles[index]
+        elif key == "type":
+            value = plan.name
+        else:
+            found = False
+
+        children = [child_value(child) for child in self.children(index)
+                    if self.plans[self.levels[child]].insert_field[plan.rank] == key]
+        if children:
+            return value + children if found else children
+        if not found:
+            raise KeyError(key)
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        return self.root[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.root)
+
+    def __len__(self) -> int:
+        return len(self.root)
+
+    def __repr__(self) -> str:
+        return f"CompactTree(root_name={self.cfg.root_name!r}, nodes={len(self.levels) - 1})"
+
+
+class CompactNode(Mapping):
+    """
+    Read-only mapping view of one node of a CompactTree.
+
+    Each access computes only the requested field, straight from the tree's
+    arrays; nested nodes are returned as views too.
+    """
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree: CompactTree, index: int):
+        self.tree = tree
+        self.index = index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize this node and its descendants as dictionaries."""
+        return self.tree.to_dict_node(self.index)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.tree._field(self.index, key, self.tree.node)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.tree._field_names(self.index))
+
+    def __len__(self) -> int:
+        return len(self.tree._field_names(self.index))
+
+    def __repr__(self) -> str:
+        return f"CompactNode({self.to_dict()!r})"
+
+
+class CompactBuilder(PruneHandler):
+    """
+    Event handler that records a document into a CompactTree.
+
+    Attributes:
+        tree: The tree being built
+    """
+
+    def __init__(
+        self,
+        gardener: Gardener,
+        spans: bool = False,
+        page_starts: Optional[Sequence[int]] = None
+    ):
+        """
+        Initialize the builder with an empty tree.
+
+        Args:
+            gardener: The Gardener whose configuration shapes the tree
+            spans: Record the source span of every node from the `offset` of its events
+            page_starts: Offsets where each page of the source text starts
+        """
+        self._plans = gardener.plans
+        self.tree = CompactTree(gardener.cfg, gardener.plans, spans, page_starts)
+        # Indices of the open nodes (the root first) and of their latest child
+        self._stack: List[int] = [0]
+        self._last_child: List[int] = [-1]
+
+    def start_node(self, level: str, fields: Dict[str, Any]) -> None:
+        """Append the node to the arrays and link it to its parent."""
+        plan = self._plans[level]
+        tree = self.tree
+        index = len(tree.levels)
+        parent = self._stack[-1]
+
+        tree.levels.append(plan.rank)
+        tree.parents.append(parent)
+        tree.first_child.append(-1)
+        tree.next_sibling.append(-1)
+        # A node only receives text before its first child, so its lines are contiguous
+        tree.text_start.append(len(tree.lines))
+        tree.text_end.append(len(tree.lines))
+        tree.titles.append(fields[plan.title_field] if plan.title_field else None)
+        tree.tails.append(fields[plan.description_field] if plan.description_field is not None else None)
+        if tree.span_start is not None and tree.span_end is not None:
+            tree.span_start.append(self.offset)
+            tree.span_end.append(self.offset)
+
+        last = self._last_child[-1]
+        if last < 0:
+            tree.first_child[parent] = index
+        else:
+            tree.next_sibling[last] = index
+        self._last_child[-1] = index
+
+        self._stack.append(index)
+        self._last_child.append(-1)
+
+    def text(self, line: str) -> None:
+        """Record the line as free text of the innermost open node (or the root)."""
+        lines = self.tree.lines
+        lines.append(line)
+        self.tree.text_end[self._stack[-1]] = len(lines)
+
+    def end_node(self, level: str) -> None:
+        """Close the innermost open node."""
+        index = self._stack.pop()
+        self._last_child.pop()
+        if self.tree.span_end is not None:
+            self.tree.span_end[index] = self.offset
+
+    def end_document(self) -> None:
+        """Let the root span the whole text."""
+        if self.tree.span_end is not None:
+            self.tree.span_end[0] = self.offset
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 import re
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from typing_extensions import Self
 
+from doc23.patterns import compile_pattern
+
 
 @dataclass
 class LevelConfig:
@@ -45,7 +47,7 @@ class LevelConfig:
 
         # Validate regex pattern and group count
         try:
-            compiled = re.compile(self.pattern)
+            compiled = compile_pattern(self.pattern)
             group_count = compiled.groups
             if self.title_field and group_count < 1:
                 raise ValueError(f"Pattern for level '{self.name}' must have at least one group for title.")
@@ -115,6 +117,34 @@ class Config:
             if len(set(non_null_fields)) < len(non_null_fields):
                 raise ValueError(f"Level '{name}' has conflicting field names (e.g., same name used twice).")
 
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """Return a hashable summary of every setting that affects parsing.
+
+        Two configs with the same fingerprint produce the same trees, so it can key
+        caches of compiled configs.
+
+        Returns:
+            Tuple[Any, ...]: The root fields, then each level's settings in order.
+        """
+        return (
+            self.root_name,
+            self.sections_field,
+            self.description_field,
+            tuple(
+                (
+                    name,
+                    level.pattern,
+                    level.title_field,
+                    level.description_field,
+                    level.sections_field,
+                    level.paragraph_field,
+                    level.parent,
+                    level.is_leaf,
+                )
+                for name, level in self.levels.items()
+            ),
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Self:
         """Creates a Config instance from a dictionary structure."""
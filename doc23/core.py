@@ -4,32 +4,65 @@ Core functionality of the doc23 library.
 This module contains the main Doc23 class and utility functions for working with documents.
 """
 
+import importlib
 import logging
-from typing import Any, Dict, Optional, Union
+from concurrent.futures import Executor
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-from io import BytesIO
-
-import magic as python_magic
 
 from doc23.allowed_types import AllowedTypes
+from doc23.cache import ExtractionCache
 from doc23.config_tree import Config
 from doc23.exceptions import Doc23Error, FileTypeError, ExtractionError
-from doc23.extractors import (
-    PDFExtractor,
-    DocxExtractor,
-    TextExtractor,
-    ImageExtractor,
-    ODTExtractor,
-    RTFExtractor,
-    MarkdownExtractor,
-)
 from doc23.gardener import Gardener
+from doc23.inputs import BUFFER_TYPES, FileInput, open_input
+from doc23.sniffing import sniff_file_type
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from doc23.compact import CompactTree
 
 
 logger = logging.getLogger(__name__)
 
+# File types recognized from the file extension alone
+KNOWN_EXTENSIONS = ['pdf', 'docx', 'odt', 'rtf', 'txt', 'md', 'jpg', 'jpeg', 'png', 'tiff', 'bmp', 'gif']
+
+IMAGE_TYPES = ["jpg", "jpeg", "png", "tiff", "bmp", "gif"]
+
+# File types whose extractor gives the same text whatever scan_or_image is
+MODE_INDEPENDENT_TYPES = ["txt", "md", "docx", "odt", "rtf", *IMAGE_TYPES]
+
+# Extractor class of each file type, as (module, class name). Extractor modules pull
+# in heavy third-party backends, so each is only imported when first needed.
+EXTRACTORS = {
+    "pdf": ("doc23.extractors.pdf", "PDFExtractor"),
+    "docx": ("doc23.extractors.docx", "DocxExtractor"),
+    "odt": ("doc23.extractors.odt", "ODTExtractor"),
+    "rtf": ("doc23.extractors.rtf", "RTFExtractor"),
+    "txt": ("doc23.extractors.text", "TextExtractor"),
+    "md": ("doc23.extractors.markdown", "MarkdownExtractor"),
+    **{image_type: ("doc23.extractors.image", "ImageExtractor") for image_type in IMAGE_TYPES},
+}
+
+MIME_TO_EXTENSION = {
+    'application/pdf': 'pdf',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'application/vnd.oasis.opendocument.text': 'odt',
+    'text/rtf': 'rtf',
+    'text/plain': 'txt',
+    'text/markdown': 'md',
+    'image/jpeg': 'jpg',
+    'image/png': 'png',
+    'image/tiff': 'tiff',
+    'image/bmp': 'bmp',
+    'image/gif': 'gif'
+}
 
-def extract_text(file: Union[str, Path, bytes, BytesIO], scan_or_image: Union[bool, str] = False) -> str:
+
+def extract_text(file: FileInput, scan_or_image: Union[bool, str] = False) -> str:
     """
     Extract raw text from a file.
     
@@ -54,25 +87,346 @@ def extract_text(file: Union[str, Path, bytes, BytesIO], scan_or_image: Union[bo
     return doc._extract_text(scan_or_image)
 
 
+async def aextract_text(
+    file: FileInput,
+    scan_or_image: Union[bool, str] = False,
+    executor: Optional[Executor] = None,
+    limit: Union[int, "asyncio.Semaphore", None] = None
+) -> str:
+    """
+    Extract raw text from a file without blocking the event loop.
+    
+    Extraction runs in `executor` and Tesseract runs as asyncio subprocesses, so
+    an asyncio service can keep many extractions in flight. Cancelling the call
+    kills the Tesseract processes it started.
+    
+    Args:
+        file: Path to the file or file-like object
+        scan_or_image: Controls OCR behavior, see extract_text()
+        executor: Executor for blocking work (the loop's default if None)
+        limit: Maximum number of Tesseract processes this call runs at once, or a
+               semaphore shared by several calls (one per CPU per call if None)
+            
+    Returns:
+        str: The extracted text content
+        
+    Raises:
+        ExtractionError: If text extraction fails for any reason
+        FileTypeError: If the file type is not supported
+    """
+    import asyncio
+
+    file_type = await asyncio.get_running_loop().run_in_executor(executor, detect_file_type, file)
+    text, _ = await _aextract(file, file_type, scan_or_image, executor=executor, limit=_semaphore(limit))
+    return text
+
+
+@lru_cache(maxsize=None)
+def _mime_detector() -> Any:
+    """Return the process-wide libmagic handle; opening the magic database is costly."""
+    try:
+        import magic
+    except ImportError:
+        raise FileTypeError("python-magic package is required for MIME type detection")
+    return magic.Magic(mime=True)
+
+
+def _extractor_class(file_type: str) -> type:
+    """Import and return the extractor class for a file type."""
+    try:
+        module_name, class_name = EXTRACTORS[file_type]
+    except KeyError:
+        raise FileTypeError(f"Unsupported file type: {file_type}")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def detect_file_type(
+    file: FileInput,
+    hint: Optional[str] = None
+) -> str:
+    """
+    Detect the file type based on a type hint, the file extension or the file content.
+
+    Content is recognized from its magic bytes first (see doc23.sniffing); libmagic
+    is only consulted for content the sniffer does not recognize.
+
+    Args:
+        file: Path to the file or file-like object
+        hint: The file type or MIME type, if the caller knows it. The file is then
+              not read at all.
+
+    Returns:
+        str: The file type, as a file extension (e.g. 'pdf')
+
+    Raises:
+        FileTypeError: If the file type is not supported
+    """
+    if hint:
+        return normalize_file_type(hint)
+
+    if isinstance(file, (str, Path)):
+        file_path = Path(file)
+        extension = file_path.suffix.lower().lstrip('.')
+        if extension in KNOWN_EXTENSIONS:
+            return extension
+        # If extension not recognized, look at the content
+        try:
+            with open(file_path, 'rb') as f:
+                file_type = sniff_file_type(f)
+        except OSError as e:
+            raise FileTypeError(f"Cannot read file: {e}") from e
+        if file_type:
+            return file_type
+        mime_type = _mime_detector().from_file(str(file_path))
+        return mime_to_extension(mime_type)
+    elif isinstance(file, BUFFER_TYPES) or hasattr(file, "read"):
+        try:
+            stream = open_input(file)
+        except Exception as e:
+            raise FileTypeError(f"Unsupported file input: {e}") from e
+        file_type = sniff_file_type(stream)
+        if file_type is None:
+            stream.seek(0)
+            mime_type = _mime_detector().from_buffer(stream.read(2048))
+        stream.seek(0)  # Reset file pointer
+        return file_type or mime_to_extension(mime_type)
+    else:
+        raise FileTypeError("Unsupported file input type")
+
+
+def normalize_file_type(file_type: str) -> str:
+    """
+    Turn a file type given by the caller into the name used by the extractors.
+
+    Args:
+        file_type: A file extension, with or without the dot, or a MIME type
+
+    Returns:
+        str: The file type, as a file extension (e.g. 'pdf')
+
+    Raises:
+        FileTypeError: If the file type is not supported
+    """
+    normalized = file_type.lower().lstrip('.')
+    if "/" in normalized:
+        return mime_to_extension(normalized)
+    if normalized not in EXTRACTORS:
+        raise FileTypeError(f"Unsupported file type: {file_type}")
+    return normalized
+
+
+def mime_to_extension(mime_type: str) -> str:
+    """
+    Convert MIME type to file extension.
+
+    Args:
+        mime_type: The MIME type reported by libmagic
+
+    Returns:
+        str: The matching file extension
+
+    Raises:
+        FileTypeError: If the MIME type is not supported
+    """
+    if mime_type in MIME_TO_EXTENSION:
+        return MIME_TO_EXTENSION[mime_type]
+    raise FileTypeError(f"Unsupported MIME type: {mime_type}")
+
+
+def get_extractor(
+    file: FileInput,
+    file_type: str,
+    scan_or_image: Union[bool, str],
+    ocr_language: str = 'eng',
+    pdf_engine: str = "pdfplumber",
+    pdf_workers: int = 1
+) -> Any:
+    """
+    Get the appropriate extractor for a file, bound to that file.
+
+    Args:
+        file: Path to the file or file-like object
+        file_type: The file type, as returned by detect_file_type()
+        scan_or_image: Controls OCR behavior, see Doc23.extract_text()
+        ocr_language: The language to use for OCR
+        pdf_engine: The library that reads the text layer of PDFs, see PDFExtractor
+        pdf_workers: Processes the text layer of long PDFs is read in, see PDFExtractor
+
+    Returns:
+        The extractor; call its extract_text() to get the text
+
+    Raises:
+        FileTypeError: If the file type is not supported
+    """
+    extractor_class = _extractor_class(file_type)
+    if file_type in ("txt", "md"):
+        return extractor_class(file)
+    elif file_type in IMAGE_TYPES:
+        return extractor_class(ocr_language, file_obj=file)
+    elif file_type == "pdf":
+        return extractor_class(
+            file, scan_or_image=scan_or_image, ocr_language=ocr_language,
+            engine=pdf_engine, workers=pdf_workers
+        )
+    return extractor_class(file, scan_or_image=scan_or_image, ocr_language=ocr_language)
+
+
+def _extract(
+    file: FileInput,
+    file_type: str,
+    scan_or_image: Union[bool, str],
+    ocr_language: str = 'eng',
+    cache: Optional[ExtractionCache] = None,
+    pdf_engine: str = "pdfplumber",
+    pdf_workers: int = 1
+) -> Tuple[str, Optional[List[int]]]:
+    """
+    Extract the text of a file and the offsets where its pages start, if it has pages.
+
+    With a cache, the extraction is looked up by file content and settings first,
+    and stored there after a miss.
+
+    Raises:
+        ExtractionError: If text extraction fails for any reason
+        FileTypeError: If the file type is not supported
+    """
+    extractor, key, cached = _prepare_extract(
+        file, file_type, scan_or_image, ocr_language, cache, pdf_engine, pdf_workers
+    )
+    if cached is not None:
+        return cached
+
+    try:
+        text = extractor.extract_text(scan_or_image=scan_or_image)
+    except Exception as e:
+        raise ExtractionError(f"Failed to extract text: {e}") from e
+    return _finish_extract(extractor, text, cache, key)
+
+
+async def _aextract(
+    file: FileInput,
+    file_type: str,
+    scan_or_image: Union[bool, str],
+    ocr_language: str = 'eng',
+    cache: Optional[ExtractionCache] = None,
+    executor: Optional[Executor] = None,
+    limit: Optional["asyncio.Semaphore"] = None,
+    pdf_engine: str = "pdfplumber",
+    pdf_workers: int = 1
+) -> Tuple[str, Optional[List[int]]]:
+    """
+    Async variant of _extract: blocking work runs in the executor and OCR in
+    asyncio subprocesses (see BaseExtractor.aextract_text).
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    extractor, key, cached = await loop.run_in_executor(
+        executor, _prepare_extract, file, file_type, scan_or_image, ocr_language, cache,
+        pdf_engine, pdf_workers
+    )
+    if cached is not None:
+        return cached
+
+    try:
+        text = await extractor.aextract_text(scan_or_image, executor, limit)
+    except Exception as e:
+        raise ExtractionError(f"Failed to extract text: {e}") from e
+    return await loop.run_in_executor(executor, _finish_extract, extractor, text, cache, key)
+
+
+def _prepare_extract(
+    file: FileInput,
+    file_type: str,
+    scan_or_image: Union[bool, str],
+    ocr_language: str,
+    cache: Optional[ExtractionCache],
+    pdf_engine: str = "pdfplumber",
+    pdf_workers: int = 1
+) -> Tuple[Any, Optional[str], Optional[Tuple[str, Optional[List[int]]]]]:
+    """Create the extractor and look the extraction up in the cache: (extractor, key, cached)."""
+    extractor = get_extractor(file, file_type, scan_or_image, ocr_language, pdf_engine, pdf_workers)
+    if cache is None:
+        return extractor, None, None
+
+    try:
+        key = cache.key(
+            file, file_type, f"{type(extractor).__name__}/{extractor.version}",
+            scan_or_image, ocr_language
+        )
+    except (OSError, ValueError) as e:
+        raise ExtractionError(f"Failed to read file: {e}") from e
+    return extractor, key, cache.get(key)
+
+
+def _finish_extract(
+    extractor: Any,
+    text: str,
+    cache: Optional[ExtractionCache],
+    key: Optional[str]
+) -> Tuple[str, Optional[List[int]]]:
+    """Collect the page offsets of an extraction and store it in the cache."""
+    page_starts = getattr(extractor, "page_starts", None) or None
+    if key is not None:
+        cache.put(key, text, page_starts)
+    return text, page_starts
+
+
+def _semaphore(limit: Union[int, "asyncio.Semaphore", None]) -> Optional["asyncio.Semaphore"]:
+    """Turn a concurrency limit given as a number into a semaphore."""
+    if isinstance(limit, int):
+        import asyncio
+
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        return asyncio.Semaphore(limit)
+    return limit
+
+
 class Doc23:
     """
     Main class for extracting and structuring document content.
 
     Given a file path or buffer and a configuration, it automatically extracts
     the plain text and structures it according to the defined hierarchy.
+
+    The extracted text is kept per `scan_or_image` mode (a single entry for file
+    types whose extraction does not depend on it), so extracting again or pruning
+    several times never re-runs the extractor (or OCR). Call `clear_text_cache()`
+    if the underlying file changes.
     """
 
-    def __init__(self, file: Union[str, Path, bytes, BytesIO], config: Config):
+    def __init__(
+        self,
+        file: FileInput,
+        config: Config,
+        cache: Optional[ExtractionCache] = None,
+        file_type: Optional[str] = None,
+        pdf_engine: str = "pdfplumber",
+        pdf_workers: int = 1
+    ):
         """Initialize the Doc23 instance.
         
         Args:
             file: Path to the file or file-like object
             config: Configuration for document parsing
+            cache: Optional on-disk cache of extracted text, shared across runs
+            file_type: The file type or MIME type, if known; skips type detection
+            pdf_engine: 'pdfplumber' (default) or 'pdfium', see PDFExtractor
+            pdf_workers: Read the text layer of long PDFs in this many processes
+                         (default 1); see PDFExtractor
         """
         self.file = file
         self.config = config
-        self.file_type = self._detect_type()
+        self.cache = cache
+        self.pdf_engine = pdf_engine
+        self.pdf_workers = pdf_workers
+        self.file_type = normalize_file_type(file_type) if file_type else self._detect_type()
         self.gardener = Gardener(config)
+        # Page start offsets of the last text extracted from a PDF
+        self.page_starts: Optional[List[int]] = None
+        # (text, page start offsets) extracted for each scan_or_image mode, see _text_key
+        self._texts: Dict[Union[bool, str, None], Tuple[str, Optional[List[int]]]] = {}
 
     def extract_text(self, scan_or_image: Union[bool, str] = False) -> str:
         """
@@ -97,14 +451,65 @@ class Doc23:
         return self._extract_text(scan_or_image)
 
     def _extract_text(self, scan_or_image: Union[bool, str]) -> str:
-        """Internal method for text extraction."""
-        extractor = self._get_extractor(scan_or_image)
-        try:
-            return extractor.extract_text(scan_or_image=scan_or_image)
-        except Exception as e:
-            raise ExtractionError(f"Failed to extract text: {e}") from e
+        """Internal method for text extraction, memoized per scan_or_image mode."""
+        key = self._text_key(scan_or_image)
+        extracted = self._texts.get(key)
+        if extracted is None:
+            extracted = _extract(
+                self.file, self.file_type, scan_or_image, cache=self.cache,
+                pdf_engine=self.pdf_engine, pdf_workers=self.pdf_workers
+            )
+            self._texts[key] = extracted
+        text, self.page_starts = extracted
+        return text
 
-    def prune(self, text: Optional[str] = None) -> Dict[str, any]:
+    async def aextract_text(
+        self,
+        scan_or_image: Union[bool, str] = False,
+        executor: Optional[Executor] = None,
+        limit: Union[int, "asyncio.Semaphore", None] = None
+    ) -> str:
+        """
+        Extract raw text from the file without blocking the event loop.
+        
+        Shares the memoized text of extract_text(). See the module-level
+        aextract_text() for the arguments.
+        
+        Returns:
+            str: The extracted text content
+            
+        Raises:
+            ExtractionError: If text extraction fails for any reason
+            FileTypeError: If the file type is not supported
+        """
+        key = self._text_key(scan_or_image)
+        extracted = self._texts.get(key)
+        if extracted is None:
+            extracted = await _aextract(
+                self.file, self.file_type, scan_or_image, cache=self.cache,
+                executor=executor, limit=_semaphore(limit),
+                pdf_engine=self.pdf_engine, pdf_workers=self.pdf_workers
+            )
+            self._texts[key] = extracted
+        text, self.page_starts = extracted
+        return text
+
+    def _text_key(self, scan_or_image: Union[bool, str]) -> Union[bool, str, None]:
+        """The key of the memoized text: None for file types that ignore scan_or_image."""
+        return None if self.file_type in MODE_INDEPENDENT_TYPES else scan_or_image
+
+    def clear_text_cache(self) -> None:
+        """Forget the extracted text, so the next extraction reads the file again."""
+        self._texts.clear()
+        self.page_starts = None
+
+    def prune(
+        self,
+        text: Optional[str] = None,
+        scan: str = "lines",
+        compact: bool = False,
+        spans: bool = False
+    ) -> Union[Dict[str, Any], "CompactTree"]:
         """
         Generate a structured JSON-like dictionary from extracted or provided text.
         
@@ -113,7 +518,15 @@ class Doc23:
         
         Args:
             text: The text to parse. If None, text will be automatically extracted
-                 from the file using extract_text() with OCR if necessary.
+                 from the file using extract_text() with OCR if necessary, or
+                 reused from an earlier extraction in 'auto' mode.
+            scan: 'lines' (default) or 'buffer'; see Gardener.prune. 'buffer' keeps
+                  memory low on very large texts.
+            compact: If True, return a read-only, array-backed CompactTree instead of
+                     nested dictionaries (see Gardener.prune_compact).
+            spans: If True, every node records the (start, end) offsets it covers in
+                   the text as "span". When the text is extracted from a PDF here,
+                   nodes also record the (first, last) page numbers as "pages".
                  
         Returns:
             Dict[str, Any]: A structured dictionary representing the document hierarchy
@@ -121,73 +534,274 @@ class Doc23:
         Raises:
             ExtractionError: If text extraction fails when text=None
         """
+        page_starts = None
         if text is None:
             text = self.extract_text(scan_or_image="auto")
-        return self.gardener.prune(text)
+            page_starts = self.page_starts
+        if compact:
+            return self.gardener.prune_compact(text, scan=scan, spans=spans, page_starts=page_starts)
+        return self.gardener.prune(text, scan=scan, spans=spans, page_starts=page_starts)
+
+    def prune_iter(self, scan_or_image: Union[bool, str] = "auto") -> Iterator[Dict[str, Any]]:
+        """
+        Extract and structure the file with bounded memory, one top-level node at a time.
+
+        PDFs are read page by page as the Gardener consumes them (see
+        PDFExtractor.iter_pages), so neither all parsed pages nor the whole text
+        are held at once; this is the way to process documents with thousands of
+        pages. Other file types, and text already extracted here, are parsed
+        from the whole text. The text read is neither memoized nor cached.
+
+        Args:
+            scan_or_image: Controls OCR behavior, see extract_text(); 'auto' by default
+
+        Yields:
+            Dict[str, Any]: The root node, then each finished top-level node, see
+            Gardener.prune_iter
+
+        Raises:
+            ExtractionError: If text extraction fails
+        """
+        chunks: Iterable[str]
+        extracted = self._texts.get(self._text_key(scan_or_image))
+        if extracted is not None or self.file_type != "pdf":
+            chunks = [self.extract_text(scan_or_image)]
+        else:
+            pages = self._get_extractor(scan_or_image).iter_pages()
+            chunks = (text + "\n" for text in pages)
+        return self.gardener.prune_iter(chunks)
+
+    async def aprune(
+        self,
+        text: Optional[str] = None,
+        scan: str = "lines",
+        compact: bool = False,
+        spans: bool = False,
+        executor: Optional[Executor] = None,
+        limit: Union[int, "asyncio.Semaphore", None] = None
+    ) -> Union[Dict[str, Any], "CompactTree"]:
+        """
+        Async variant of prune(): extraction goes through aextract_text() and
+        the text is parsed in the executor.
+        
+        Args:
+            text, scan, compact, spans: See prune()
+            executor: Executor for blocking work (the loop's default if None)
+            limit: Bounds the Tesseract processes run at once, see aextract_text()
+                 
+        Returns:
+            Dict[str, Any]: A structured dictionary representing the document hierarchy
+            
+        Raises:
+            ExtractionError: If text extraction fails when text=None
+        """
+        import asyncio
+
+        if text is None:
+            await self.aextract_text("auto", executor, limit)
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, partial(self.prune, text, scan=scan, compact=compact, spans=spans)
+        )
 
     def _get_extractor(self, scan_or_image: Union[bool, str]) -> Any:
         """Get the appropriate extractor for the file type."""
-        if self.file_type == "pdf":
-            return PDFExtractor(self.file, scan_or_image=scan_or_image)
-        elif self.file_type == "docx":
-            return DocxExtractor(self.file, scan_or_image=scan_or_image)
-        elif self.file_type == "odt":
-            return ODTExtractor(self.file, scan_or_image=scan_or_image)
-        elif self.file_type == "rtf":
-            return RTFExtractor(self.file, scan_or_image=scan_or_image)
-        elif self.file_type == "txt":
-            return TextExtractor(self.file, scan_or_image=scan_or_image)
-        elif self.file_type == "md":
-            return MarkdownExtractor(self.file, scan_or_image=scan_or_image)
-        elif self.file_type in ["jpg", "jpeg", "png", "tiff", "bmp"]:
-            return ImageExtractor(self.file, scan_or_image=scan_or_image)
-        else:
-            raise FileTypeError(f"Unsupported file type: {self.file_type}")
+        return get_extractor(
+            self.file, self.file_type, scan_or_image,
+            pdf_engine=self.pdf_engine, pdf_workers=self.pdf_workers
+        )
 
     def _detect_type(self) -> str:
         """Detect the file type based on the file extension or MIME type."""
-        if isinstance(self.file, (str, Path)):
-            file_path = Path(self.file)
-            extension = file_path.suffix.lower().lstrip('.')
-            if extension in ['pdf', 'docx', 'odt', 'rtf', 'txt', 'md', 'jpg', 'jpeg', 'png', 'tiff', 'bmp']:
-                return extension
-            # If extension not recognized, try MIME type detection
-            try:
-                import magic
-                mime = magic.Magic(mime=True)
-                mime_type = mime.from_file(str(file_path))
-                return self._mime_to_extension(mime_type)
-            except ImportError:
-                raise FileTypeError("python-magic package is required for MIME type detection")
-        elif isinstance(self.file, (bytes, BytesIO)):
-            try:
-                import magic
-                mime = magic.Magic(mime=True)
-                if isinstance(self.file, bytes):
-                    mime_type = mime.from_buffer(self.file)
-                else:
-                    mime_type = mime.from_buffer(self.file.read(2048))
-                    self.file.seek(0)  # Reset file pointer
-                return self._mime_to_extension(mime_type)
-            except ImportError:
-                raise FileTypeError("python-magic package is required for MIME type detection")
-        else:
-            raise FileTypeError("Unsupported file input type")
+        return detect_file_type(self.file)
 
     def _mime_to_extension(self, mime_type: str) -> str:
         """Convert MIME type to file extension."""
-        mime_map = {
-            'application/pdf': 'pdf',
-            'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
-            'application/vnd.oasis.opendocument.text': 'odt',
-            'text/rtf': 'rtf',
-            'text/plain': 'txt',
-            'text/markdown': 'md',
-            'image/jpeg': 'jpg',
-            'image/png': 'png',
-            'image/tiff': 'tiff',
-            'image/bmp': 'bmp'
-        }
-        if mime_type in mime_map:
-            return mime_map[mime_type]
-        raise FileTypeError(f"Unsupported MIME type: {mime_type}")
+        return mime_to_extension(mime_type)
+
+
+class Doc23Processor:
+    """
+    Long-lived document processor bound to one configuration.
+
+    Where Doc23 binds one file to one config, a processor is created once and
+    handles any number of files. The compiled Gardener, the libmagic handle and
+    the OCR engines are set up on first use and reused for every later call.
+
+        >>> processor = Doc23Processor(config)
+        >>> for path in paths:
+        ...     tree = processor.process(path)
+
+    Attributes:
+        config: Configuration for document parsing
+        gardener: The Gardener built from the configuration
+        ocr_language: The language to use for OCR
+        cache: Optional on-disk cache of extracted text
+        pdf_engine: The library that reads the text layer of PDFs
+        pdf_workers: Number of processes the text layer of long PDFs is read in
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        ocr_language: str = 'eng',
+        cache: Optional[ExtractionCache] = None,
+        pdf_engine: str = "pdfplumber",
+        pdf_workers: int = 1
+    ):
+        """
+        Initialize the processor.
+
+        Args:
+            config: Configuration for document parsing
+            ocr_language: The language to use for OCR, default is English ('eng')
+            cache: Optional on-disk cache of extracted text, shared across runs
+            pdf_engine: 'pdfplumber' (default) or 'pdfium', see PDFExtractor
+            pdf_workers: Read the text layer of long PDFs in this many processes
+                         (default 1); see PDFExtractor
+        """
+        self.config = config
+        self.gardener = Gardener(config)
+        self.ocr_language = ocr_language
+        self.cache = cache
+        self.pdf_engine = pdf_engine
+        self.pdf_workers = pdf_workers
+
+    def detect_type(self, file: FileInput, hint: Optional[str] = None) -> str:
+        """
+        Detect the file type of a file.
+
+        Args:
+            file: Path to the file or file-like object
+            hint: The file type or MIME type, if known
+
+        Returns:
+            str: The file type, as a file extension (e.g. 'pdf')
+
+        Raises:
+            FileTypeError: If the file type is not supported
+        """
+        return detect_file_type(file, hint)
+
+    def extract(
+        self,
+        file: FileInput,
+        scan_or_image: Union[bool, str] = False,
+        file_type: Optional[str] = None
+    ) -> str:
+        """
+        Extract raw text from a file.
+
+        Args:
+            file: Path to the file or file-like object
+            scan_or_image: Controls OCR behavior, see Doc23.extract_text()
+            file_type: The file type or MIME type, if already known; detected otherwise
+
+        Returns:
+            str: The extracted text content
+
+        Raises:
+            ExtractionError: If text extraction fails for any reason
+            FileTypeError: If the file type is not supported
+        """
+        text, _ = _extract(
+            file, detect_file_type(file, file_type), scan_or_image, self.ocr_language, self.cache,
+            self.pdf_engine, self.pdf_workers
+        )
+        return text
+
+    def prune_text(
+        self,
+        text: str,
+        scan: str = "lines",
+        compact: bool = False,
+        spans: bool = False
+    ) -> Union[Dict[str, Any], "CompactTree"]:
+        """
+        Structure text that was already extracted.
+
+        Args:
+            text: The text to parse
+            scan: 'lines' (default) or 'buffer', see Doc23.prune()
+            compact: Return a CompactTree, see Doc23.prune()
+            spans: Record the source span of every node, see Doc23.prune()
+
+        Returns:
+            Dict[str, Any]: A structured dictionary representing the document hierarchy
+        """
+        if compact:
+            return self.gardener.prune_compact(text, scan=scan, spans=spans)
+        return self.gardener.prune(text, scan=scan, spans=spans)
+
+    def process(
+        self,
+        file: FileInput,
+        scan_or_image: Union[bool, str] = "auto",
+        scan: str = "lines",
+        compact: bool = False,
+        spans: bool = False,
+        file_type: Optional[str] = None
+    ) -> Union[Dict[str, Any], "CompactTree"]:
+        """
+        Extract the text of a file and structure it, like Doc23(file, config).prune().
+
+        Args:
+            file: Path to the file or file-like object
+            scan_or_image: Controls OCR behavior, 'auto' by default
+            scan: 'lines' (default) or 'buffer', see Doc23.prune()
+            compact: Return a CompactTree, see Doc23.prune()
+            spans: Record the source span (and PDF pages) of every node, see Doc23.prune()
+            file_type: The file type or MIME type, if already known; detected otherwise
+
+        Returns:
+            Dict[str, Any]: A structured dictionary representing the document hierarchy
+
+        Raises:
+            ExtractionError: If text extraction fails for any reason
+            FileTypeError: If the file type is not supported
+        """
+        file_type = detect_file_type(file, file_type)
+        text, page_starts = _extract(
+            file, file_type, scan_or_image, self.ocr_language, self.cache, self.pdf_engine,
+            self.pdf_workers
+        )
+        if compact:
+            return self.gardener.prune_compact(text, scan=scan, spans=spans, page_starts=page_starts)
+        return self.gardener.prune(text, scan=scan, spans=spans, page_starts=page_starts)
+
+    async def aprocess(
+        self,
+        file: FileInput,
+        scan_or_image: Union[bool, str] = "auto",
+        scan: str = "lines",
+        compact: bool = False,
+        spans: bool = False,
+        file_type: Optional[str] = None,
+        executor: Optional[Executor] = None,
+        limit: Union[int, "asyncio.Semaphore", None] = None
+    ) -> Union[Dict[str, Any], "CompactTree"]:
+        """
+        Async variant of process(), for asyncio services.
+
+        Detection, extraction and parsing run in the executor and Tesseract runs
+        as asyncio subprocesses; see aextract_text() for `executor` and `limit`.
+
+        Returns:
+            Dict[str, Any]: A structured dictionary representing the document hierarchy
+
+        Raises:
+            ExtractionError: If text extraction fails for any reason
+            FileTypeError: If the file type is not supported
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        file_type = await loop.run_in_executor(executor, detect_file_type, file, file_type)
+        text, page_starts = await _aextract(
+            file, file_type, scan_or_image, self.ocr_language, self.cache,
+            executor=executor, limit=_semaphore(limit), pdf_engine=self.pdf_engine,
+            pdf_workers=self.pdf_workers
+        )
+        prune = self.gardener.prune_compact if compact else self.gardener.prune
+        return await loop.run_in_executor(
+            executor, partial(prune, text, scan=scan, spans=spans, page_starts=page_starts)
+        )
@@ -1,15 +1,24 @@
 """
 Document text extraction modules for different file formats.
+
+Each extractor depends on a third-party backend (pdfplumber, docx2txt, odfpy...),
+so the extractor modules are only imported when one of their classes is first used.
 """
 
+import importlib
+from typing import Any
+
 from doc23.extractors.base import BaseExtractor
-from doc23.extractors.pdf import PDFExtractor
-from doc23.extractors.docx import DocxExtractor
-from doc23.extractors.text import TextExtractor
-from doc23.extractors.image import ImageExtractor
-from doc23.extractors.odt import ODTExtractor
-from doc23.extractors.rtf import RTFExtractor
-from doc23.extractors.markdown import MarkdownExtractor
+
+_MODULES = {
+    "PDFExtractor": "doc23.extractors.pdf",
+    "DocxExtractor": "doc23.extractors.docx",
+    "TextExtractor": "doc23.extractors.text",
+    "ImageExtractor": "doc23.extractors.image",
+    "ODTExtractor": "doc23.extractors.odt",
+    "RTFExtractor": "doc23.extractors.rtf",
+    "MarkdownExtractor": "doc23.extractors.markdown",
+}
 
 __all__ = [
     "BaseExtractor",
@@ -20,4 +29,11 @@ __all__ = [
     "ODTExtractor",
     "RTFExtractor",
     "MarkdownExtractor",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import extractor classes on first access."""
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
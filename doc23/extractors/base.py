@@ -2,12 +2,16 @@
 Base class for document text extractors.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO, Optional, Union
 
 from doc23.exceptions import ExtractionError
+from doc23.inputs import FileInput, open_input
 
 
 class BaseExtractor(ABC):
@@ -16,15 +20,22 @@ class BaseExtractor(ABC):
     
     All extractor implementations should inherit from this class and
     implement the extract_text method.
+    
+    Attributes:
+        version: Version of the extraction logic. Bump it in a subclass whenever
+                 its output changes, so cached extractions are not reused.
     """
     
-    def __init__(self, file_obj: Union[str, Path, BytesIO, BinaryIO]):
+    version: str = "1"
+    
+    def __init__(self, file_obj: FileInput):
         """
         Initialize the base extractor with a file object.
         
         Args:
             file_obj: The document file object, which can be a path string,
-                      Path object, or a file-like object.
+                      Path object, in-memory data (bytes, bytearray, memoryview,
+                      mmap) or a seekable binary file-like object.
         """
         self.file_obj = self._validate_file_object(file_obj)
     
@@ -52,36 +63,59 @@ class BaseExtractor(ABC):
         """
         pass
     
+    async def aextract_text(
+        self,
+        scan_or_image: Union[bool, str] = False,
+        executor: Optional[Executor] = None,
+        limit: Optional[asyncio.Semaphore] = None
+    ) -> str:
+        """
+        Extract text from the document without blocking the event loop.
+        
+        By default extract_text() runs in the executor; extractors that use OCR
+        override this to run Tesseract as asyncio subprocesses instead.
+        
+        Args:
+            scan_or_image: See extract_text().
+            executor: Executor for blocking work (the loop's default if None).
+            limit: Bounds the number of Tesseract processes running at once.
+            
+        Returns:
+            Extracted text as a string.
+            
+        Raises:
+            ExtractionError: If text extraction fails.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, partial(self.extract_text, scan_or_image=scan_or_image)
+        )
+    
     def _validate_file_object(
         self, 
-        file_obj: Union[str, Path, BytesIO, BinaryIO]
-    ) -> Union[str, BytesIO]:
+        file_obj: FileInput
+    ) -> Union[str, BinaryIO]:
         """
         Validates the file object and returns a standardized form.
         
+        In-memory data is wrapped in a read-only stream over the same buffer
+        (see doc23.inputs), so it is never copied as a whole.
+        
         Args:
             file_obj: The document file object.
             
         Returns:
-            A standardized file object (either a path string or BytesIO).
+            A standardized file object (either a path string or a seekable
+            binary stream positioned at the start).
             
         Raises:
             ExtractionError: If the file object is invalid.
         """
-        if isinstance(file_obj, (str, Path)):
-            path = Path(file_obj)
-            if not path.exists():
-                raise ExtractionError(f"File not found: {path}")
-            return str(path.resolve())
-        
-        if isinstance(file_obj, (BytesIO, BinaryIO)):
-            # Ensure we're at the start of the file
-            try:
-                file_obj.seek(0)
-                return file_obj
-            except Exception as e:
-                raise ExtractionError(f"Invalid file object: {e}")
-        
-        raise ExtractionError(
-            f"Unsupported file object type: {type(file_obj).__name__}"
-        ) 
\ No newline at end of file
+        try:
+            return open_input(file_obj)
+        except FileNotFoundError as e:
+            raise ExtractionError(str(e))
+        except TypeError as e:
+            raise ExtractionError(str(e))
+        except Exception as e:
+            raise ExtractionError(f"Invalid file object: {e}")
@@ -4,8 +4,6 @@ DOCX text extraction module.
 
 import logging
 from io import BytesIO
-import os
-import tempfile
 from pathlib import Path
 from typing import BinaryIO, Optional, Union
 
@@ -71,24 +69,10 @@ class DocxExtractor(BaseExtractor):
             # For now, ignore the scan_or_image parameter for DOCX
             # Future enhancement: Extract images from DOCX and apply OCR if requested
             
-            if isinstance(file_to_use, str):
-                # Direct path to file
-                return docx2txt.process(file_to_use).strip()
-            else:
-                # File-like object, save to temp file first
-                with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                    file_to_use.seek(0)
-                    temp_file.write(file_to_use.read())
-                
-                try:
-                    result = docx2txt.process(temp_path).strip()
-                finally:
-                    # Clean up temp file
-                    if os.path.exists(temp_path):
-                        os.unlink(temp_path)
-                
-                return result
+            # docx2txt opens the zip container directly, from a path or a stream
+            if not isinstance(file_to_use, str):
+                file_to_use.seek(0)
+            return docx2txt.process(file_to_use).strip()
                 
         except Exception as e:
             if isinstance(e, ExtractionError):
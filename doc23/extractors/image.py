@@ -2,10 +2,13 @@
 Image text extraction module using OCR.
 """
 
+import asyncio
 import logging
+from concurrent.futures import Executor
+from contextlib import nullcontext
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, Union
+from typing import BinaryIO, Optional, Union
 
 from doc23.exceptions import ExtractionError, OCRError
 from doc23.extractors.base import BaseExtractor
@@ -19,18 +22,25 @@ class ImageExtractor(BaseExtractor):
     Extractor for image files that uses OCR to extract text.
     """
     
-    def __init__(self, ocr_language: str = 'eng'):
+    def __init__(
+        self,
+        ocr_language: str = 'eng',
+        file_obj: Optional[Union[str, Path, BytesIO, BinaryIO]] = None
+    ):
         """
         Initialize image extractor.
         
         Args:
             ocr_language: The language to use for OCR, default is English ('eng').
+            file_obj: Optional image file object to extract from when
+                      extract_text() is called without one.
         """
         self.ocr_language = ocr_language
+        self.file_obj = self._validate_file_object(file_obj) if file_obj is not None else None
         
     def extract_text(
         self, 
-        file_obj: Union[str, Path, BytesIO, BinaryIO], 
+        file_obj: Optional[Union[str, Path, BytesIO, BinaryIO]] = None, 
         scan_or_image: Union[bool, str] = False
     ) -> str:
         """
@@ -39,7 +49,8 @@ class ImageExtractor(BaseExtractor):
         The scan_or_image parameter is ignored for image files since OCR is always used.
         
         Args:
-            file_obj: The image file object, which can be a path string,
+            file_obj: Optional file object to override the one provided at initialization.
+                      The image file object, which can be a path string,
                       Path object, or a file-like object.
             scan_or_image: Ignored for image files.
                            
@@ -50,14 +61,18 @@ class ImageExtractor(BaseExtractor):
             ExtractionError: If text extraction fails.
         """
         try:
-            validated_file = self._validate_file_object(file_obj)
+            if file_obj is None and self.file_obj is None:
+                raise ExtractionError("No image file provided")
+            validated_file = self._validate_file_object(
+                file_obj if file_obj is not None else self.file_obj
+            )
             
             # Import here to avoid circular imports
-            from doc23.ocr.processor import OCRProcessor
+            from doc23.ocr.processor import get_ocr_processor
             
             try:
-                # Initialize OCR processor
-                ocr = OCRProcessor(language=self.ocr_language)
+                # Reuse the OCR processor for this language
+                ocr = get_ocr_processor(self.ocr_language)
                 
                 # Process image with OCR
                 return ocr.process_image(validated_file)
@@ -70,4 +85,42 @@ class ImageExtractor(BaseExtractor):
             if isinstance(e, ExtractionError):
                 raise
             logger.error(f"Error extracting text from image: {e}")
-            raise ExtractionError(f"Failed to extract text from image: {e}") from e 
\ No newline at end of file
+            raise ExtractionError(f"Failed to extract text from image: {e}") from e
+    
+    async def aextract_text(
+        self,
+        scan_or_image: Union[bool, str] = False,
+        executor: Optional[Executor] = None,
+        limit: Optional[asyncio.Semaphore] = None
+    ) -> str:
+        """
+        Extract text from the image with Tesseract run as an asyncio subprocess.
+        
+        Args:
+            scan_or_image: Ignored for image files.
+            executor: Executor for loading the image (the loop's default if None).
+            limit: Bounds the number of Tesseract processes running at once.
+            
+        Returns:
+            Extracted text as a string.
+            
+        Raises:
+            ExtractionError: If text extraction fails.
+        """
+        if self.file_obj is None:
+            raise ExtractionError("No image file provided")
+        
+        from doc23.ocr.processor import get_ocr_processor
+        
+        try:
+            # The first processor of a language runs Tesseract to check it
+            ocr = await asyncio.get_running_loop().run_in_executor(
+                executor, get_ocr_processor, self.ocr_language
+            )
+            if not isinstance(self.file_obj, str):
+                self.file_obj.seek(0)
+            async with limit or nullcontext():
+                return await ocr.aprocess_image(self.file_obj, executor)
+        except OCRError as e:
+            logger.error(f"OCR error processing image: {e}")
+            raise ExtractionError(f"OCR failed on image: {e}") from e
@@ -5,12 +5,13 @@ Markdown extraction module.
 import logging
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, Union
+from typing import BinaryIO, Optional, Union
 
 import markdown
 
 from doc23.exceptions import ExtractionError
 from doc23.extractors.base import BaseExtractor
+from doc23.inputs import read_text
 
 
 logger = logging.getLogger(__name__)
@@ -23,7 +24,7 @@ class MarkdownExtractor(BaseExtractor):
     
     def extract_text(
         self, 
-        file_obj: Union[str, Path, BytesIO, BinaryIO], 
+        file_obj: Optional[Union[str, Path, BytesIO, BinaryIO]] = None, 
         scan_or_image: Union[bool, str] = False
     ) -> str:
         """
@@ -33,7 +34,8 @@ class MarkdownExtractor(BaseExtractor):
         as the structure is often important for subsequent parsing.
         
         Args:
-            file_obj: The Markdown file object, which can be a path string,
+            file_obj: Optional file object to override the one provided at initialization.
+                      The Markdown file object, which can be a path string,
                       Path object, or a file-like object.
             scan_or_image: Ignored for Markdown files.
                            
@@ -44,22 +46,12 @@ class MarkdownExtractor(BaseExtractor):
             ExtractionError: If text extraction fails.
         """
         try:
-            validated_file = self._validate_file_object(file_obj)
+            validated_file = self._validate_file_object(
+                file_obj if file_obj is not None else self.file_obj
+            )
             
-            # Handle file paths
-            if isinstance(validated_file, str):
-                with open(validated_file, "r", encoding="utf-8", errors="replace") as f:
-                    return f.read().strip()
-            
-            # Handle file-like objects
-            validated_file.seek(0)
-            try:
-                # Try first with utf-8
-                return validated_file.read().decode("utf-8", errors="replace").strip()
-            except UnicodeDecodeError:
-                # Fallback to latin-1 if utf-8 fails
-                validated_file.seek(0)
-                return validated_file.read().decode("latin-1", errors="replace").strip()
+            # Decodes paths and streams alike, without copying in-memory content
+            return read_text(validated_file, "utf-8", errors="replace").strip()
                 
         except Exception as e:
             if isinstance(e, ExtractionError):
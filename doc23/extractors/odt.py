@@ -3,8 +3,6 @@ ODT (OpenDocument Text) extraction module.
 """
 
 import logging
-import os
-import tempfile
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO, Union, Optional
@@ -66,22 +64,10 @@ class ODTExtractor(BaseExtractor):
             file_to_use = file_obj if file_obj is not None else self.file_obj
             scan_to_use = scan_or_image if scan_or_image is not None else self.scan_or_image
             
-            # Handle file paths
-            if isinstance(file_to_use, str):
-                return self._extract_from_odt(file_to_use)
-            
-            # Handle file-like objects by saving to a temporary file
-            with tempfile.NamedTemporaryFile(suffix='.odt', delete=False) as temp_file:
-                temp_path = temp_file.name
+            # odfpy opens the zip container directly, from a path or a stream
+            if not isinstance(file_to_use, str):
                 file_to_use.seek(0)
-                temp_file.write(file_to_use.read())
-            
-            try:
-                return self._extract_from_odt(temp_path)
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            return self._extract_from_odt(file_to_use)
                 
         except Exception as e:
             if isinstance(e, ExtractionError):
@@ -89,8 +75,8 @@ class ODTExtractor(BaseExtractor):
             logger.error(f"Error extracting text from ODT: {e}")
             raise ExtractionError(f"Failed to extract text from ODT: {e}") from e
     
-    def _extract_from_odt(self, file_path: str) -> str:
-        """Extract text from an ODT file."""
+    def _extract_from_odt(self, file_path: Union[str, BinaryIO]) -> str:
+        """Extract text from an ODT file path or stream."""
         try:
             doc = load(file_path)
             paragraphs = doc.getElementsByType(P)
@@ -2,47 +2,101 @@
 PDF text extraction module.
 """
 
+import asyncio
 import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import Executor
+from contextlib import closing, contextmanager
+from functools import partial
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, Optional, Union
+from typing import BinaryIO, Generator, Iterator, List, Optional, Sequence, Tuple, Union
 
 import pdfplumber
-from pdf2image import convert_from_bytes
+from pdfplumber.page import Page
+from pdf2image import convert_from_path
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import dict_value, resolve1
 
 from doc23.exceptions import ExtractionError
 from doc23.extractors.base import BaseExtractor
+from doc23.extractors.pdf_pages import PageClass, classify_page, classify_pages
 
 
 logger = logging.getLogger(__name__)
 
+# Libraries PDFExtractor can read the text layer with
+ENGINES = ("pdfplumber", "pdfium")
+
 
 class PDFExtractor(BaseExtractor):
     """
     Extractor for PDF files that handles text extraction and OCR when needed.
+    
+    Attributes:
+        page_starts: Offset in the text returned by the last extraction where each
+                     page starts, in page order
+        min_text_chars: In 'auto' mode, pages whose text layer has fewer non-space
+                        characters than this are OCR'd if they hold images
+        min_image_coverage: In 'auto' mode, the least share of a page without a text
+                            layer that images must cover for it to be OCR'd; blank
+                            pages and pages holding only a page number are kept
+        engine: The library that reads the text layer, one of ENGINES
+        workers: Number of processes the text layer is extracted in
+        min_pages_per_worker: With several workers, the least number of pages a
+                              worker is given; shorter documents are read in
+                              this process
     """
     
+    version = "2"
+    min_text_chars: int = 10
+    min_image_coverage: float = 0.1
+    min_pages_per_worker: int = 20
+    
     def __init__(
         self, 
         file_obj: Union[str, Path, BytesIO, BinaryIO],
         scan_or_image: Union[bool, str] = False,
-        ocr_language: str = 'eng'
+        ocr_language: str = 'eng',
+        engine: str = "pdfplumber",
+        workers: int = 1
     ):
         """
         Initialize PDF extractor.
         
         Args:
             file_obj: The PDF file object, which can be a path string,
-                      Path object, or a file-like object.
+                      Path object, in-memory data or a file-like object.
             scan_or_image: How to handle potential scanned content:
                           - False: Only extract text (no OCR)
                           - True: Use OCR on all pages
                           - 'auto': Detect and use OCR only when needed
             ocr_language: The language to use for OCR, default is English ('eng').
+            engine: How the text layer is read:
+                    - 'pdfplumber' (default): pdfminer layout analysis, the most
+                      faithful to the visual layout
+                    - 'pdfium': PDFium's text API through pypdfium2, many times faster
+            workers: Extract the text layer of long documents in this many
+                     processes, each reading a range of pages (default 1)
+        
+        Raises:
+            ExtractionError: If the engine is unknown.
         """
+        if engine not in ENGINES:
+            raise ExtractionError(f"Unknown PDF engine {engine!r}, expected one of {', '.join(ENGINES)}")
         super().__init__(file_obj)
         self.scan_or_image = scan_or_image
         self.ocr_language = ocr_language
+        self.engine = engine
+        self.workers = workers
+        self.page_starts: List[int] = []
+        if engine != "pdfplumber":
+            # Engines produce different text, which must not share cache entries
+            self.version = f"{PDFExtractor.version}-{engine}"
         
     def extract_text(
         self, 
@@ -84,62 +138,338 @@ class PDFExtractor(BaseExtractor):
                 raise ExtractionError(f"Failed to extract text from PDF: {e}") from e
             raise
     
+    def iter_pages(
+        self,
+        file_obj: Optional[Union[str, Path, BytesIO, BinaryIO]] = None,
+        scan_or_image: Optional[Union[bool, str]] = None
+    ) -> Iterator[str]:
+        """
+        Yield the text of each page in page order, holding one page in memory at a time.
+        
+        Each page is parsed (and rendered and OCR'd when needed) when it is
+        requested, and its cached layout is dropped before the next one is read,
+        so memory stays flat however many pages the PDF has. Pages are read in
+        this process whatever `workers` is, and `page_starts` is not updated.
+        
+        In 'auto' mode a page is OCR'd when its own text layer is empty or
+        near-empty and images cover it (see `min_image_coverage`), as
+        `extract_text` does.
+        
+        Args:
+            file_obj: Optional file object to override the one provided at initialization.
+            scan_or_image: Optional scan_or_image setting to override the one provided at initialization.
+        
+        Yields:
+            str: The text of each page
+        
+        Raises:
+            ExtractionError: If text extraction fails.
+        """
+        file_to_use = self._validate_file_object(file_obj) if file_obj is not None else self.file_obj
+        scan_to_use = scan_or_image if scan_or_image is not None else self.scan_or_image
+        if scan_to_use not in (False, True, "auto"):
+            raise ExtractionError("scan_or_image must be a boolean or 'auto'")
+        
+        try:
+            if scan_to_use is False:
+                yield from _iter_text_layer(file_to_use, self.engine, release=True)
+                return
+            
+            # Import here to avoid circular imports
+            from doc23.ocr.processor import get_ocr_processor
+            
+            ocr = get_ocr_processor(self.ocr_language)
+            # Rendering needs a path: read the text layer from it too, so that
+            # poppler and pdfminer never share a stream
+            with self._pdf_path(file_to_use) as pdf_path:
+                if scan_to_use is True:
+                    for page in range(_page_count(pdf_path)):
+                        yield ocr.process_image(self._render_pages(pdf_path, [page])[0])
+                    return
+                
+                texts = _iter_text_layer(pdf_path, self.engine, release=True)
+                # Pages without text are classified as in `_pages_to_ocr`, one at a time
+                with closing(_iter_page_objects(pdf_path)) as page_objs:
+                    for page, (text, page_obj) in enumerate(zip(texts, page_objs)):
+                        if self._lacks_text(text) and (
+                            classify_page(page_obj, self.min_text_chars).image_coverage
+                            >= self.min_image_coverage
+                        ):
+                            text = ocr.process_image(self._render_pages(pdf_path, [page])[0])
+                        yield text
+        except Exception as e:
+            if isinstance(e, ExtractionError):
+                raise
+            logger.error(f"Error extracting text from PDF: {e}")
+            raise ExtractionError(f"Failed to extract text from PDF: {e}") from e
+    
     def _extract_text_only(self, file_obj: Union[str, BytesIO]) -> str:
         """Extract text from PDF without using OCR."""
+        return self._join_pages(self._text_layer(file_obj), "\n")
+    
+    def _text_layer(self, file_obj: Union[str, BinaryIO]) -> List[str]:
+        """Extract the text layer of every page, opening the PDF once (per worker)."""
         try:
-            with pdfplumber.open(file_obj) as pdf:
-                return "\n".join(page.extract_text() or "" for page in pdf.pages)
+            if self.workers > 1:
+                texts = self._text_layer_parallel(file_obj)
+                if texts is not None:
+                    return texts
+            return _read_text_layer(file_obj, self.engine)
         except Exception as e:
+            if isinstance(e, ExtractionError):
+                raise
             logger.error(f"Error extracting text from PDF: {e}")
             raise ExtractionError(f"Failed to extract text from PDF: {e}") from e
     
+    def _text_layer_parallel(self, file_obj: Union[str, BinaryIO]) -> Optional[List[str]]:
+        """
+        Extract the text layer with the page range split across worker processes.
+        
+        Each worker opens the PDF from the same path (streams are first copied to a
+        temporary file) and extracts a contiguous slice of pages; the slices are
+        concatenated in page order. Returns None when the document has too few
+        pages to be worth it (see `min_pages_per_worker`).
+        """
+        count = _page_count(file_obj)
+        tasks = min(self.workers * 2, count // self.min_pages_per_worker)
+        if tasks < 2:
+            return None
+        bounds = [count * i // tasks for i in range(tasks + 1)]
+        
+        # Imported here: multiprocessing is slow to import and rarely needed
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with self._pdf_path(file_obj) as pdf_path:
+            ranges = [(pdf_path, self.engine, start, end) for start, end in zip(bounds, bounds[1:])]
+            with ProcessPoolExecutor(max_workers=min(self.workers, tasks)) as pool:
+                return [text for texts in pool.map(_text_layer_range, ranges) for text in texts]
+    
     def _extract_with_ocr(self, file_obj: Union[str, BytesIO]) -> str:
         """Extract text from PDF using OCR on all pages."""
         try:
             # Import here to avoid circular imports
-            from doc23.ocr.processor import OCRProcessor
-            
-            ocr = OCRProcessor(language=self.ocr_language)
+            from doc23.ocr.processor import get_ocr_processor
             
-            # Convert PDF to images
-            if isinstance(file_obj, str):
-                with open(file_obj, 'rb') as f:
-                    pdf_bytes = BytesIO(f.read())
-            else:
-                file_obj.seek(0)
-                pdf_bytes = file_obj
-                
-            images = convert_from_bytes(pdf_bytes.read())
+            ocr = get_ocr_processor(self.ocr_language)
             
-            # Process each image with OCR
+            # Process each page image with OCR
             text_parts = []
-            for img in images:
+            for img in self._render_pages(file_obj):
                 text_parts.append(ocr.process_image(img))
                 
-            return "\n\n".join(text_parts)
+            return self._join_pages(text_parts, "\n\n")
+            
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF with OCR: {e}")
+            raise ExtractionError(
+                f"Failed to extract text from PDF with OCR: {e}"
+            ) from e
+    
+    def _render_pages(self, file_obj: Union[str, BinaryIO], pages: Optional[Sequence[int]] = None) -> list:
+        """Render the given pages (0-based, ascending) of the PDF to images, or every page if None."""
+        with self._pdf_path(file_obj) as pdf_path:
+            if pages is None:
+                return convert_from_path(pdf_path)
+            images = []
+            for first, last in _runs(pages):
+                images.extend(convert_from_path(pdf_path, first_page=first + 1, last_page=last + 1))
+            return images
+    
+    async def aextract_text(
+        self,
+        scan_or_image: Optional[Union[bool, str]] = None,
+        executor: Optional[Executor] = None,
+        limit: Optional[asyncio.Semaphore] = None
+    ) -> str:
+        """
+        Extract text from the PDF without blocking the event loop.
+        
+        pdfplumber and page rendering run in the executor. Pages that need OCR
+        are piped to Tesseract run as asyncio subprocesses, several at a time;
+        cancelling the call kills them.
+        
+        Args:
+            scan_or_image: Optional scan_or_image setting to override the one provided at initialization.
+            executor: Executor for blocking work (the loop's default if None).
+            limit: Bounds the number of Tesseract processes running at once;
+                   defaults to one per CPU for this call.
+            
+        Returns:
+            Extracted text as a string.
             
+        Raises:
+            ExtractionError: If text extraction fails.
+        """
+        scan_to_use = scan_or_image if scan_or_image is not None else self.scan_or_image
+        if scan_to_use not in (True, "auto"):
+            return await super().aextract_text(scan_to_use, executor, limit)
+        
+        # Import here to avoid circular imports
+        from doc23.ocr.processor import get_ocr_processor
+        
+        loop = asyncio.get_running_loop()
+        texts = pages = None
+        if scan_to_use == "auto":
+            texts = await loop.run_in_executor(executor, self._text_layer, self.file_obj)
+            pages = await loop.run_in_executor(executor, self._pages_to_ocr, self.file_obj, texts)
+            if not pages:
+                return self._join_pages(texts, "\n")
+        
+        limit = limit or asyncio.Semaphore(os.cpu_count() or 1)
+        
+        async def ocr_page(img) -> str:
+            async with limit:
+                return await ocr.aprocess_image(img, executor)
+        
+        try:
+            ocr = await loop.run_in_executor(executor, get_ocr_processor, self.ocr_language)
+            images = await loop.run_in_executor(
+                executor, partial(self._render_pages, self.file_obj, pages)
+            )
+            tasks = [asyncio.ensure_future(ocr_page(img)) for img in images]
+            try:
+                text_parts = await asyncio.gather(*tasks)
+            finally:
+                # On failure or cancellation, stop the pages still running and
+                # wait for them to unwind, so their Tesseract processes are reaped
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
         except Exception as e:
             logger.error(f"Error extracting text from PDF with OCR: {e}")
             raise ExtractionError(
                 f"Failed to extract text from PDF with OCR: {e}"
             ) from e
+        
+        if texts is None:
+            return self._join_pages(text_parts, "\n\n")
+        for page, text in zip(pages, text_parts):
+            texts[page] = text
+        return self._join_hybrid(texts, pages)
+    
+    @contextmanager
+    def _pdf_path(self, file_obj: Union[str, BinaryIO]) -> Iterator[str]:
+        """
+        Provide a path to the PDF for tools that only read files (poppler).
+        
+        Streams are copied to a temporary file in chunks, never as a whole in memory.
+        """
+        if isinstance(file_obj, str):
+            yield file_obj
+            return
+        
+        fd, temp_path = tempfile.mkstemp(suffix='.pdf')
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                file_obj.seek(0)
+                shutil.copyfileobj(file_obj, temp_file)
+            yield temp_path
+        finally:
+            os.unlink(temp_path)
+    
+    def _join_pages(self, pages: Sequence[str], sep: str) -> str:
+        """Join the text of each page, recording where every page starts in `page_starts`."""
+        starts = []
+        offset = 0
+        for text in pages:
+            starts.append(offset)
+            offset += len(text) + len(sep)
+        self.page_starts = starts
+        return sep.join(pages)
     
     def _extract_auto(self, file_obj: Union[str, BytesIO]) -> str:
         """
-        Automatically detect if OCR is needed and extract text accordingly.
+        Extract the text layer and OCR only the scanned pages that have none.
         
-        This will first try normal text extraction, and if no text is found,
-        it will fall back to OCR.
+        The PDF is opened once and the text of each page extracted once. Pages
+        whose text layer is empty or nearly so and that hold images (see
+        `_pages_to_ocr`) are then rendered and OCR'd, and their text is put back
+        in page order.
         """
-        # First check if the PDF contains extractable text
-        with pdfplumber.open(file_obj) as pdf:
-            has_text = any(page.extract_text() for page in pdf.pages)
+        texts = self._text_layer(file_obj)
+        pages = self._pages_to_ocr(file_obj, texts)
+        if not pages:
+            return self._join_pages(texts, "\n")
+        
+        try:
+            # Import here to avoid circular imports
+            from doc23.ocr.processor import get_ocr_processor
             
-            if has_text:
-                return self._extract_text_only(file_obj)
-            else:
-                return self._extract_with_ocr(file_obj)
-                
+            ocr = get_ocr_processor(self.ocr_language)
+            for page, img in zip(pages, self._render_pages(file_obj, pages)):
+                texts[page] = ocr.process_image(img)
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF with OCR: {e}")
+            raise ExtractionError(
+                f"Failed to extract text from PDF with OCR: {e}"
+            ) from e
+        return self._join_hybrid(texts, pages)
+    
+    def _pages_without_text(self, texts: Sequence[str]) -> List[int]:
+        """Return the indices of the pages whose text layer is empty or near-empty."""
+        return [page for page, text in enumerate(texts) if self._lacks_text(text)]
+    
+    def _pages_to_ocr(self, file_obj: Union[str, BinaryIO], texts: Sequence[str]) -> List[int]:
+        """
+        Return the indices of the pages to OCR in 'auto' mode.
+        
+        Of the pages without a text layer, only those whose images cover at least
+        `min_image_coverage` of the page are kept; the others have nothing to OCR.
+        Only these pages are classified (see `classify_pages`).
+        """
+        pages = self._pages_without_text(texts)
+        if not pages:
+            return pages
+        try:
+            classes = classify_pages(file_obj, self.min_text_chars, pages)
+        except Exception as e:
+            logger.warning(f"Error classifying PDF pages, OCR'ing every page without text: {e}")
+            return pages
+        return [
+            page for page, page_class in zip(pages, classes)
+            if page_class.image_coverage >= self.min_image_coverage
+        ]
+    
+    def _lacks_text(self, text: str) -> bool:
+        """Tell whether a page's text layer is empty or near-empty (see `min_text_chars`)."""
+        return len("".join(text.split())) < self.min_text_chars
+    
+    def _join_hybrid(self, texts: Sequence[str], ocr_pages: Sequence[int]) -> str:
+        """Join pages of which some were OCR'd, like OCR output if all of them were."""
+        return self._join_pages(texts, "\n\n" if len(ocr_pages) == len(texts) else "\n")
+    
+    def classify_pages(
+        self,
+        file_obj: Optional[Union[str, Path, BytesIO, BinaryIO]] = None,
+        pages: Optional[Sequence[int]] = None
+    ) -> List[PageClass]:
+        """
+        Label each page 'text', 'scanned' or 'mixed' without extracting or rendering it.
+        
+        Only cheap signals are used: the characters shown by text operators, the
+        fonts and how much of the page images cover (see doc23.extractors.pdf_pages).
+        This lets schedulers route documents and estimate their OCR cost before
+        extracting them.
+        
+        Args:
+            file_obj: Optional file object to override the one provided at initialization.
+            pages: 0-based indices of the pages to classify, all if None.
+            
+        Returns:
+            The classification of each page, in page order.
+            
+        Raises:
+            ExtractionError: If the PDF cannot be read.
+        """
+        try:
+            file_to_use = self._validate_file_object(file_obj) if file_obj is not None else self.file_obj
+            return classify_pages(file_to_use, self.min_text_chars, pages)
+        except Exception as e:
+            if isinstance(e, ExtractionError):
+                raise
+            logger.error(f"Error classifying PDF pages: {e}")
+            raise ExtractionError(f"Failed to classify PDF pages: {e}") from e
+    
     def pdf_contains_text(self, file_obj: Union[str, BytesIO]) -> bool:
         """
         Check if a PDF file contains extractable text.
@@ -151,9 +481,144 @@ class PDFExtractor(BaseExtractor):
             True if the PDF contains extractable text, False otherwise.
         """
         try:
-            validated_file = self._validate_file_object(file_obj)
-            with pdfplumber.open(validated_file) as pdf:
-                return any(page.extract_text() for page in pdf.pages)
+            return any(page.fonts and page.chars for page in self.classify_pages(file_obj))
         except Exception as e:
             logger.warning(f"Error checking if PDF contains text: {e}")
-            return False 
\ No newline at end of file
+            return False
+
+
+def _runs(pages: Sequence[int]) -> Iterator[Tuple[int, int]]:
+    """Group ascending page indices into (first, last) runs of consecutive pages."""
+    first = last = None
+    for page in pages:
+        if last is not None and page == last + 1:
+            last = page
+            continue
+        if first is not None:
+            yield first, last
+        first = last = page
+    if first is not None:
+        yield first, last
+
+
+def _read_text_layer(
+    file_obj: Union[str, BinaryIO],
+    engine: str,
+    pages: Optional[range] = None
+) -> List[str]:
+    """Read the text layer of the given pages (0-based), or of every page, with an engine."""
+    return list(_iter_text_layer(file_obj, engine, pages))
+
+
+def _iter_text_layer(
+    file_obj: Union[str, BinaryIO],
+    engine: str,
+    pages: Optional[range] = None,
+    release: bool = False
+) -> Iterator[str]:
+    """
+    Yield the text layer of the given pages (0-based), or of every page, one page at a time.
+    
+    Each page's cached layout is flushed once its text is read. With `release`,
+    pages are also not kept by the PDF, and the objects pdfminer resolved for them
+    are dropped, so memory does not grow with the page count (see `_release_pages`).
+    """
+    if engine == "pdfium":
+        yield from _pdfium_text_layer(file_obj, pages)
+        return
+    if not isinstance(file_obj, str):
+        file_obj.seek(0)
+    with pdfplumber.open(file_obj, pages=[page + 1 for page in pages] if pages is not None else None) as pdf:
+        # The object cache is a pdfminer internal: without it, use the public API
+        if release and isinstance(getattr(pdf.doc, "_cached_objs", None), dict):
+            yield from _release_pages(pdf, pages)
+            return
+        for page in pdf.pages:
+            try:
+                text = page.extract_text() or ""
+            finally:
+                page.close()
+            yield text
+
+
+def _release_pages(pdf: pdfplumber.PDF, pages: Optional[range] = None) -> Iterator[str]:
+    """
+    Yield the text of the given pages (0-based), or of every page, keeping one page alive at a time.
+    
+    `pdf.pages` keeps every page of the document until the PDF is closed, and
+    pdfminer keeps every object it resolves, decoded content streams included.
+    Here each page is built from the page tree, closed once read, and pdfminer's
+    object cache is cleared before the next page.
+    """
+    doctop = 0
+    for index, page_obj in enumerate(PDFPage.create_pages(pdf.doc)):
+        if pages is not None and index >= pages.stop:
+            break
+        page = Page(pdf, page_obj, page_number=index + 1, initial_doctop=doctop)
+        doctop += page.height
+        if pages is not None and index not in pages:
+            continue
+        try:
+            text = page.extract_text() or ""
+        finally:
+            page.close()
+            pdf.doc._cached_objs.clear()
+        yield text
+
+
+def _iter_page_objects(path: str) -> Generator[PDFPage, None, None]:
+    """Yield the pdfminer page objects of a PDF in order, without caching the objects they use."""
+    with open(path, "rb") as f:
+        yield from PDFPage.create_pages(PDFDocument(PDFParser(f), caching=False))
+
+
+def _text_layer_range(task: Tuple[str, str, int, int]) -> List[str]:
+    """
+    Read the text layer of a range of pages in a worker process (see `PDFExtractor._text_layer_parallel`).
+    
+    Args:
+        task: The path of the PDF, the engine and the [start, end) page range
+        
+    Returns:
+        List[str]: The text of each page of the range
+    """
+    path, engine, start, end = task
+    return _read_text_layer(path, engine, range(start, end))
+
+
+def _page_count(file_obj: Union[str, BinaryIO]) -> int:
+    """Return the number of pages of a PDF from its page tree, without parsing the pages."""
+    if isinstance(file_obj, str):
+        with open(file_obj, "rb") as f:
+            return _page_count(f)
+    file_obj.seek(0)
+    document = PDFDocument(PDFParser(file_obj))
+    count = resolve1(dict_value(document.catalog.get("Pages")).get("Count"))
+    if isinstance(count, int):
+        return count
+    return sum(1 for _ in PDFPage.create_pages(document))
+
+
+def _pdfium_text_layer(file_obj: Union[str, BinaryIO], pages: Optional[range] = None) -> Iterator[str]:
+    """Yield the text layer of the given pages (0-based), or of every page, with PDFium."""
+    try:
+        import pypdfium2
+    except ImportError:
+        raise ExtractionError("pypdfium2 package is required for the 'pdfium' engine")
+    
+    if not isinstance(file_obj, str):
+        file_obj.seek(0)
+    pdf = pypdfium2.PdfDocument(file_obj)
+    try:
+        for index in pages if pages is not None else range(len(pdf)):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            # PDFium ends lines with CRLF
+            yield text.replace("\r\n", "\n").replace("\r", "\n")
+    finally:
+        pdf.close()
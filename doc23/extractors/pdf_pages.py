@@ -0,0 +1,261 @@
+"""
+Cheap classification of PDF pages as text, scanned or mixed.
+
+Deciding whether a page needs OCR by extracting its text runs pdfminer's full
+layout analysis. `classify_pages` instead reads each page's resources and
+skims its content stream for a few signals: the characters shown by text
+operators, the fonts used, and how much of the page image objects cover. No
+text is laid out and nothing is rendered.
+"""
+
+import re
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFStream, resolve1
+
+
+# Content stream tokens: strings, names, numbers and operators. Literal strings
+# with nested parentheses are split, which only blurs the estimates.
+_TOKEN = re.compile(
+    rb"\((?:\\.|[^\\()])*\)"
+    rb"|<[0-9A-Fa-f\s]*>"
+    rb"|/[^\s/\[\]()<>{}%]*"
+    rb"|[-+]?(?:\d+\.?\d*|\.\d+)"
+    rb"|[A-Za-z'\"][A-Za-z0-9*]*"
+    rb"|%[^\r\n]*",
+    re.S
+)
+_STRING = re.compile(rb"\((?:\\.|[^\\()])*\)|<[0-9A-Fa-f\s]*>")
+_NUMBER_START = frozenset(b"+-.0123456789")
+_SHOW_TEXT = frozenset((b"Tj", b"TJ", b"'", b'"'))
+
+# Forms nested deeper than this are ignored
+_MAX_FORM_DEPTH = 8
+
+# Share of the page that images must cover for a page with text to be 'mixed'
+MIXED_COVERAGE = 0.5
+
+Matrix = Tuple[float, float, float, float, float, float]
+_IDENTITY: Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+class PageClass(NamedTuple):
+    """
+    How a PDF page was classified, and the signals the label is based on.
+
+    Attributes:
+        label: 'text' (a usable text layer), 'scanned' (no text layer, only
+               images: needs OCR) or 'mixed' (a text layer over images covering
+               a large part of the page). Blank pages are 'text': there is
+               nothing to OCR.
+        chars: Estimated number of characters shown by text operators
+        image_coverage: Share of the page area covered by images, from 0 to 1
+        fonts: Whether the page has or selects fonts
+    """
+    label: str
+    chars: int
+    image_coverage: float
+    fonts: bool
+
+
+def classify_pages(
+    file_obj: Union[str, BinaryIO],
+    min_text_chars: int = 10,
+    pages: Optional[Sequence[int]] = None
+) -> List[PageClass]:
+    """
+    Classify the pages of a PDF from their resources and content streams.
+
+    Args:
+        file_obj: Path to the PDF or a seekable binary stream
+        min_text_chars: Fewer characters than this do not make a text layer
+        pages: 0-based indices of the pages to classify, all if None
+
+    Returns:
+        List[PageClass]: The classification of each page, in page order
+    """
+    if isinstance(file_obj, str):
+        with open(file_obj, "rb") as f:
+            return classify_pages(f, min_text_chars, pages)
+
+    file_obj.seek(0)
+    document = PDFDocument(PDFParser(file_obj))
+    wanted = set(pages) if pages is not None else None
+    result = []
+    for index, page in enumerate(PDFPage.create_pages(document)):
+        if wanted is None or index in wanted:
+            result.append(classify_page(page, min_text_chars))
+    return result
+
+
+def classify_page(page: PDFPage, min_text_chars: int = 10) -> PageClass:
+    """
+    Classify one pdfminer page.
+
+    Args:
+        page: The page
+        min_text_chars: Fewer characters than this do not make a text layer
+
+    Returns:
+        PageClass: The classification of the page
+    """
+    resources = _dict(page.resources)
+    data = b"".join(
+        stream.get_data() for stream in map(resolve1, page.contents)
+        if isinstance(stream, PDFStream)
+    )
+    fonts = bool(_dict(resources.get("Font")))
+
+    if b"BI" not in data and (b"Do" not in data or not _may_draw_images(resources)):
+        # No images can be drawn, whatever the resources declare: only count the
+        # characters of the strings
+        chars = sum(map(_string_length, _STRING.findall(data)))
+        coverage = 0.0
+    else:
+        scan = _ContentScan()
+        scan.run(data, resources, _IDENTITY, 0)
+        chars, coverage = scan.chars, scan.image_area / _area(page)
+        fonts = fonts or scan.fonts
+
+    coverage = min(coverage, 1.0)
+    if fonts and chars >= min_text_chars:
+        label = "mixed" if coverage >= MIXED_COVERAGE else "text"
+    else:
+        label = "scanned" if coverage > 0 else "text"
+    return PageClass(label, chars, coverage, fonts)
+
+
+class _ContentScan:
+    """Walks content streams, tracking the transformation matrix, to measure text and images."""
+
+    def __init__(self):
+        self.chars = 0
+        self.image_area = 0.0
+        self.fonts = False
+        self._forms: set = set()
+
+    def run(self, data: bytes, resources: Dict[Any, Any], ctm: Matrix, depth: int) -> None:
+        xobjects = _dict(resources.get("XObject"))
+        stack: List[Matrix] = []
+        numbers: List[float] = []
+        name = None
+        shown = 0
+        pos = 0
+        while True:
+            match = _TOKEN.search(data, pos)
+            if match is None:
+                return
+            pos = match.end()
+            token = match.group()
+            first = token[0]
+
+            if first == 0x28 or first == 0x3C:  # ( or <
+                shown += _string_length(token)
+                continue
+            if first == 0x2F:  # /
+                name = token[1:].decode("latin-1")
+                continue
+            if first in _NUMBER_START:
+                numbers.append(float(token))
+                continue
+            if first == 0x25:  # %
+                continue
+
+            if token in _SHOW_TEXT:
+                self.chars += shown
+            elif token == b"q":
+                stack.append(ctm)
+            elif token == b"Q":
+                if stack:
+                    ctm = stack.pop()
+            elif token == b"cm":
+                if len(numbers) >= 6:
+                    ctm = _multiply(tuple(numbers[-6:]), ctm)
+            elif token == b"Tf":
+                self.fonts = True
+            elif token == b"Do" and name is not None:
+                self._draw(xobjects.get(name), resources, ctm, depth)
+            elif token == b"BI":
+                # Inline image: skip its data, which ends at EI
+                self.image_area += abs(ctm[0] * ctm[3] - ctm[1] * ctm[2])
+                end = data.find(b"EI", pos)
+                pos = len(data) if end < 0 else end + 2
+            numbers.clear()
+            name = None
+            shown = 0
+
+    def _draw(self, xobject: Any, resources: Dict[Any, Any], ctm: Matrix, depth: int) -> None:
+        stream = resolve1(xobject)
+        if not isinstance(stream, PDFStream):
+            return
+        subtype = getattr(resolve1(stream.get("Subtype")), "name", None)
+        if subtype == "Image":
+            self.image_area += abs(ctm[0] * ctm[3] - ctm[1] * ctm[2])
+        elif subtype == "Form" and depth < _MAX_FORM_DEPTH and id(stream) not in self._forms:
+            # Forms being drawn, so a form drawing itself is not followed
+            self._forms.add(id(stream))
+            matrix = resolve1(stream.get("Matrix"))
+            if isinstance(matrix, list) and len(matrix) == 6:
+                ctm = _multiply(tuple(float(resolve1(v)) for v in matrix), ctm)
+            form_resources = _dict(stream.get("Resources")) or resources
+            self.fonts = self.fonts or bool(_dict(form_resources.get("Font")))
+            self.run(stream.get_data(), form_resources, ctm, depth + 1)
+            self._forms.discard(id(stream))
+
+
+def _may_draw_images(resources: Dict[Any, Any], depth: int = 0) -> bool:
+    """Check whether any XObject in the resources is an image, or a form that may draw one."""
+    for xobject in _dict(resources.get("XObject")).values():
+        stream = resolve1(xobject)
+        if not isinstance(stream, PDFStream):
+            continue
+        subtype = getattr(resolve1(stream.get("Subtype")), "name", None)
+        if subtype == "Image":
+            return True
+        if subtype == "Form":
+            if depth >= _MAX_FORM_DEPTH or b"BI" in stream.get_data():
+                return True
+            # Forms without resources use the page's, which are being checked already
+            if _may_draw_images(_dict(stream.get("Resources")), depth + 1):
+                return True
+    return False
+
+
+def _dict(value: Any) -> Dict[Any, Any]:
+    """Resolve a PDF object expected to be a dictionary, or return an empty one."""
+    value = resolve1(value)
+    return value if isinstance(value, dict) else {}
+
+
+def _string_length(token: bytes) -> int:
+    """Approximate number of bytes in a literal or hex string token."""
+    if token[0] == 0x28:
+        return len(token) - 2 - token.count(b"\\")
+    return len(token[1:-1].translate(None, b" \t\r\n\f")) // 2
+
+
+def _multiply(m: Matrix, n: Matrix) -> Matrix:
+    """Return the matrix product m × n, as used by the cm operator (m concatenated to n)."""
+    a1, b1, c1, d1, e1, f1 = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a1 * a2 + b1 * c2,
+        a1 * b2 + b1 * d2,
+        c1 * a2 + d1 * c2,
+        c1 * b2 + d1 * d2,
+        e1 * a2 + f1 * c2 + e2,
+        e1 * b2 + f1 * d2 + f2,
+    )
+
+
+def _area(page: PDFPage) -> float:
+    """Area of the page's visible box, in default user space units."""
+    try:
+        x0, y0, x1, y1 = (float(resolve1(v)) for v in page.cropbox)
+        area = abs((x1 - x0) * (y1 - y0))
+    except (TypeError, ValueError):
+        area = 0.0
+    return area or 612.0 * 792.0
@@ -11,6 +11,7 @@ from striprtf.striprtf import rtf_to_text
 
 from doc23.exceptions import ExtractionError
 from doc23.extractors.base import BaseExtractor
+from doc23.inputs import read_text
 
 
 logger = logging.getLogger(__name__)
@@ -64,14 +65,8 @@ class RTFExtractor(BaseExtractor):
             file_to_use = file_obj if file_obj is not None else self.file_obj
             scan_to_use = scan_or_image if scan_or_image is not None else self.scan_or_image
             
-            # Handle file paths
-            if isinstance(file_to_use, str):
-                with open(file_to_use, "r", encoding="utf-8", errors="ignore") as f:
-                    rtf_content = f.read()
-            # Handle file-like objects
-            else:
-                file_to_use.seek(0)
-                rtf_content = file_to_use.read().decode("utf-8", errors="ignore")
+            # Decodes paths and streams alike, without copying in-memory content
+            rtf_content = read_text(file_to_use, "utf-8", errors="ignore")
             
             # Convert RTF to plain text
             text = rtf_to_text(rtf_content)
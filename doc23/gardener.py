@@ -1,6 +1,148 @@
+import os
 import re
-from typing import Dict, Any, List, Optional, Tuple
-from doc23.config_tree import Config, LevelConfig
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from doc23.config_tree import Config
+from doc23.patterns import LINE_BREAK, LINE_BREAKS, LineClassifier, compile_pattern
+
+if TYPE_CHECKING:
+    from doc23.compact import CompactTree
+
+
+class LevelPlan(NamedTuple):
+    """
+    Everything the parsing loop needs to know about a level, resolved once from the Config.
+    
+    Attributes:
+        name: The level name
+        rank: Position of the level in the hierarchy (lower is outer)
+        is_leaf: Whether the level is explicitly or implicitly a leaf
+        title_field: Field for the first captured group (skipped if empty)
+        description_field: Field for the second captured group, or None
+        paragraph_field: List field created on every node, or None
+        sections_field: List field created on every node, or None
+        text_field: Field receiving free text: paragraph_field for leaves that have one,
+                    else description_field; None if free text is discarded
+        text_is_paragraph: Whether free text is appended to a list rather than joined
+        insert_field: For each possible parent, indexed by its rank, the field of the
+                      parent this level's nodes are inserted into
+    """
+    name: str
+    rank: int
+    is_leaf: bool
+    title_field: str
+    description_field: Optional[str]
+    paragraph_field: Optional[str]
+    sections_field: Optional[str]
+    text_field: Optional[str]
+    text_is_paragraph: bool
+    insert_field: Tuple[str, ...]
+
+
+class CompiledConfig(NamedTuple):
+    """Everything a Gardener derives from its Config, shared by Gardeners of equal configs."""
+    patterns: Dict[str, re.Pattern]
+    rank: Dict[str, int]
+    leaf: Optional[str]
+    plans: Dict[str, LevelPlan]
+    classifier: LineClassifier[LevelPlan]
+
+
+class _CompiledConfigCache:
+    """
+    Process-wide LRU cache of CompiledConfig, keyed by `Config.fingerprint()`.
+    
+    Attributes:
+        maxsize: The number of configs kept before the least recently used is evicted
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Any, ...], CompiledConfig]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[CompiledConfig]:
+        """Return the cached entry for a fingerprint, marking it as recently used."""
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+            return compiled
+
+    def put(self, key: Tuple[Any, ...], compiled: CompiledConfig) -> None:
+        """Store an entry, evicting the least recently used ones beyond `maxsize`."""
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+compiled_configs = _CompiledConfigCache()
+
+
+class PruneHandler:
+    """
+    Receives the structure of a document as a stream of events.
+    
+    `Gardener.parse` walks the text with the same logic `prune` uses and calls these
+    methods instead of building a dictionary tree. Subclass it and override the
+    events you need; the defaults do nothing.
+    
+    Events arrive in document order and are properly nested: every `start_node`
+    is matched by an `end_node` for the same level, and `end_document` comes last.
+    
+    Attributes:
+        offset: When parsing with `locate=True`, the character offset in the text
+                where the current `start_node` (the start of the heading line) or
+                `end_node` (the start of the line that closes it, or the end of the
+                text) happens
+    """
+
+    offset: int = 0
+
+    def start_node(self, level: str, fields: Dict[str, Any]) -> None:
+        """
+        A heading opened a new node.
+        
+        Args:
+            level: The level name of the node
+            fields: The fields captured from the heading, keyed by the level's
+                    title_field and description_field
+        """
+
+    def text(self, line: str) -> None:
+        """
+        A line of free text belongs to the innermost open node, or to the root if none is open.
+        
+        Only emitted for text the tree would store, i.e. when the open node has a
+        paragraph_field (leaf levels) or a description_field.
+        
+        Args:
+            line: The stripped, non-empty line
+        """
+
+    def end_node(self, level: str) -> None:
+        """
+        The innermost open node was closed.
+        
+        Args:
+            level: The level name of the node
+        """
+
+    def end_document(self) -> None:
+        """The whole text has been parsed and every node has been closed."""
 
 
 class Gardener:
@@ -16,6 +158,9 @@ class Gardener:
         patterns: Compiled regex patterns for each level type
         rank: Dictionary mapping level names to their rank in the hierarchy
         leaf: Automatically inferred leaf level name
+        plans: Per-level parsing plan, in rank order
+        classifier: Matches lines against the level patterns in rank order, skipping
+                    levels whose pattern cannot match the line's first character
     """
 
     def __init__(self, shears: Config):
@@ -26,16 +171,43 @@ class Gardener:
             shears: Configuration object with level definitions and field mappings
         """
         self.cfg = shears
-        self.patterns: dict[str, re.Pattern] = {
-            name: re.compile(lvl.pattern, re.MULTILINE)
+        # Equal configs share their compiled patterns, plans and classifier
+        key = shears.fingerprint()
+        compiled = compiled_configs.get(key)
+        if compiled is None:
+            compiled = self._compile()
+            compiled_configs.put(key, compiled)
+        self.patterns, self.rank, self.leaf, self.plans, self.classifier = compiled
+
+    def _compile(self) -> CompiledConfig:
+        """
+        Compile the level patterns and resolve the configuration into level plans.
+        
+        Returns:
+            CompiledConfig: The patterns, rank, leaf, plans and classifier of the config
+        """
+        patterns = {
+            name: compile_pattern(lvl.pattern)
             for name, lvl in self.cfg.levels.items()
         }
-        self.rank: dict[str, int] = {
+        rank = {
             name: idx for idx, name in enumerate(self.cfg.levels.keys())
         }
-        self.leaf = self._infer_leaf()
+        leaf = self._infer_leaf()
+        plans = self._build_plans(rank, leaf)
+        # The classifier hands back the plan of the matching level directly
+        classifier = LineClassifier(
+            [(plan, patterns[name]) for name, plan in plans.items()]
+        )
+        return CompiledConfig(patterns, rank, leaf, plans, classifier)
 
-    def prune(self, bush: str) -> Dict[str, Any]:
+    def prune(
+        self,
+        bush: str,
+        scan: str = "lines",
+        spans: bool = False,
+        page_starts: Optional[Sequence[int]] = None
+    ) -> Dict[str, Any]:
         """
         Parse the input text and return a structured document dictionary.
         
@@ -44,119 +216,456 @@ class Gardener:
         
         Args:
             bush: The input text to parse and structure
+            scan: How to walk the text:
+                  - 'lines' (default): split the text into lines and classify each one
+                  - 'buffer': search the whole buffer for heading lines and only slice
+                    out the text between them when a field stores it. Uses far fewer
+                    allocations on large inputs and produces the same output. Falls back
+                    to 'lines' when a level pattern may start with any character.
+            spans: If True, every node gets a "span" entry with the (start, end)
+                   character offsets it covers in `bush`, from the start of its heading
+                   line to the start of the line that closes it
+            page_starts: Offsets in `bush` where each page starts, in order. With
+                         `spans`, every node also gets a "pages" entry with the
+                         (first, last) 1-based page numbers it covers
             
         Returns:
             Dict[str, Any]: A hierarchical dictionary representing the document structure
                             with exact field names from the configuration
         """
-        # Create a root node that reflects the configuration
-        root: Dict[str, Any] = {
-            "document_name": self.cfg.root_name,  # Use root_name from config as type
-            self.cfg.description_field: "",  # Use the exact description_field name
-            self.cfg.sections_field: []  # Use the exact sections_field name
-        }
+        builder = TreeBuilder(self, spans=spans, page_starts=page_starts)
+        self.parse(bush, builder, scan=scan, locate=spans)
+        return builder.root
 
-        if not bush.strip():
-            return root
+    def prune_compact(
+        self,
+        bush: str,
+        scan: str = "lines",
+        spans: bool = False,
+        page_starts: Optional[Sequence[int]] = None
+    ) -> "CompactTree":
+        """
+        Parse the input text into a compact, array-backed tree.
+        
+        The result reads like the dictionary `prune` returns (it is a mapping view of
+        the root) but stores each node in a few parallel arrays instead of a dict,
+        which takes a fraction of the memory. Call `to_dict()` on it, or on any of
+        its nodes, to materialize dictionaries on demand.
+        
+        With `spans`, the tree records each node's (start, end) offsets in `bush` in
+        two more arrays, so consumers can slice the source text themselves.
+        
+        Args:
+            bush: The input text to parse and structure
+            scan: 'lines' (default) or 'buffer', see `prune`
+            spans: Record source spans (and pages), see `prune`
+            page_starts: Offsets in `bush` where each page starts, see `prune`
+            
+        Returns:
+            CompactTree: The document tree
+        """
+        # Import here to avoid circular imports
+        from doc23.compact import CompactBuilder
 
-        stack: List[Tuple[str, Dict[str, Any]]] = []
+        builder = CompactBuilder(self, spans=spans, page_starts=page_starts)
+        self.parse(bush, builder, scan=scan, locate=spans)
+        return builder.tree
 
-        for raw in bush.splitlines():
-            line = raw.strip()
-            if not line:
-                continue
+    def prune_parallel(
+        self,
+        bush: str,
+        workers: Optional[int] = None,
+        scan: str = "lines",
+        executor: Optional[Executor] = None
+    ) -> Dict[str, Any]:
+        """
+        Prune a large text in several processes and return the same tree as `prune`.
+        
+        A top-level heading closes every open node, so the text is cut right before
+        top-level headings into shards that parse independently. Each shard holds a
+        run of whole top-level sections of roughly equal size. The first shard also
+        holds the text before the first top-level heading, which therefore still
+        ends up in the root description. The shards are pruned in a process pool and
+        their sections are stitched back together in document order.
+        
+        Shipping the shards to worker processes costs a copy of the text, so this
+        only pays off for inputs of many megabytes.
+        
+        Args:
+            bush: The input text to parse and structure
+            workers: Number of worker processes (defaults to the CPU count)
+            scan: 'lines' (default) or 'buffer', see `prune`
+            executor: An existing executor to run the shards on, instead of a
+                      process pool created for this call
+            
+        Returns:
+            Dict[str, Any]: The tree `prune(bush)` returns
+        """
+        if scan not in ("lines", "buffer"):
+            raise ValueError("scan must be 'lines' or 'buffer'")
+        workers = workers or os.cpu_count() or 1
 
-            level_name, match = self._match_level(line)
-            if level_name:
-                lvl_cfg = self.cfg.levels[level_name]
+        shards = self._shards(bush, workers * 4) if workers > 1 or executor is not None else []
+        if len(shards) < 2:
+            return self.prune(bush, scan=scan)
 
-                while stack and self.rank[stack[-1][0]] >= self.rank[level_name]:
-                    stack.pop()
+        tasks = [(self.cfg, bush[start:end], scan) for start, end in shards]
+        if executor is not None:
+            trees = list(executor.map(_prune_shard, tasks))
+        else:
+            # Imported here: multiprocessing is slow to import and rarely needed
+            from concurrent.futures import ProcessPoolExecutor
 
-                node = self._build_node(lvl_cfg, match)
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+                trees = list(pool.map(_prune_shard, tasks))
 
-                if stack:
-                    parent_name, parent_node = stack[-1]
-                    parent_cfg = self.cfg.levels[parent_name]
+        # Shards after the first start with a top-level heading, so their root only
+        # has sections
+        root = trees[0]
+        sections = root[self.cfg.sections_field]
+        for tree in trees[1:]:
+            sections.extend(tree[self.cfg.sections_field])
+        return root
 
-                    # Allow inserting leaf nodes in parent's paragraph_field
-                    if self._is_leaf(level_name) and parent_cfg.paragraph_field:
-                        parent_node.setdefault(parent_cfg.paragraph_field, []).append(node)
-                    elif lvl_cfg.parent == parent_name:
-                        field = parent_cfg.sections_field or "sections"
-                        parent_node.setdefault(field, []).append(node)
-                    else:
-                        field = parent_cfg.sections_field or "sections"
-                        parent_node.setdefault(field, []).append(node)
-                else:
-                    root[self.cfg.sections_field].append(node)
+    def parse(self, bush: str, handler: PruneHandler, scan: str = "lines", locate: bool = False) -> None:
+        """
+        Parse the input text and report its structure to an event handler.
+        
+        This walks the text exactly like `prune` but never builds the dictionary
+        tree, which makes it suitable for counting, indexing or writing nodes
+        straight to a sink.
+        
+        Args:
+            bush: The input text to parse
+            handler: Receives start_node / text / end_node events
+            scan: 'lines' (default) or 'buffer', see `prune`
+            locate: Keep `handler.offset` up to date for start_node and end_node events
+        """
+        if scan not in ("lines", "buffer"):
+            raise ValueError("scan must be 'lines' or 'buffer'")
+
+        # Same as `bush.strip()` without copying the text
+        if bush and not bush.isspace():
+            stack: List[LevelPlan] = []
+            if scan == "buffer" and self.classifier.scanner is not None:
+                self._scan_buffer(bush, handler, stack, locate)
+            elif locate:
+                self._walk_located(bush, handler, stack)
+            else:
+                self._walk(bush.splitlines(), handler, stack)
+            self._close(handler, stack, len(bush) if locate else None)
+        handler.end_document()
 
-                stack.append((level_name, node))
+    def prune_iter(self, chunks: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Parse text arriving in pieces and yield the document one top-level node at a time.
+        
+        The chunks are read as if concatenated, so a line may span several chunks and
+        lines must keep their line endings (as when iterating over a text file). Only
+        the path of currently open nodes is kept in memory: each top-level node is
+        yielded as soon as the next top-level heading (or the end of the input) closes it.
+        
+        The first item yielded is always the root node, with its description complete
+        and an empty sections list; it is followed by the top-level nodes in order.
+        Re-attaching them to the root gives exactly what `prune` returns for the
+        concatenated text.
+        
+        Args:
+            chunks: Any iterable of text pieces (lines, blocks, a text file...)
+            
+        Yields:
+            Dict[str, Any]: The root node, then each finished top-level node
+        """
+        builder = TreeBuilder(self)
+        root = builder.root
+        sections = root[self.cfg.sections_field]
+        stack: List[LevelPlan] = []
+        root_sent = False
+        pending = ""
+
+        for chunk in chunks:
+            if not chunk:
                 continue
+            lines = (pending + chunk).splitlines()
+            # The last line continues in the next chunk unless the chunk ends a line.
+            # A "\r\n" split across chunks only adds an empty line, which is skipped.
+            pending = lines.pop() if lines and chunk[-1] not in LINE_BREAKS else ""
+            self._walk(lines, builder, stack)
 
-            # Free text
-            if stack:
-                top_name, top_node = stack[-1]
-                top_cfg = self.cfg.levels[top_name]
+            if sections and not root_sent:
+                yield {**root, self.cfg.sections_field: []}
+                root_sent = True
+            while len(sections) > 1:
+                yield sections.pop(0)
 
-                if self._is_leaf(top_name) and top_cfg.paragraph_field:
-                    top_node[top_cfg.paragraph_field].append(line)
-                elif top_cfg.description_field:
-                    sep = " " if top_node[top_cfg.description_field] else ""
-                    top_node[top_cfg.description_field] += sep + line
-            else:
-                sep = " " if root[self.cfg.description_field] else ""
-                root[self.cfg.description_field] += sep + line
+        if pending:
+            self._walk([pending], builder, stack)
+        self._close(builder, stack)
+        builder.end_document()
+        if not root_sent:
+            yield {**root, self.cfg.sections_field: []}
+        yield from sections
 
-        return root
+    def _shards(self, bush: str, count: int) -> List[Tuple[int, int]]:
+        """
+        Cut the text before top-level headings into about `count` similarly sized shards.
+        
+        Args:
+            bush: The input text
+            count: The number of shards wanted
+            
+        Returns:
+            List[Tuple[int, int]]: (start, end) offsets of consecutive shards covering the text
+        """
+        starts = self._top_level_starts(bush)
+        if not starts:
+            return [(0, len(bush))]
 
-    def _match_level(self, line: str) -> Tuple[Optional[str], Optional[re.Match]]:
+        size = len(bush) / count
+        shards = []
+        begin = 0
+        for start in starts:
+            if start - begin >= size:
+                shards.append((begin, start))
+                begin = start
+        shards.append((begin, len(bush)))
+        return shards
+
+    def _top_level_starts(self, bush: str) -> List[int]:
         """
-        Try matching the line against all level patterns in priority order.
+        Find the start offset of every line that opens a top-level node.
         
         Args:
-            line: The text line to match against patterns
+            bush: The input text
             
         Returns:
-            Tuple containing the matched level name and the match object, or (None, None) if no match
+            List[int]: Line start offsets, in increasing order
+        """
+        top = next(iter(self.plans.values()), None)
+        if top is None:
+            return []
+
+        # Only the top-level pattern is needed to find candidate lines
+        classifier = LineClassifier([(top, self.patterns[top.name])])
+        classify = self.classifier.match
+        find_break = LINE_BREAK.search
+        starts = []
+        if classifier.scanner is not None:
+            for start in classifier.candidates(bush):
+                brk = find_break(bush, start)
+                line = bush[start:brk.start() if brk else len(bush)].strip()
+                if classify(line)[0] is top:
+                    starts.append(start)
+        else:
+            offset = 0
+            for raw in bush.splitlines(keepends=True):
+                line = raw.strip()
+                if line and classify(line)[0] is top:
+                    starts.append(offset)
+                offset += len(raw)
+        return starts
+
+    def _walk(self, lines: Iterable[str], handler: PruneHandler, stack: List[LevelPlan]) -> None:
+        """
+        Classify raw lines one by one and report headings and free text.
+        
+        Args:
+            lines: Raw lines, without line endings
+            handler: The event handler
+            stack: The plans of the open nodes, outermost first
+        """
+        classify = self.classifier.match
+        on_text = handler.text
+        for raw in lines:
+            line = raw.strip()
+            if not line:
+                continue
+
+            plan, groups = classify(line)
+            if plan is not None:
+                self._open(handler, stack, plan, groups)
+            elif not stack or stack[-1].text_field is not None:
+                on_text(line)
+
+    def _walk_located(self, bush: str, handler: PruneHandler, stack: List[LevelPlan]) -> None:
+        """
+        Same as `_walk` over the lines of `bush`, also tracking the offset of each heading line.
+        
+        Args:
+            bush: The input text
+            handler: The event handler
+            stack: The plans of the open nodes, outermost first
+        """
+        classify = self.classifier.match
+        on_text = handler.text
+        offset = 0
+        for raw in bush.splitlines(keepends=True):
+            start = offset
+            offset += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+
+            plan, groups = classify(line)
+            if plan is not None:
+                self._open(handler, stack, plan, groups, start)
+            elif not stack or stack[-1].text_field is not None:
+                on_text(line)
+
+    def _scan_buffer(self, bush: str, handler: PruneHandler, stack: List[LevelPlan], locate: bool = False) -> None:
+        """
+        Walk the text by searching the whole buffer for heading lines.
+        
+        The classifier finds every line whose first character could start a heading;
+        each candidate line is then classified exactly as in line mode. The text
+        between two headings is only sliced and split when the open node stores it.
+        
+        Args:
+            bush: The input text
+            handler: The event handler
+            stack: The plans of the open nodes, outermost first
+            locate: Report the offset of each heading line
         """
-        for name in self.rank:
-            m = self.patterns[name].match(line)
-            if m:
-                return name, m
-        return None, None
+        classify = self.classifier.match
+        pos = 0
+        find_break = LINE_BREAK.search
+        for start in self.classifier.candidates(bush):
+            brk = find_break(bush, start)
+            end = brk.start() if brk else len(bush)
+
+            plan, groups = classify(bush[start:end].strip())
+            if plan is None:
+                continue
+
+            if start > pos and (not stack or stack[-1].text_field is not None):
+                self._walk_block(bush[pos:start], handler)
+            self._open(handler, stack, plan, groups, start if locate else None)
+            pos = end
+
+        if pos < len(bush) and (not stack or stack[-1].text_field is not None):
+            self._walk_block(bush[pos:], handler)
+
+    def _walk_block(self, block: str, handler: PruneHandler) -> None:
+        """
+        Report every non-empty line of a block of free text.
+        
+        Args:
+            block: Raw text between two headings
+            handler: The event handler
+        """
+        for raw in block.splitlines():
+            line = raw.strip()
+            if line:
+                handler.text(line)
 
-    def _build_node(self, lvl: LevelConfig, m: re.Match) -> Dict[str, Any]:
+    def _open(
+        self,
+        handler: PruneHandler,
+        stack: List[LevelPlan],
+        plan: LevelPlan,
+        groups: Optional[Tuple[Any, ...]],
+        offset: Optional[int] = None
+    ) -> None:
         """
-        Construct a node dictionary from the regex match according to LevelConfig.
+        Close the open nodes of equal or lower rank and open a node for a heading.
         
         Args:
-            lvl: The level configuration
-            m: The regex match object
+            handler: The event handler
+            stack: The plans of the open nodes, outermost first
+            plan: The plan of the level the heading matched
+            groups: The capture groups of the level pattern
+            offset: Offset of the heading line, reported as `handler.offset`
+        """
+        if offset is not None:
+            handler.offset = offset
+        rank = plan.rank
+        while stack and stack[-1].rank >= rank:
+            handler.end_node(stack.pop().name)
+
+        handler.start_node(plan.name, self._node_fields(plan, groups))
+        stack.append(plan)
+
+    def _close(self, handler: PruneHandler, stack: List[LevelPlan], offset: Optional[int] = None) -> None:
+        """
+        Close every node still open at the end of the text, innermost first.
+        
+        Args:
+            handler: The event handler
+            stack: The plans of the open nodes, outermost first
+            offset: Offset of the end of the text, reported as `handler.offset`
+        """
+        if offset is not None:
+            handler.offset = offset
+        while stack:
+            handler.end_node(stack.pop().name)
+
+    def _node_fields(self, lvl: LevelPlan, groups: Optional[Tuple[Any, ...]]) -> Dict[str, Any]:
+        """
+        Extract the fields of a node from the captured groups according to its level plan.
+        
+        Args:
+            lvl: The level plan
+            groups: The capture groups of the level pattern
             
         Returns:
-            Dict[str, Any]: A dictionary representing the node with appropriate fields
+            Dict[str, Any]: The title and description fields the level defines
         """
-        node: Dict[str, Any] = {"type": lvl.name}
-        groups = m.groups()
-        title = groups[0] if groups else m.group(0)
-        tail = groups[1] if len(groups) > 1 else ""
+        fields: Dict[str, Any] = {}
+        # LevelConfig requires a group whenever title_field is set
+        title = groups[0] if groups else None
+        tail = groups[1] if groups and len(groups) > 1 else ""
 
         if lvl.title_field:
-            node[lvl.title_field] = title.strip()
+            fields[lvl.title_field] = title.strip()
 
         if lvl.description_field is not None:
-            node[lvl.description_field] = tail.strip()
+            fields[lvl.description_field] = tail.strip()
+
+        return fields
 
-        if lvl.paragraph_field is not None:
-            node[lvl.paragraph_field] = []
+    def _build_plans(self, rank: Dict[str, int], leaf: Optional[str]) -> Dict[str, LevelPlan]:
+        """
+        Resolve the configuration of every level into a LevelPlan.
+        
+        Args:
+            rank: Dictionary mapping level names to their rank in the hierarchy
+            leaf: The inferred leaf level name
+            
+        Returns:
+            Dict[str, LevelPlan]: Plans keyed by level name, in rank order
+        """
+        levels = [self.cfg.levels[name] for name in rank]
+        plans: Dict[str, LevelPlan] = {}
+        for lvl in levels:
+            is_leaf = getattr(lvl, "is_leaf", False) or lvl.name == leaf
+            text_field: Optional[str]
+            if is_leaf and lvl.paragraph_field:
+                text_field, text_is_paragraph = lvl.paragraph_field, True
+            else:
+                text_field, text_is_paragraph = lvl.description_field or None, False
 
-        if lvl.sections_field is not None:
-            node[lvl.sections_field] = []
+            # Allow inserting leaf nodes in parent's paragraph_field
+            insert_field = tuple(
+                parent.paragraph_field if is_leaf and parent.paragraph_field
+                else parent.sections_field or "sections"
+                for parent in levels
+            )
 
-        return node
+            plans[lvl.name] = LevelPlan(
+                name=lvl.name,
+                rank=rank[lvl.name],
+                is_leaf=is_leaf,
+                title_field=lvl.title_field,
+                description_field=lvl.description_field,
+                paragraph_field=lvl.paragraph_field,
+                sections_field=lvl.sections_field,
+                text_field=text_field,
+                text_is_paragraph=text_is_paragraph,
+                insert_field=insert_field,
+            )
+        return plans
 
-    def _infer_leaf(self) -> str:
+    def _infer_leaf(self) -> Optional[str]:
         """
         Return the level name explicitly marked as leaf, or infer the one not used as parent.
         
@@ -167,9 +676,9 @@ class Gardener:
             if getattr(lvl, "is_leaf", False):
                 return name
 
+        # Pick the first candidate in config order, so every process agrees on it
         parents = {lvl.parent for lvl in self.cfg.levels.values() if lvl.parent}
-        leaves = set(self.cfg.levels) - parents
-        return next(iter(leaves), None)
+        return next((name for name in self.cfg.levels if name not in parents), None)
 
     def _is_leaf(self, level_name: str) -> bool:
         """
@@ -182,3 +691,142 @@ class Gardener:
             bool: True if the level is a leaf, False otherwise
         """
         return getattr(self.cfg.levels[level_name], "is_leaf", False) or level_name == self.leaf
+
+
+class TreeBuilder(PruneHandler):
+    """
+    Event handler that builds the dictionary tree returned by `Gardener.prune`.
+    
+    Free text destined for a description is collected in a per-node list and joined
+    once, when the node is closed (or, for the root, when its first section opens).
+    Growing the string line by line would copy it again for every line.
+    
+    Attributes:
+        root: The root node of the document being built
+    """
+
+    def __init__(
+        self,
+        gardener: Gardener,
+        spans: bool = False,
+        page_starts: Optional[Sequence[int]] = None
+    ):
+        """
+        Initialize the builder with an empty root node.
+        
+        Args:
+            gardener: The Gardener whose configuration shapes the tree
+            spans: Add "span" (and "pages", with page_starts) entries to every node,
+                   from the `offset` of its start_node and end_node events
+            page_starts: Offsets where each page of the text starts
+        """
+        self.cfg = gardener.cfg
+        self._plans = gardener.plans
+        self.spans = spans
+        self.page_starts = page_starts
+        # Create a root node that reflects the configuration
+        self.root: Dict[str, Any] = {
+            "document_name": self.cfg.root_name,  # Use root_name from config as type
+            self.cfg.description_field: "",  # Use the exact description_field name
+            self.cfg.sections_field: []  # Use the exact sections_field name
+        }
+        self._root_text: List[str] = []
+        # (plan, node, pending description lines, start offset) for each open node
+        self._stack: List[Tuple[LevelPlan, Dict[str, Any], List[str], int]] = []
+
+    def start_node(self, level: str, fields: Dict[str, Any]) -> None:
+        """Create the node and insert it under its parent (or the root)."""
+        plan = self._plans[level]
+        node: Dict[str, Any] = {"type": level, **fields}
+        if plan.paragraph_field is not None:
+            node[plan.paragraph_field] = []
+        if plan.sections_field is not None:
+            node[plan.sections_field] = []
+
+        if self._stack:
+            parent, parent_node = self._stack[-1][:2]
+            parent_node.setdefault(plan.insert_field[parent.rank], []).append(node)
+        else:
+            # Root text only ever comes before the first section
+            self._flush_root()
+            self.root[self.cfg.sections_field].append(node)
+
+        self._stack.append((plan, node, [], self.offset))
+
+    def text(self, line: str) -> None:
+        """Append the line to the open node's paragraphs or description, or to the root description."""
+        if self._stack:
+            plan, node, pending, _ = self._stack[-1]
+            if plan.text_is_paragraph:
+                node[plan.text_field].append(line)
+            elif plan.text_field is not None:
+                pending.append(line)
+        else:
+            self._root_text.append(line)
+
+    def end_node(self, level: str) -> None:
+        """Join the node's pending description; it is already attached to its parent."""
+        plan, node, pending, start = self._stack.pop()
+        if pending:
+            node[plan.text_field] = self._join(node[plan.text_field], pending)
+        if self.spans:
+            node["span"] = (start, self.offset)
+            if self.page_starts:
+                node["pages"] = page_range(self.page_starts, start, self.offset)
+
+    def end_document(self) -> None:
+        """Join the root description if the document had no sections."""
+        self._flush_root()
+
+    def _flush_root(self) -> None:
+        """Move the pending root text into the root description."""
+        if self._root_text:
+            field = self.cfg.description_field
+            self.root[field] = self._join(self.root[field], self._root_text)
+            self._root_text = []
+
+    @staticmethod
+    def _join(current: str, lines: List[str]) -> str:
+        """
+        Append lines to a description, separated by single spaces.
+        
+        Args:
+            current: The description so far (possibly empty)
+            lines: Non-empty lines to append
+            
+        Returns:
+            str: The extended description
+        """
+        return " ".join([current, *lines]) if current else " ".join(lines)
+
+
+def _prune_shard(task: Tuple[Config, str, str]) -> Dict[str, Any]:
+    """
+    Prune one shard of a text in a worker process (see `Gardener.prune_parallel`).
+    
+    Args:
+        task: The config, the shard text and the scan mode
+        
+    Returns:
+        Dict[str, Any]: The tree of the shard
+    """
+    cfg, bush, scan = task
+    # The worker's compiled-config cache makes this cheap after the first shard
+    return Gardener(cfg).prune(bush, scan=scan)
+
+
+def page_range(page_starts: Sequence[int], start: int, end: int) -> Tuple[int, int]:
+    """
+    Return the 1-based (first, last) pages covered by the span [start, end).
+    
+    Args:
+        page_starts: Offsets where each page starts, in order
+        start: Start offset of the span
+        end: End offset of the span
+        
+    Returns:
+        Tuple[int, int]: The first and last page numbers
+    """
+    first = max(bisect_right(page_starts, start), 1)
+    last = max(bisect_right(page_starts, max(end - 1, start)), first)
+    return first, last
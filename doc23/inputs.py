@@ -0,0 +1,174 @@
+"""
+Uniform handling of the kinds of input doc23 accepts.
+
+Documents can be given as a path, as in-memory data (`bytes`, `bytearray`,
+`memoryview`, `mmap.mmap`) or as a seekable binary stream. Extractors work on
+either a path or a stream, so in-memory data is exposed through `BufferReader`,
+a read-only stream over the caller's buffer that never copies it as a whole.
+"""
+
+import io
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+
+FileInput = Union[str, Path, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable binary stream over an existing buffer.
+
+    Unlike `BytesIO(data)`, which copies anything but `bytes`, the reader keeps a
+    memoryview of the caller's buffer: only the chunks actually read are copied.
+
+    Attributes:
+        buffer: A read-only memoryview of the whole content
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, mmap.mmap]):
+        """
+        Initialize the reader at the start of the buffer.
+
+        Args:
+            data: Any object supporting the buffer protocol
+        """
+        super().__init__()
+        self.buffer = memoryview(data).cast("B").toreadonly()
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        end = len(self.buffer) if size is None or size < 0 else min(self._pos + size, len(self.buffer))
+        data = self.buffer[self._pos:end].tobytes() if end > self._pos else b""
+        self._pos = max(self._pos, end)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, target) -> int:
+        data = self.read(len(memoryview(target)))
+        memoryview(target).cast("B")[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self.buffer) + offset
+        else:
+            raise ValueError(f"invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # The buffer belongs to the caller; only drop the view
+        self.buffer.release()
+        super().close()
+
+
+def open_input(file: FileInput) -> Union[str, BinaryIO]:
+    """
+    Normalize any accepted input into a path string or a seekable binary stream.
+
+    Paths are resolved, in-memory data is wrapped in a BufferReader and streams
+    are rewound; nothing is copied.
+
+    Args:
+        file: A path, in-memory data or a seekable binary stream
+
+    Returns:
+        Union[str, BinaryIO]: The resolved path, or a stream positioned at the start
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        TypeError: If the input is of an unsupported type
+    """
+    if isinstance(file, (str, Path)):
+        path = Path(file)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        return str(path.resolve())
+
+    if isinstance(file, BUFFER_TYPES):
+        return BufferReader(file)
+
+    if hasattr(file, "read") and hasattr(file, "seek"):
+        if isinstance(file, io.TextIOBase):
+            raise TypeError("Text streams are not supported; open the file in binary mode")
+        file.seek(0)
+        return file
+
+    raise TypeError(f"Unsupported file object type: {type(file).__name__}")
+
+
+def buffer_of(stream: BinaryIO) -> Optional[memoryview]:
+    """
+    Return a zero-copy view of a stream's whole content, if it lives in memory.
+
+    Release the view (e.g. with a `with` block) when done: a BytesIO cannot grow
+    and an mmap cannot be closed while it is exported.
+
+    Args:
+        stream: A binary stream
+
+    Returns:
+        Optional[memoryview]: The content, or None for streams backed by a file
+    """
+    if isinstance(stream, BufferReader):
+        # A new view, so releasing it leaves the reader usable
+        return stream.buffer[:]
+    if isinstance(stream, io.BytesIO):
+        return stream.getbuffer()
+    if isinstance(stream, mmap.mmap):
+        return memoryview(stream)
+    return None
+
+
+def read_text(file: Union[str, BinaryIO], encoding: str = "utf-8", errors: str = "replace") -> str:
+    """
+    Decode the whole content of a path or stream, without an intermediate bytes copy.
+
+    Line endings are kept as they are in the file, whatever the input type, so
+    offsets into the text match the content.
+
+    Args:
+        file: A path string or a binary stream, as returned by `open_input`
+        encoding: The text encoding
+        errors: How to handle decoding errors
+
+    Returns:
+        str: The decoded text
+    """
+    if isinstance(file, str):
+        with open(file, "r", encoding=encoding, errors=errors, newline="") as f:
+            return f.read()
+
+    view = buffer_of(file)
+    if view is not None:
+        with view:
+            return str(view, encoding, errors)
+
+    file.seek(0)
+    wrapper = io.TextIOWrapper(file, encoding=encoding, errors=errors, newline="")
+    try:
+        return wrapper.read()
+    finally:
+        # Leave the caller's stream open
+        wrapper.detach()
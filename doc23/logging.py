@@ -9,6 +9,10 @@ import sys
 from typing import Optional
 
 
+# Stay silent until the application configures logging (or calls configure_logging)
+logging.getLogger('doc23').addHandler(logging.NullHandler())
+
+
 def configure_logging(
     level: int = logging.INFO, 
     log_file: Optional[str] = None,
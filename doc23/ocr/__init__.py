@@ -2,6 +2,6 @@
 OCR (Optical Character Recognition) related functionality.
 """
 
-from doc23.ocr.processor import OCRProcessor
+from doc23.ocr.processor import OCRProcessor, get_ocr_processor
 
-__all__ = ["OCRProcessor"] 
\ No newline at end of file
+__all__ = ["OCRProcessor", "get_ocr_processor"] 
\ No newline at end of file
@@ -2,9 +2,15 @@
 OCR processor for handling image-to-text conversion.
 """
 
+import asyncio
 import logging
 import os
+import shlex
 import tempfile
+import threading
+import time
+from concurrent.futures import Executor
+from functools import lru_cache
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO, Optional, Union
@@ -21,6 +27,26 @@ from doc23.exceptions import OCRError
 
 logger = logging.getLogger(__name__)
 
+# Seconds spent waiting for Tesseract in this process, see ocr_seconds()
+_ocr_seconds = 0.0
+_ocr_seconds_lock = threading.Lock()
+
+
+def _add_ocr_seconds(seconds: float) -> None:
+    global _ocr_seconds
+    with _ocr_seconds_lock:
+        _ocr_seconds += seconds
+
+
+def ocr_seconds() -> float:
+    """
+    Return the total time spent running Tesseract in this process, in seconds.
+    
+    Take the difference of two readings to time the OCR of a document; calls
+    running concurrently in other threads are counted too.
+    """
+    return _ocr_seconds
+
 
 class OCRProcessor:
     """
@@ -84,17 +110,21 @@ class OCRProcessor:
                 img = image
             elif isinstance(image, (str, Path)):
                 img = Image.open(image)
-            elif isinstance(image, (BytesIO, BinaryIO)):
+            elif hasattr(image, "read"):
                 img = Image.open(image)
             else:
                 raise OCRError(f"Unsupported image type: {type(image).__name__}")
             
             # Process with tesseract
-            text = pytesseract.image_to_string(
-                img, 
-                lang=self.language,
-                config=self.config
-            )
+            start = time.perf_counter()
+            try:
+                text = pytesseract.image_to_string(
+                    img, 
+                    lang=self.language,
+                    config=self.config
+                )
+            finally:
+                _add_ocr_seconds(time.perf_counter() - start)
             
             return text.strip()
             
@@ -104,6 +134,58 @@ class OCRProcessor:
             logger.error(f"OCR processing error: {e}")
             raise OCRError(f"Failed to process image with OCR: {e}") from e
     
+    async def aprocess_image(
+        self,
+        image: Union[str, Path, BytesIO, BinaryIO, Image.Image],
+        executor: Optional[Executor] = None
+    ) -> str:
+        """
+        Process an image without blocking the event loop.
+        
+        The image is encoded as PNG in the executor, then piped to Tesseract run
+        as an asyncio subprocess. Cancelling the call kills the subprocess.
+        
+        Args:
+            image: Image to process, as accepted by process_image().
+            executor: Executor for encoding the image (the loop's default if None).
+            
+        Returns:
+            Extracted text as a string.
+            
+        Raises:
+            OCRError: If OCR processing fails.
+        """
+        try:
+            png = await asyncio.get_running_loop().run_in_executor(executor, _encode_png, image)
+            process = await asyncio.create_subprocess_exec(
+                pytesseract.pytesseract.tesseract_cmd, "stdin", "stdout",
+                "-l", self.language, *shlex.split(self.config or ""),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            logger.error(f"OCR processing error: {e}")
+            raise OCRError(f"Failed to process image with OCR: {e}") from e
+        
+        start = time.perf_counter()
+        try:
+            out, err = await process.communicate(png)
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                # Reap the killed process, even if this task is cancelled again
+                await asyncio.shield(process.wait())
+            raise
+        finally:
+            _add_ocr_seconds(time.perf_counter() - start)
+        
+        if process.returncode != 0:
+            message = err.decode("utf-8", errors="replace").strip()
+            logger.error(f"OCR processing error: {message}")
+            raise OCRError(f"Failed to process image with OCR: {message}")
+        return out.decode("utf-8", errors="replace").strip()
+    
     def process_images(self, images: list) -> str:
         """
         Process multiple images and combine the extracted text.
@@ -155,4 +237,35 @@ class OCRProcessor:
             if isinstance(e, OCRError):
                 raise
             logger.error(f"Error processing PDF page with OCR: {e}")
-            raise OCRError(f"Failed to process PDF page with OCR: {e}") from e 
\ No newline at end of file
+            raise OCRError(f"Failed to process PDF page with OCR: {e}") from e
+
+
+def _encode_png(image: Union[str, Path, BytesIO, BinaryIO, Image.Image]) -> bytes:
+    """Encode an image as PNG, the input format piped to Tesseract."""
+    img = image if isinstance(image, Image.Image) else Image.open(image)
+    if img.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+        img = img.convert("RGB")
+    buffer = BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=None)
+def get_ocr_processor(language: str = 'eng', config: Optional[str] = None) -> OCRProcessor:
+    """
+    Return a shared OCR processor for a language and configuration.
+    
+    Creating an OCRProcessor checks the Tesseract installation by running it,
+    so extractors reuse one processor per setting instead of creating their own.
+    
+    Args:
+        language: OCR language code (default: 'eng' for English)
+        config: Additional Tesseract configuration parameters
+        
+    Returns:
+        The shared OCRProcessor.
+        
+    Raises:
+        OCRError: If Tesseract is not available
+    """
+    return OCRProcessor(language=language, config=config)
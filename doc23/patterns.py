@@ -0,0 +1,432 @@
+"""
+Regex helpers used by the Gardener to classify text lines.
+
+The Gardener tries the level patterns of a Config in priority order. Instead of
+running one regex per level for every line, the patterns are folded into a single
+alternation so each line is classified with one match call. On top of that, each
+pattern is analyzed for the characters a matching line can start with, so lines
+that no level can match (ordinary paragraph text) skip regex matching entirely.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+try:  # Python 3.11+
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse  # type: ignore[no-redef]
+    import sre_constants  # type: ignore[no-redef]
+
+
+# Prefix for the wrapper groups of the combined pattern. Chosen so it does not
+# collide with group names a user is likely to pick.
+GROUP_PREFIX = "_doc23_lvl"
+
+# Flags the Gardener compiles with. Any other flag found after parsing a pattern
+# was set inline, e.g. "(?i)", and applies to the whole expression.
+_BASE_FLAGS = re.MULTILINE | re.UNICODE
+
+_GROUPREF_OPS = {sre_constants.GROUPREF, sre_constants.GROUPREF_EXISTS}
+
+_REPEAT_OPS = {
+    sre_constants.MAX_REPEAT,
+    sre_constants.MIN_REPEAT,
+    getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT),
+}
+
+# Zero-width items that do not consume the first character
+_ZERO_WIDTH_OPS = {sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT}
+
+# Characters str.splitlines() breaks on, and the line starts they produce in a buffer
+LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+LINE_BREAK = re.compile(f"[{LINE_BREAKS}]")
+# Whitespace that str.strip() removes before the first character of a line
+_LEADING_SPACE = f"[^\\S{LINE_BREAKS}]*(?!\\s)"
+
+_CATEGORY_CLASSES = {
+    sre_constants.CATEGORY_DIGIT: r"\d",
+    sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+    sre_constants.CATEGORY_SPACE: r"\s",
+    sre_constants.CATEGORY_NOT_SPACE: r"\S",
+    sre_constants.CATEGORY_WORD: r"\w",
+    sre_constants.CATEGORY_NOT_WORD: r"\W",
+}
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a level pattern the way the Gardener uses it, once per process.
+    
+    Config validation and every Gardener built from equal configs share the result.
+    
+    Args:
+        pattern: The regular expression source
+        
+    Returns:
+        re.Pattern: The pattern compiled with re.MULTILINE
+        
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, re.MULTILINE)
+
+
+def parse_pattern(pattern: str, flags: int = re.MULTILINE) -> Optional[Any]:
+    """
+    Parse a regex into its sre syntax tree.
+
+    Args:
+        pattern: The regular expression source
+        flags: Flags the pattern is compiled with
+
+    Returns:
+        The parsed pattern, or None if it cannot be parsed
+    """
+    try:
+        return sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+
+
+def _walk(items: Any):
+    """Yield every (op, av) pair of a parsed pattern, descending into nested groups."""
+    for op, av in items:
+        yield op, av
+        if op is sre_constants.BRANCH:
+            for branch in av[1]:
+                yield from _walk(branch)
+        elif op is sre_constants.SUBPATTERN:
+            yield from _walk(av[-1])
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            yield from _walk(av[2])
+        elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            yield from _walk(av[1])
+        elif op is sre_constants.GROUPREF_EXISTS:
+            yield from _walk(av[1])
+            if av[2]:
+                yield from _walk(av[2])
+        elif hasattr(sre_constants, "ATOMIC_GROUP") and op is sre_constants.ATOMIC_GROUP:
+            yield from _walk(av)
+        elif hasattr(sre_constants, "POSSESSIVE_REPEAT") and op is sre_constants.POSSESSIVE_REPEAT:
+            yield from _walk(av[2])
+
+
+def is_combinable(pattern: str) -> bool:
+    """
+    Check whether a pattern keeps its meaning when embedded in a larger alternation.
+
+    Patterns using backreferences (their group numbers shift once embedded) or
+    global inline flags (which would leak into the other levels) are not combinable.
+
+    Args:
+        pattern: The regular expression source
+
+    Returns:
+        bool: True if the pattern can be safely embedded
+    """
+    parsed = parse_pattern(pattern)
+    if parsed is None:
+        return False
+    if parsed.state.flags & ~_BASE_FLAGS:
+        return False
+    return not any(op in _GROUPREF_OPS for op, _ in _walk(parsed))
+
+
+def _char(code: int) -> str:
+    """Return an escape for a code point that is safe inside and outside a character class."""
+    return "\\U%08x" % code
+
+
+def _scoped(source: str, flags: int) -> str:
+    """Wrap a single-character expression with the case/ASCII flags active at its position."""
+    letters = ("i" if flags & re.IGNORECASE else "") + ("a" if flags & re.ASCII else "")
+    return f"(?{letters}:{source})" if letters else source
+
+
+def _class_source(items: Any) -> Optional[str]:
+    """Rebuild a character class from the items of a parsed IN node."""
+    negate = ""
+    parts: List[str] = []
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = "^"
+        elif op is sre_constants.LITERAL:
+            parts.append(_char(av))
+        elif op is sre_constants.RANGE:
+            parts.append(f"{_char(av[0])}-{_char(av[1])}")
+        elif op is sre_constants.CATEGORY and av in _CATEGORY_CLASSES:
+            parts.append(_CATEGORY_CLASSES[av])
+        else:
+            return None
+    return f"[{negate}{''.join(parts)}]"
+
+
+def _first_chars(items: Any, flags: int) -> Tuple[Optional[List[str]], bool]:
+    """
+    Collect expressions for the characters a parsed pattern can start with.
+
+    Returns:
+        Tuple of the single-character expressions (None if they cannot be
+        determined) and whether the pattern can match the empty string
+    """
+    alternatives: List[str] = []
+    for op, av in items:
+        if op in _ZERO_WIDTH_OPS:
+            continue
+
+        if op is sre_constants.LITERAL:
+            alternatives.append(_scoped(_char(av), flags))
+            return alternatives, False
+        if op is sre_constants.NOT_LITERAL:
+            alternatives.append(_scoped(f"[^{_char(av)}]", flags))
+            return alternatives, False
+        if op is sre_constants.IN:
+            source = _class_source(av)
+            if source is None:
+                return None, False
+            alternatives.append(_scoped(source, flags))
+            return alternatives, False
+
+        if op is sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            sub_alternatives, nullable = _first_chars(sub, (flags | add_flags) & ~del_flags)
+        elif op is sre_constants.BRANCH:
+            sub_alternatives, nullable = [], False
+            for branch in av[1]:
+                branch_alternatives, branch_nullable = _first_chars(branch, flags)
+                if branch_alternatives is None:
+                    return None, False
+                sub_alternatives.extend(branch_alternatives)
+                nullable = nullable or branch_nullable
+        elif op in _REPEAT_OPS:
+            sub_alternatives, nullable = _first_chars(av[2], flags)
+            nullable = nullable or av[0] == 0
+        elif hasattr(sre_constants, "ATOMIC_GROUP") and op is sre_constants.ATOMIC_GROUP:
+            sub_alternatives, nullable = _first_chars(av, flags)
+        else:
+            # ANY, group references, conditionals... could start with anything
+            return None, False
+
+        if sub_alternatives is None:
+            return None, False
+        alternatives.extend(sub_alternatives)
+        if not nullable:
+            return alternatives, False
+
+    return alternatives, True
+
+
+def first_char_source(pattern: str) -> Optional[str]:
+    """
+    Build a regex matching any character a line must start with to match `pattern`.
+
+    The result may accept more characters than strictly necessary, never fewer.
+    It assumes lines are stripped, i.e. the first character is not whitespace.
+
+    Args:
+        pattern: The regular expression source
+
+    Returns:
+        Optional[str]: Source of a single-character regex, or None if the pattern
+                       can start with any character (or could not be analyzed)
+    """
+    parsed = parse_pattern(pattern)
+    if parsed is None:
+        return None
+    alternatives, nullable = _first_chars(parsed, parsed.state.flags)
+    if alternatives is None or nullable:
+        return None
+    return "|".join(dict.fromkeys(alternatives))
+
+
+# What a classifier hands back for a matching level: its name, or any other key
+K = TypeVar("K")
+
+
+class _Alternation(Generic[K]):
+    """
+    Matches a line against an ordered subset of level patterns in one call.
+
+    The level patterns are joined, in priority order, into one alternation where
+    each level is wrapped in a named group. Python's regex engine tries the
+    alternatives left to right, so the first level that matches wins, exactly as
+    when trying the patterns one after another.
+
+    If any pattern cannot be embedded safely (see `is_combinable`), the patterns
+    are matched one by one instead.
+    """
+
+    def __init__(self, levels: Sequence[Tuple[K, re.Pattern]], combine: bool = True):
+        self.levels = list(levels)
+        self.combined: Optional[re.Pattern] = None
+        self._slots: Dict[str, Tuple[K, int, int]] = {}
+
+        # A single pattern gains nothing from being wrapped in an alternation
+        if combine and len(self.levels) > 1 and all(is_combinable(p.pattern) for _, p in self.levels):
+            self._combine()
+
+    def _combine(self) -> None:
+        """Compile the master alternation and map each wrapper group back to its level."""
+        parts: List[str] = []
+        slots: Dict[str, Tuple[K, int, int]] = {}
+        index = 0
+        for i, (key, compiled) in enumerate(self.levels):
+            group = f"{GROUP_PREFIX}{i}"
+            parts.append(f"(?P<{group}>{compiled.pattern})")
+            # m.groups() is 0-based for group 1, so the level's own groups start
+            # right after its wrapper group.
+            start = index + 1
+            slots[group] = (key, start, start + compiled.groups)
+            index = start + compiled.groups
+
+        try:
+            combined = re.compile("|".join(parts), re.MULTILINE)
+        except re.error:
+            return
+        if combined.groups != index:
+            return
+
+        self.combined = combined
+        self._slots = slots
+
+    def match(self, line: str) -> Tuple[Optional[K], Optional[Tuple[Any, ...]]]:
+        if self.combined is None:
+            for key, compiled in self.levels:
+                m = compiled.match(line)
+                if m:
+                    return key, m.groups()
+            return None, None
+
+        m = self.combined.match(line)
+        if m is None or m.lastgroup is None:
+            return None, None
+        key, start, end = self._slots[m.lastgroup]
+        return key, m.groups()[start:end]
+
+
+class LineClassifier(Generic[K]):
+    """
+    Classifies a stripped line against the level patterns of a Config.
+
+    Each level is given with a key, handed back when a line matches it: the
+    level name, or anything else the caller wants (the Gardener uses its
+    LevelPlan objects).
+
+    Lines are first routed on their first character: every pattern is analyzed
+    once for the characters a matching line can start with (see
+    `first_char_source`), and only the levels that can possibly match are tried,
+    combined into a single alternation. Lines that no level can match skip regex
+    matching entirely. Patterns that cannot be analyzed are tried for every line.
+
+    Attributes:
+        levels: (key, compiled pattern) pairs in priority order
+        heads: Per level, a single-character regex for its possible first characters,
+               or None if the level may start with anything
+        combined: The alternation over all levels, or None if it could not be built
+        scanner: Finds, in a whole text buffer, the line break before every line that
+                 could be a heading; None if some level may start with anything
+    """
+
+    def __init__(
+        self,
+        levels: Sequence[Tuple[K, re.Pattern]],
+        combine: bool = True,
+        prefilter: bool = True
+    ):
+        """
+        Build the classifier.
+
+        Args:
+            levels: (key, compiled pattern) pairs in priority order
+            combine: Fold the candidate patterns into one alternation
+            prefilter: Route lines on their first character before matching
+        """
+        self.levels = list(levels)
+        self.combine = combine
+        self.heads: List[Optional[re.Pattern]] = []
+        for _, compiled in self.levels:
+            source = first_char_source(compiled.pattern) if prefilter else None
+            self.heads.append(re.compile(source) if source else None)
+
+        self.scanner: Optional[re.Pattern] = None
+        if self.heads and all(self.heads):
+            sources = "|".join(head.pattern for head in self.heads)
+            # Starting each candidate with the consumed line break (rather than a
+            # look-behind) lets the regex engine jump between line breaks quickly.
+            self._first_line = re.compile(f"{_LEADING_SPACE}(?:{sources})")
+            self._newline_scanner = re.compile(f"\n{_LEADING_SPACE}(?:{sources})")
+            self.scanner = re.compile(f"[{LINE_BREAKS}]{_LEADING_SPACE}(?:{sources})")
+
+        self._alternations: Dict[Tuple[int, ...], Optional[_Alternation[K]]] = {}
+        self._dispatch: Dict[str, Optional[_Alternation[K]]] = {}
+
+        everything = self._alternation(tuple(range(len(self.levels))))
+        self.combined = everything.combined if everything else None
+
+    def candidates(self, text: str) -> Iterator[int]:
+        """
+        Yield the start offset of every line in `text` that could be a heading.
+        
+        Line boundaries are the ones used by str.splitlines(). Every heading line is
+        yielded; lines yielded may still turn out to be body text.
+        
+        Args:
+            text: The whole text buffer
+            
+        Returns:
+            Iterator[int]: Offsets of candidate line starts, in increasing order
+        """
+        if self.scanner is None:
+            raise ValueError("Some level pattern may start with any character")
+
+        if self._first_line.match(text):
+            yield 0
+        # Plain "\n" line breaks allow a much faster literal search
+        if any(char in text for char in LINE_BREAKS[1:]):
+            scanner = self.scanner
+        else:
+            scanner = self._newline_scanner
+        for m in scanner.finditer(text):
+            yield m.start() + 1
+
+    def _alternation(self, indices: Tuple[int, ...]) -> Optional[_Alternation[K]]:
+        """Return the (cached) alternation over the given levels."""
+        if indices not in self._alternations:
+            self._alternations[indices] = (
+                _Alternation([self.levels[i] for i in indices], self.combine)
+                if indices else None
+            )
+        return self._alternations[indices]
+
+    def _route(self, char: str) -> Optional[_Alternation[K]]:
+        """Work out, once per distinct first character, which levels can match."""
+        indices = tuple(
+            i for i, head in enumerate(self.heads)
+            if head is None or not char or head.match(char)
+        )
+        alternation = self._alternation(indices)
+        self._dispatch[char] = alternation
+        return alternation
+
+    def match(self, line: str) -> Tuple[Optional[K], Optional[Tuple[Any, ...]]]:
+        """
+        Classify a line.
+
+        Args:
+            line: The stripped text line to classify
+
+        Returns:
+            Tuple of the matched level's key and its capture groups,
+            or (None, None) if no level matches
+        """
+        char = line[:1]
+        try:
+            alternation = self._dispatch[char]
+        except KeyError:
+            alternation = self._route(char)
+        if alternation is None:
+            return None, None
+        return alternation.match(line)
@@ -0,0 +1,31 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import pytest
+
+from doc23 import core
+
+
+class FakeMagic:
+    """Stands in for libmagic, answering every query with the same MIME type."""
+
+    def __init__(self, mime_type):
+        self.mime_type = mime_type
+        self.queries = 0
+
+    def from_buffer(self, data):
+        self.queries += 1
+        return self.mime_type
+
+    def from_file(self, path):
+        self.queries += 1
+        return self.mime_type
+
+
+@pytest.fixture
+def libmagic(monkeypatch):
+    """Replace libmagic with a fake that recognizes plain text; set `mime_type` to change its answer."""
+    magic = FakeMagic("text/plain")
+    monkeypatch.setattr(core, "_mime_detector", lambda: magic)
+    return magic
@@ -0,0 +1,38 @@
+"""
+Helpers shared by the test modules.
+"""
+
+from doc23.config_tree import Config, LevelConfig
+
+
+def legal_config():
+    """Three-level book/chapter/article config shared by the parsing and processing tests."""
+    return Config(
+        root_name="document",
+        sections_field="sections",
+        description_field="description",
+        levels={
+            "book": LevelConfig(
+                pattern=r"^BOOK\s+(.+)$",
+                name="book",
+                title_field="title",
+                description_field="description",
+                sections_field="sections"
+            ),
+            "chapter": LevelConfig(
+                pattern=r"^CHAPTER\s+(\w+)$",
+                name="chapter",
+                title_field="title",
+                sections_field="sections",
+                parent="book"
+            ),
+            "article": LevelConfig(
+                pattern=r"^(\d+)\.\s*(.*)$",
+                name="article",
+                title_field="number",
+                description_field="content",
+                paragraph_field="paragraphs",
+                parent="chapter"
+            )
+        }
+    )
@@ -0,0 +1,91 @@
+"""
+Tests for batch processing with process_many.
+"""
+
+import pickle
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+import pytest
+
+from doc23 import Doc23Processor, ExtractionCache, process_many
+from doc23.batch import DocumentStats, _chunks, _run
+from doc23.exceptions import Doc23Error, FileTypeError
+from tests.helpers import legal_config
+
+
+def _documents(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"BOOK {i}\nIntro\nCHAPTER I\n1. First\nBody {i}\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_process_many_isolates_errors(tmp_path):
+    """A failing document is reported in its result and the others still succeed."""
+    paths = _documents(tmp_path, 5)
+    files = paths[:2] + [tmp_path / "missing.txt", b"\x00\x01\x02"] + paths[2:]
+    processor = Doc23Processor(legal_config())
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        results = list(process_many(files, legal_config(), executor=pool, chunksize=2))
+
+    assert [result.index for result in results] == list(range(len(files)))
+    assert [result.ok for result in results] == [True, True, False, False, True, True, True]
+    assert isinstance(results[2].error, Doc23Error)
+    assert isinstance(results[3].error, FileTypeError)
+    for result in results:
+        assert result.file is files[result.index]
+        if result.ok:
+            assert result.tree == processor.process(result.file)
+
+
+def test_process_many_unordered_and_in_process(tmp_path):
+    """Completion order yields every document once; one worker runs in this process."""
+    paths = _documents(tmp_path, 6)
+    cache = ExtractionCache(tmp_path / "cache")
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        unordered = list(process_many(iter(paths), legal_config(), executor=pool, ordered=False, cache=cache))
+    inline = list(process_many(paths, legal_config(), workers=1))
+
+    assert sorted(result.index for result in unordered) == list(range(6))
+    assert [result[:4] for result in sorted(unordered)] == [result[:4] for result in inline]
+    assert all(result.stats.prune_seconds >= 0 and result.stats.pages is None for result in inline)
+    assert cache.size() > 0
+    assert pickle.loads(pickle.dumps(cache)).directory == cache.directory
+
+    with pytest.raises(ValueError):
+        list(process_many(paths, legal_config(), chunksize=0))
+
+
+class _SlowFirstExecutor(Executor):
+    """Completes every chunk at once except the first, which finishes after a delay."""
+
+    def __init__(self):
+        self.submitted = 0
+        self.submitted_before_first = None
+
+    def submit(self, fn, options, files):
+        future = Future()
+        outcomes = [(None, None, DocumentStats(None, 0, 0, 0)) for _ in files]
+        self.submitted += 1
+        if self.submitted == 1:
+            def finish():
+                self.submitted_before_first = self.submitted
+                future.set_result(outcomes)
+            threading.Timer(0.2, finish).start()
+        else:
+            future.set_result(outcomes)
+        return future
+
+
+def test_ordered_results_behind_slow_document_are_bounded():
+    """In order mode, chunks stop being submitted while results wait behind a slow one."""
+    executor = _SlowFirstExecutor()
+    chunks = _chunks(enumerate(range(40)), 2)
+    results = list(_run(executor, chunks, None, 2, True))
+
+    assert [result.index for result in results] == list(range(40))
+    assert executor.submitted_before_first == 4
+    assert executor.submitted == 20
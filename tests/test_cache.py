@@ -0,0 +1,106 @@
+"""
+Tests for the on-disk extraction cache.
+"""
+
+import os
+
+from doc23 import Doc23Processor, ExtractionCache
+from doc23.extractors import TextExtractor
+from tests.helpers import legal_config
+
+
+def test_cache_round_trip(tmp_path):
+    """Entries come back as stored; keys depend on content and settings."""
+    cache = ExtractionCache(tmp_path)
+    key = cache.key(b"content", "pdf", "PDFExtractor/1", "auto", "eng")
+    assert cache.get(key) is None
+
+    cache.put(key, "text", [0, 10])
+    assert cache.get(key) == ("text", [0, 10])
+    assert cache.size() > 0
+
+    assert key != cache.key(b"content!", "pdf", "PDFExtractor/1", "auto", "eng")
+    assert key != cache.key(b"content", "pdf", "PDFExtractor/2", "auto", "eng")
+    assert key != cache.key(b"content", "pdf", "PDFExtractor/1", True, "eng")
+    assert key != cache.key(b"content", "pdf", "PDFExtractor/1", "auto", "spa")
+
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"content")
+    assert cache.key(path, "pdf", "PDFExtractor/1", "auto", "eng") == key
+
+
+def test_cache_skips_extraction(tmp_path, monkeypatch):
+    """A cached extraction is reused across processors until the file content changes."""
+    path = tmp_path / "doc.txt"
+    path.write_text("BOOK One\n1. First\nBody\n", encoding="utf-8")
+    calls = []
+    extract = TextExtractor.extract_text
+
+    def counting_extract(self, *args, **kwargs):
+        calls.append(self)
+        return extract(self, *args, **kwargs)
+
+    monkeypatch.setattr(TextExtractor, "extract_text", counting_extract)
+    cache = ExtractionCache(tmp_path / "cache")
+    first = Doc23Processor(legal_config(), cache=cache).process(path)
+    assert Doc23Processor(legal_config(), cache=cache).process(path) == first
+    assert len(calls) == 1
+
+    path.write_text("BOOK Two\n", encoding="utf-8")
+    assert Doc23Processor(legal_config(), cache=cache).process(path)["sections"][0]["title"] == "Two"
+    assert len(calls) == 2
+
+
+def test_cache_overwrite_keeps_size(tmp_path):
+    """Storing the same key again replaces the entry instead of adding to the size."""
+    cache = ExtractionCache(tmp_path)
+    key = cache.key(b"content", "pdf", "PDFExtractor/1", "auto", "eng")
+    cache.put(key, "text", [0, 10])
+    size = cache.size()
+    cache.put(key, "text", [0, 10])
+    assert cache.size() == size
+    assert ExtractionCache(tmp_path).size() == size
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Growing past max_size removes the entries used longest ago."""
+    cache = ExtractionCache(tmp_path, max_size=None)
+    keys = [cache.key(bytes([i]), "txt", "TextExtractor/1", False, "eng") for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, os.urandom(200).hex())
+        os.utime(cache._path(key), (i, i))
+    cache.get(keys[0])
+
+    cache.max_size = cache.size() - 1
+    cache.evict()
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+
+
+def test_cache_full_does_not_sweep_on_every_put(tmp_path, monkeypatch):
+    """Eviction makes room for several entries at once."""
+    cache = ExtractionCache(tmp_path, max_size=None)
+    cache.put(cache.key(b"probe", "txt", "TextExtractor/1", False, "eng"), os.urandom(200).hex())
+    cache.max_size = cache.size() * 50
+    sweeps = []
+    evict = ExtractionCache.evict
+
+    def counting_evict(self):
+        sweeps.append(self.size())
+        evict(self)
+
+    monkeypatch.setattr(ExtractionCache, "evict", counting_evict)
+    for i in range(100):
+        cache.put(cache.key(bytes([i]), "txt", "TextExtractor/1", False, "eng"), os.urandom(200).hex())
+    assert 0 < len(sweeps) <= 15
+    assert cache.size() <= cache.max_size
+
+
+def test_cache_discards_corrupt_entries(tmp_path):
+    """Unreadable entries are treated as misses and removed."""
+    cache = ExtractionCache(tmp_path)
+    key = cache.key(b"x", "txt", "TextExtractor/1", False, "eng")
+    cache.put(key, "text")
+    cache._path(key).write_bytes(b"not zlib")
+    assert cache.get(key) is None
+    assert not cache._path(key).exists()
@@ -0,0 +1,65 @@
+"""
+Tests for the doc23 command-line interface.
+"""
+
+import json
+from dataclasses import asdict
+
+import pytest
+import yaml
+
+from doc23 import Doc23Processor
+from doc23.cli import main
+from tests.helpers import legal_config
+
+
+def test_cli_writes_jsonl(tmp_path, capsys):
+    """Each document becomes a JSON line, failures included, and stats go to stderr."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(asdict(legal_config()), sort_keys=False), encoding="utf-8")
+    docs = tmp_path / "docs"
+    (docs / "sub").mkdir(parents=True)
+    (docs / "a.txt").write_text("BOOK A\n1. First\n", encoding="utf-8")
+    (docs / "sub" / "b.txt").write_text("BOOK B\n2. Second\n", encoding="utf-8")
+    (docs / "notes.bin").write_bytes(b"\x00")
+    output = tmp_path / "out.jsonl"
+
+    status = main([str(config_path), str(docs), str(tmp_path / "missing.txt"),
+                   "-r", "-w", "1", "--ordered", "-o", str(output)])
+
+    records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    processor = Doc23Processor(legal_config())
+    assert status == 1
+    assert [record["file"] for record in records] == [
+        str(docs / "a.txt"), str(docs / "sub" / "b.txt"), str(tmp_path / "missing.txt")
+    ]
+    assert records[0]["tree"] == processor.process(docs / "a.txt")
+    assert "message" in records[2]["error"]
+    assert "3 documents (1 failed)" in capsys.readouterr().err
+
+
+def test_cli_reads_json_config_and_globs(tmp_path, capsys):
+    """JSON configs and glob patterns work, and output goes to stdout."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(asdict(legal_config())), encoding="utf-8")
+    (tmp_path / "a.txt").write_text("BOOK A\n", encoding="utf-8")
+
+    assert main([str(config_path), str(tmp_path / "*.txt"), "-w", "1", "-q"]) == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["file"] == str(tmp_path / "a.txt")
+    assert captured.err == ""
+
+
+@pytest.mark.parametrize("name, content", [
+    ("config.yaml", "root_name: [unclosed\n"),
+    ("config.json", "{not json"),
+    ("config.yaml", "root_name: law\nsections_field: sections\ndescription_field: description\nlevels: []\n"),
+])
+def test_cli_reports_broken_config(tmp_path, capsys, name, content):
+    """An unreadable or malformed config is a usage error naming the file, not a traceback."""
+    config_path = tmp_path / name
+    config_path.write_text(content, encoding="utf-8")
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(config_path), str(tmp_path)])
+    assert exc_info.value.code == 2
+    assert f"cannot load configuration: {config_path}" in capsys.readouterr().err
@@ -0,0 +1,185 @@
+"""
+Tests for Doc23 and Doc23Processor.
+"""
+
+import asyncio
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+from doc23 import Doc23, Doc23Processor, aextract_text, core
+from doc23.exceptions import FileTypeError
+from tests.helpers import legal_config
+
+
+TEXT = "Preamble\nBOOK One\nIntro\nCHAPTER I\n1. First\nBody\n2. Second\n"
+
+
+def test_processor_matches_doc23(tmp_path):
+    """A processor reused across files gives what a Doc23 per file gives."""
+    processor = Doc23Processor(legal_config())
+    for i, suffix in enumerate(("txt", "md")):
+        path = tmp_path / f"doc{i}.{suffix}"
+        path.write_text(TEXT + f"3. Extra {i}\n", encoding="utf-8")
+
+        expected = Doc23(path, legal_config()).prune()
+        assert processor.process(path) == expected
+        assert processor.process(str(path)) == expected
+        assert processor.prune_text(processor.extract(path)) == expected
+        assert expected["sections"][0]["sections"][0]["sections"][-1]["content"] == f"Extra {i}"
+
+
+def test_processor_accepts_buffers(libmagic):
+    """Bytes and streams are detected from their content."""
+    processor = Doc23Processor(legal_config())
+    expected = processor.prune_text(TEXT.strip())
+    assert processor.process(TEXT.encode()) == expected
+    assert processor.process(BytesIO(TEXT.encode())) == expected
+    assert processor.detect_type(TEXT.encode()) == "txt"
+
+
+def test_processor_rejects_unknown_types():
+    """Unsupported inputs raise FileTypeError."""
+    processor = Doc23Processor(legal_config())
+    with pytest.raises(FileTypeError):
+        processor.process(12)
+
+
+def test_processor_passes_pdf_settings(monkeypatch):
+    """The PDF engine and worker count reach the extractor on every entry point."""
+    seen = []
+
+    class FakeExtractor:
+        def extract_text(self, scan_or_image=None):
+            return TEXT
+
+    def get_extractor(file, file_type, scan_or_image, ocr_language, pdf_engine, pdf_workers):
+        seen.append((pdf_engine, pdf_workers))
+        return FakeExtractor()
+
+    monkeypatch.setattr(core, "get_extractor", get_extractor)
+    processor = Doc23Processor(legal_config(), pdf_engine="pdfium", pdf_workers=4)
+    processor.extract(b"%PDF-1.4", file_type="pdf")
+    processor.process(b"%PDF-1.4", file_type="pdf")
+    assert seen == [("pdfium", 4)] * 2
+
+
+def test_doc23_memoizes_extracted_text(tmp_path, monkeypatch):
+    """Text is extracted once per mode until the cache is cleared."""
+    path = tmp_path / "doc.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    calls = []
+    extract = core._extract
+
+    def counting_extract(*args, **kwargs):
+        calls.append(args[2])
+        return extract(*args, **kwargs)
+
+    monkeypatch.setattr(core, "_extract", counting_extract)
+    doc = Doc23(path, legal_config())
+    text = doc.extract_text(scan_or_image="auto")
+    first = doc.prune()
+    assert doc.prune() == first
+    assert doc.extract_text(scan_or_image="auto") == text
+    assert calls == ["auto"]
+
+    # Text files read the same in every mode
+    doc.extract_text()
+    assert calls == ["auto"]
+
+    path.write_text(TEXT + "3. Added\n", encoding="utf-8")
+    assert doc.prune() == first
+    doc.clear_text_cache()
+    assert doc.prune() != first
+    assert calls == ["auto", "auto"]
+
+
+def test_doc23_extracts_once_for_extract_text_then_prune(tmp_path, monkeypatch):
+    """extract_text() followed by prune() reads a file whose type ignores OCR modes once."""
+    path = tmp_path / "doc.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    calls = []
+    extract = core._extract
+
+    def counting_extract(*args, **kwargs):
+        calls.append(args[2])
+        return extract(*args, **kwargs)
+
+    monkeypatch.setattr(core, "_extract", counting_extract)
+    doc = Doc23(path, legal_config())
+    doc.extract_text()
+    doc.prune()
+    assert calls == [False]
+
+    # PDF text depends on the mode, so each mode is extracted on its own
+    monkeypatch.setattr(core, "_extract", lambda *args, **kwargs: calls.append(args[2]) or (TEXT, None))
+    pdf = Doc23(b"%PDF-1.4", legal_config(), file_type="pdf")
+    pdf.extract_text()
+    pdf.prune()
+    pdf.prune()
+    assert calls == [False, False, "auto"]
+
+
+def test_prune_iter_reads_pdf_pages_lazily(monkeypatch):
+    """PDF pages are extracted as the tree is consumed, and re-attach to what prune() gives."""
+    pages = ["Preamble\nBOOK One\nIntro", "CHAPTER I\n1. First\nBody", "2. Second\nBOOK Two\nOutro"]
+    read = []
+
+    class FakeExtractor:
+        def iter_pages(self):
+            for text in pages:
+                read.append(text)
+                yield text
+
+    doc = Doc23(b"%PDF-1.4", legal_config(), file_type="pdf")
+    monkeypatch.setattr(doc, "_get_extractor", lambda scan_or_image: FakeExtractor())
+    stream = doc.prune_iter()
+    root = next(stream)
+    assert read == pages[:1]
+    root["sections"] = list(stream)
+    assert read == pages
+    assert root == doc.gardener.prune("\n".join(pages))
+
+
+def test_import_does_not_load_backends():
+    """Extractor backends are only imported when a file type needs them."""
+    code = (
+        "import sys, doc23, doc23.extractors\n"
+        "heavy = {'pdfplumber', 'pdf2image', 'docx2txt', 'odf', 'striprtf', 'markdown', 'magic'}\n"
+        "print(sorted(heavy & set(sys.modules)))\n"
+        "doc23.extractors.TextExtractor\n"
+        "print('doc23.extractors.text' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.split("\n")[:2] == ["[]", "True"]
+
+
+def test_async_api_matches_sync(tmp_path, libmagic):
+    """aextract_text, aprune and aprocess give what their blocking variants give."""
+    path = tmp_path / "doc.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    processor = Doc23Processor(legal_config())
+    expected = Doc23(path, legal_config()).prune()
+
+    async def run():
+        doc = Doc23(path, legal_config())
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            texts = await asyncio.gather(
+                aextract_text(path, executor=pool),
+                aextract_text(TEXT.encode(), executor=pool, limit=1),
+            )
+            trees = await asyncio.gather(
+                doc.aprune(executor=pool),
+                processor.aprocess(path, executor=pool),
+                processor.aprocess(TEXT.encode(), compact=True, limit=asyncio.Semaphore(2)),
+            )
+        return texts, trees, doc
+
+    texts, trees, doc = asyncio.run(run())
+    assert texts == [TEXT.strip(), TEXT.strip()]
+    assert trees[0] == trees[1] == expected
+    assert trees[2].to_dict() == processor.prune_text(TEXT.strip())
+    assert doc.extract_text(scan_or_image="auto") == TEXT.strip()
@@ -2,10 +2,15 @@
 Tests for the Gardener class.
 """
 
+import random
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from doc23.config_tree import Config, LevelConfig
-from doc23.gardener import Gardener
+from doc23.gardener import Gardener, PruneHandler, compiled_configs
+from doc23.patterns import LINE_BREAKS
+from tests.helpers import legal_config
 
 
 def test_gardener_initialization():
@@ -179,4 +184,219 @@ Free text after title"""
     # Check second title
     title2 = result["sections"][1]
     assert title2["title"] == "Second Title"
-    assert title2["description"] == "Free text after title" 
\ No newline at end of file
+    assert title2["description"] == "Free text after title" 
+
+def _random_texts(count=200):
+    """Yield random documents mixing headings, body text, blanks and every kind of line break."""
+    pieces = [
+        "BOOK One", "  BOOK Two  ", "CHAPTER IV", "CHAPTER IV trailing", "12. Scope",
+        "\t3.  Indented article", "Body text", "  body with spaces  ", "", "   ",
+        "BOOKS are not headings", "1) not an article",
+    ]
+    breaks = ["\n", "\r\n", "\r", "\x0c", " ", "\n\n"]
+    rng = random.Random(23)
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 25)):
+            parts.append(rng.choice(pieces))
+            parts.append(rng.choice(breaks))
+        yield "".join(parts[:rng.randint(1, len(parts))])
+
+
+def test_prune_buffer_scan_matches_line_scan():
+    """Whole-buffer scanning produces exactly the same tree as line scanning."""
+    gardener = Gardener(legal_config())
+    assert gardener.classifier.scanner is not None
+
+    for text in _random_texts():
+        assert gardener.prune(text, scan="buffer") == gardener.prune(text)
+
+
+def test_prune_iter_matches_prune():
+    """Streaming over arbitrary chunks yields the root, then each top-level node."""
+    gardener = Gardener(legal_config())
+    rng = random.Random(7)
+    for text in _random_texts():
+        cuts = sorted(rng.sample(range(len(text) + 1), min(len(text) + 1, rng.randint(0, 6))))
+        chunks = [text[i:j] for i, j in zip([0] + cuts, cuts + [len(text)])]
+
+        root, *sections = gardener.prune_iter(chunks)
+        assert root["sections"] == []
+        root["sections"] = sections
+        assert root == gardener.prune(text)
+
+
+def test_prune_iter_yields_closed_nodes_early():
+    """A top-level node is yielded before the rest of the input is read."""
+    gardener = Gardener(legal_config())
+    consumed = []
+
+    def lines():
+        for line in ["Preamble\n", "BOOK One\n", "1. First\n", "BOOK Two\n", "2. Second\n"]:
+            consumed.append(line)
+            yield line
+
+    stream = gardener.prune_iter(lines())
+    assert next(stream)["description"] == "Preamble"
+    first = next(stream)
+    assert first["title"] == "One"
+    assert len(consumed) == 4
+    assert [node["title"] for node in stream] == ["Two"]
+
+
+def test_parse_emits_nested_events():
+    """The event API reports every node and stored line without building the tree."""
+
+    class Recorder(PruneHandler):
+        def __init__(self):
+            self.events = []
+
+        def start_node(self, level, fields):
+            self.events.append(("start", level, fields))
+
+        def text(self, line):
+            self.events.append(("text", line))
+
+        def end_node(self, level):
+            self.events.append(("end", level))
+
+    gardener = Gardener(legal_config())
+    recorder = Recorder()
+    gardener.parse("Preamble\nBOOK One\nIntro\nCHAPTER II\nDropped\n7. Art\nBody\nBOOK Two", recorder)
+
+    assert recorder.events == [
+        ("text", "Preamble"),
+        ("start", "book", {"title": "One", "description": ""}),
+        ("text", "Intro"),
+        ("start", "chapter", {"title": "II"}),
+        ("start", "article", {"number": "7", "content": "Art"}),
+        ("text", "Body"),
+        ("end", "article"),
+        ("end", "chapter"),
+        ("end", "book"),
+        ("start", "book", {"title": "Two", "description": ""}),
+        ("end", "book"),
+    ]
+
+
+def test_level_plans_resolve_fields():
+    """Plans precompute rank, leaf status, free-text field and insertion fields."""
+    gardener = Gardener(legal_config())
+    book, chapter, article = (gardener.plans[name] for name in ("book", "chapter", "article"))
+
+    assert [book.rank, chapter.rank, article.rank] == [0, 1, 2]
+    assert article.is_leaf and not book.is_leaf
+    assert (article.text_field, article.text_is_paragraph) == ("paragraphs", True)
+    assert (book.text_field, book.text_is_paragraph) == ("description", False)
+    assert chapter.text_field is None
+    assert article.insert_field == ("sections", "sections", "paragraphs")
+
+
+def test_prune_compact_matches_prune():
+    """The compact tree reads like, and materializes to, the dictionary tree."""
+    gardener = Gardener(legal_config())
+    for text in _random_texts(100):
+        expected = gardener.prune(text)
+        tree = gardener.prune_compact(text)
+        assert tree.to_dict() == expected
+        assert tree == expected
+
+    tree = gardener.prune_compact("Intro\nBOOK One\n1. First\nBody line\n2. Second")
+    article = tree["sections"][0]["sections"][0]
+    assert article["number"] == "1"
+    assert article["paragraphs"] == ["Body line"]
+    assert article.to_dict() == {
+        "type": "article", "number": "1", "content": "First", "paragraphs": ["Body line"],
+    }
+
+
+def test_compact_views_read_single_fields(monkeypatch):
+    """Reading a field of a view does not assemble the node, spans and pages included."""
+    gardener = Gardener(legal_config())
+    text = "Intro\nBOOK One\n1. First\nBody line\n2. Second\nMore\n"
+    page_starts = [0, text.index("2. Second")]
+    expected = gardener.prune(text, spans=True, page_starts=page_starts)
+    tree = gardener.prune_compact(text, spans=True, page_starts=page_starts)
+
+    def no_build(*args):
+        raise AssertionError("node assembled")
+
+    monkeypatch.setattr(tree, "_build", no_build)
+    assert tree == expected
+    book = tree["sections"][0]
+    assert list(book) == list(expected["sections"][0])
+    assert book["sections"][1]["pages"] == (2, 2)
+    with pytest.raises(KeyError):
+        book["paragraphs"]
+
+
+def _descendants(node):
+    """Yield every node of a pruned tree below `node`, depth first."""
+    for child in node.get("sections", []):
+        yield child
+        yield from _descendants(child)
+
+
+def test_prune_spans_cover_source():
+    """Spans start at a line start and are the same in every mode."""
+    gardener = Gardener(legal_config())
+    for text in _random_texts(100):
+        tree = gardener.prune(text, spans=True)
+        for node in _descendants(tree):
+            start, end = node["span"]
+            assert 0 <= start <= end <= len(text)
+            assert start == 0 or text[start - 1] in LINE_BREAKS
+        assert gardener.prune(text, scan="buffer", spans=True) == tree
+        assert gardener.prune_compact(text, spans=True).to_dict() == tree
+
+
+def test_prune_spans_and_pages():
+    """Spans end where the next heading closes the node and map to page ranges."""
+    gardener = Gardener(legal_config())
+    text = "Intro\nBOOK One\n1. First\nBody line\n2. Second\nMore\n"
+    page_starts = [0, text.index("2. Second")]
+    tree = gardener.prune(text, spans=True, page_starts=page_starts)
+
+    book = tree["sections"][0]
+    first, second = book["sections"]
+    assert text[slice(*book["span"])] == text[text.index("BOOK"):]
+    assert text[slice(*first["span"])] == "1. First\nBody line\n"
+    assert text[slice(*second["span"])] == "2. Second\nMore\n"
+    assert (book["pages"], first["pages"], second["pages"]) == ((1, 2), (1, 1), (2, 2))
+
+
+def test_prune_parallel_matches_prune():
+    """Shards pruned in worker processes stitch back into the same tree."""
+    gardener = Gardener(legal_config())
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        for text in _random_texts(30):
+            assert gardener.prune_parallel(text, workers=2, executor=pool) == gardener.prune(text)
+
+        text = "Preamble\n1. Orphan\n" + "".join(f"BOOK {i}\nIntro\n1. Art\nBody\n" for i in range(20))
+        tree = gardener.prune_parallel(text, workers=2, executor=pool)
+        assert tree == gardener.prune(text)
+        assert tree["description"] == "Preamble"
+        assert [node["title"] for node in tree["sections"][1:]] == [str(i) for i in range(20)]
+    assert len(gardener._shards(text, 4)) == 4
+
+
+def test_equal_configs_share_compiled_state():
+    """Gardeners of equal configs reuse one compiled config; others do not."""
+    compiled_configs.clear()
+    first, second = Gardener(legal_config()), Gardener(legal_config())
+    assert second.classifier is first.classifier
+    assert second.plans is first.plans
+    assert len(compiled_configs) == 1
+
+    other = legal_config()
+    other.levels["chapter"].pattern = r"^CHAPTER\s+(\d+)$"
+    assert Gardener(other).classifier is not first.classifier
+    assert len(compiled_configs) == 2
+
+    compiled_configs.maxsize, maxsize = 1, compiled_configs.maxsize
+    try:
+        other.levels["chapter"].pattern = r"^CHAPTER\s+([IVX]+)$"
+        Gardener(other)
+        assert len(compiled_configs) == 1
+    finally:
+        compiled_configs.maxsize = maxsize
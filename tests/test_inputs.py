@@ -0,0 +1,68 @@
+"""
+Tests for the uniform input handling.
+"""
+
+import mmap
+from io import BytesIO
+
+import pytest
+
+from doc23.core import extract_text
+from doc23.exceptions import ExtractionError
+from doc23.extractors.text import TextExtractor
+from doc23.inputs import BufferReader, buffer_of, open_input, read_text
+
+
+CONTENT = "Título\nLínea dos\n".encode("utf-8")
+
+
+def test_buffer_reader_shares_caller_buffer():
+    data = bytearray(CONTENT)
+    reader = BufferReader(data)
+    assert reader.read(2) == CONTENT[:2]
+    reader.seek(0)
+    data[0:1] = b"X"
+    assert reader.read(1) == b"X"
+    assert reader.seek(0, 2) == len(CONTENT)
+    assert reader.read() == b""
+
+
+@pytest.mark.parametrize("make", [bytes, bytearray, memoryview, BytesIO])
+def test_extract_text_accepts_in_memory_inputs(make, libmagic):
+    assert extract_text(make(CONTENT)) == "Título\nLínea dos"
+
+
+def test_extract_text_accepts_mmap(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(CONTENT)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert TextExtractor(mapped).extract_text() == "Título\nLínea dos"
+
+
+def test_read_text_uses_buffer_without_copy():
+    stream = open_input(CONTENT)
+    view = buffer_of(stream)
+    assert view is not None and view.obj is CONTENT
+    view.release()
+    assert read_text(stream) == CONTENT.decode("utf-8")
+
+
+def test_read_text_keeps_line_endings(tmp_path):
+    """In-memory data, streams and paths decode CRLF content to the same text."""
+    data = "Título\r\nLínea dos\rtres\n".encode("utf-8")
+    path = tmp_path / "doc.txt"
+    path.write_bytes(data)
+    expected = data.decode("utf-8")
+
+    assert read_text(open_input(data)) == expected
+    with open(path, "rb") as f:
+        assert buffer_of(f) is None
+        assert read_text(f) == expected
+    assert read_text(str(path)) == expected
+
+
+def test_unsupported_inputs_raise():
+    with pytest.raises(ExtractionError):
+        TextExtractor(12345)
+    with pytest.raises(ExtractionError):
+        TextExtractor("/no/such/file.txt")
@@ -0,0 +1,97 @@
+"""
+Tests for the regex helpers used by the Gardener.
+"""
+
+import re
+
+from doc23.patterns import LineClassifier, first_char_source, is_combinable
+
+
+def _sequential(levels, line):
+    for name, compiled in levels:
+        m = compiled.match(line)
+        if m:
+            return name, m.groups()
+    return None, None
+
+
+def test_classifier_matches_sequential_priority():
+    """The combined alternation picks the same level as trying patterns in order."""
+    levels = [
+        ("book", re.compile(r"^BOOK\s+(.+)$", re.MULTILINE)),
+        ("chapter", re.compile(r"^(?:CHAPTER|BOOK)\s+(\w+)\s*(.*)$", re.MULTILINE)),
+        ("article", re.compile(r"^ARTICLE\s+(\d+)\.\s*(.*)$", re.MULTILINE)),
+        ("item", re.compile(r"^(\d+)\)(.*)$", re.MULTILINE)),
+    ]
+    classifier = LineClassifier(levels)
+    assert classifier.combined is not None
+
+    lines = [
+        "BOOK One",
+        "CHAPTER II Of things",
+        "ARTICLE 12. Scope",
+        "ARTICLE twelve",
+        "3) an item",
+        "Plain body text",
+    ]
+    for line in lines:
+        assert classifier.match(line) == _sequential(levels, line)
+
+
+def test_classifier_falls_back_for_backreferences():
+    """Patterns whose group numbers would shift are matched one by one."""
+    assert not is_combinable(r"^(\w)\1\s+(.+)$")
+    assert not is_combinable(r"(?i)^article\s+(\d+)")
+    assert is_combinable(r"^(?P<num>\d+)\.\s*(.*)$")
+
+    levels = [
+        ("title", re.compile(r"^TITLE\s+(.+)$", re.MULTILINE)),
+        ("double", re.compile(r"^(\w)\1\s+(.+)$", re.MULTILINE)),
+    ]
+    classifier = LineClassifier(levels)
+    assert classifier.combined is None
+    assert classifier.match("AA body") == ("double", ("A", "body"))
+    assert classifier.match("TITLE X") == ("title", ("X",))
+    assert classifier.match("AB body") == (None, None)
+
+
+def test_first_char_source_extracts_leading_characters():
+    """Leading literals and classes are extracted; open-ended patterns are not."""
+    assert re.fullmatch(first_char_source(r"^CHAPTER\s+(\w+)$"), "C")
+    assert not re.fullmatch(first_char_source(r"^CHAPTER\s+(\w+)$"), "c")
+    assert re.fullmatch(first_char_source(r"^(\d+)\.\s*(.*)$"), "7")
+    assert re.fullmatch(first_char_source(r"^§\s*(\d+)"), "§")
+    head = first_char_source(r"^(?:CAPÍTULO|ARTICLE)\s+(.+)$")
+    assert re.fullmatch(head, "C") and re.fullmatch(head, "A")
+    assert re.fullmatch(first_char_source(r"(?i)^article\s+(\d+)"), "A")
+    assert first_char_source(r"^(.+):$") is None
+    assert first_char_source(r"^(\d*)") is None
+
+
+def test_prefilter_skips_regex_for_body_lines():
+    """Lines whose first character no level accepts are never matched."""
+    levels = [
+        ("chapter", re.compile(r"^CHAPTER\s+(\w+)$", re.MULTILINE)),
+        ("article", re.compile(r"^(\d+)\.\s*(.*)$", re.MULTILINE)),
+        ("label", re.compile(r"^(.+):$", re.MULTILINE)),
+    ]
+    classifier = LineClassifier(levels)
+    lines = ["CHAPTER IV", "12. Scope", "Definitions:", "The body text.", "CHAPTERS"]
+    for line in lines:
+        assert classifier.match(line) == _sequential(levels, line)
+
+    strict = LineClassifier(levels[:2])
+    assert strict.match("The body text.") == (None, None)
+    assert strict._dispatch["T"] is None
+
+
+def test_classifier_returns_any_level_key():
+    """Levels may be keyed by any object, which is handed back as is."""
+    chapter, article = object(), object()
+    classifier = LineClassifier([
+        (chapter, re.compile(r"^CHAPTER\s+(\w+)$", re.MULTILINE)),
+        (article, re.compile(r"^(\d+)\.\s*(.*)$", re.MULTILINE)),
+    ])
+    assert classifier.match("CHAPTER IV")[0] is chapter
+    assert classifier.match("12. Scope") == (article, ("12", "Scope"))
+    assert classifier.match("Body") == (None, None)
@@ -0,0 +1,243 @@
+"""
+Tests for PDFExtractor page handling.
+"""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("pdf2image")
+
+from doc23.exceptions import ExtractionError, OCRError
+from doc23.extractors import pdf
+from doc23.extractors.pdf import PDFExtractor, _runs
+from doc23.extractors import pdf_pages
+from doc23.extractors.pdf_pages import PageClass
+
+
+class _FakeOCR:
+    def process_image(self, image):
+        return f"ocr {image}"
+
+
+def _extractor(monkeypatch, texts):
+    """A PDFExtractor whose text layer, page classes and page images are faked; every page is a scan."""
+    extractor = PDFExtractor(b"%PDF-1.4", scan_or_image="auto")
+    rendered = []
+
+    def render(file_obj, pages=None):
+        rendered.append(pages)
+        return list(pages if pages is not None else range(len(texts)))
+
+    monkeypatch.setattr(extractor, "_text_layer", lambda file_obj: list(texts))
+    monkeypatch.setattr(extractor, "_render_pages", render)
+    monkeypatch.setattr(
+        pdf, "classify_pages",
+        lambda file_obj, min_text_chars, pages: [PageClass("scanned", 0, 1.0, False) for _ in pages]
+    )
+    ocr_module = types.ModuleType("doc23.ocr.processor")
+    ocr_module.get_ocr_processor = lambda language: _FakeOCR()
+    monkeypatch.setitem(sys.modules, "doc23.ocr.processor", ocr_module)
+    return extractor, rendered
+
+
+def test_runs_groups_consecutive_pages():
+    assert list(_runs([0, 1, 2, 5, 7, 8])) == [(0, 2), (5, 5), (7, 8)]
+    assert list(_runs([])) == []
+
+
+def test_auto_ocrs_only_pages_without_text(monkeypatch):
+    """Pages with a text layer are kept, the others are OCR'd in place."""
+    texts = ["Digital page one", "", "  \n 3 ", "Digital page four"]
+    extractor, rendered = _extractor(monkeypatch, texts)
+
+    text = extractor.extract_text()
+    assert rendered == [[1, 2]]
+    assert text == "Digital page one\nocr 1\nocr 2\nDigital page four"
+    assert extractor.page_starts == [0, 17, 23, 29]
+
+
+def test_auto_without_scanned_pages_skips_ocr(monkeypatch):
+    extractor, rendered = _extractor(monkeypatch, ["Digital page one", "Digital page two"])
+    assert extractor.extract_text() == "Digital page one\nDigital page two"
+    assert rendered == []
+
+    extractor, rendered = _extractor(monkeypatch, ["", ""])
+    assert extractor.extract_text() == "ocr 0\n\nocr 1"
+
+
+def test_async_ocr_failure_waits_for_the_other_pages(monkeypatch):
+    """When one page fails, the pages still running are cancelled and unwound before the error."""
+    extractor, _ = _extractor(monkeypatch, ["", "", ""])
+    unwound = []
+
+    class AsyncOCR:
+        async def aprocess_image(self, image, executor=None):
+            if image == 0:
+                await asyncio.sleep(0)
+                raise OCRError("Tesseract failed")
+            try:
+                await asyncio.Event().wait()
+            finally:
+                unwound.append(image)
+
+    monkeypatch.setattr(sys.modules["doc23.ocr.processor"], "get_ocr_processor", lambda language: AsyncOCR())
+
+    async def run():
+        with pytest.raises(ExtractionError):
+            await extractor.aextract_text(limit=asyncio.Semaphore(3))
+        return sorted(unwound)
+
+    assert asyncio.run(run()) == [1, 2]
+
+
+def _pdf(pages):
+    """
+    Build a PDF whose pages draw the given content streams.
+
+    Each page is (content, fonts, images): pages with fonts get a Helvetica font
+    /F1 and pages with images a 1x1 image /Im1.
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+               b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray "
+               b"/BitsPerComponent 8 /Length 1 >>\nstream\n\x80\nendstream"]
+    kids = []
+    for content, fonts, images in pages:
+        resources = (b"/Font << /F1 3 0 R >> " if fonts else b"") + (b"/XObject << /Im1 4 0 R >>" if images else b"")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 600 800] /Resources << %s >> "
+                       b"/Contents %d 0 R >>" % (resources, len(objects)))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+TEXT_PAGE = (b"BT /F1 12 Tf 72 700 Td (Article one of the text layer) Tj ET", True, False)
+SCANNED_PAGE = (b"q 600 0 0 800 0 0 cm /Im1 Do Q", False, True)
+MIXED_PAGE = (b"q 1 0 0 1 0 0 cm q 600 0 0 500 0 0 cm /Im1 Do Q Q "
+              b"BT /F1 12 Tf 72 700 Td [(Caption) -250 (over the image)] TJ ET", True, True)
+LOGO_PAGE = (b"q 60 0 0 40 500 740 cm /Im1 Do Q BT /F1 12 Tf 72 700 Td (Letter with a logo) Tj ET",
+             True, True)
+BLANK_PAGE = (b"", False, False)
+
+
+def test_classify_pages():
+    """Pages are labelled from their text operators, fonts and image coverage."""
+    extractor = PDFExtractor(_pdf([TEXT_PAGE, SCANNED_PAGE, MIXED_PAGE, LOGO_PAGE, BLANK_PAGE]))
+    pages = extractor.classify_pages()
+
+    assert [page.label for page in pages] == ["text", "scanned", "mixed", "text", "text"]
+    assert pages[0].chars == len("Article one of the text layer")
+    assert pages[1] == ("scanned", 0, 1.0, False)
+    assert pages[2].chars == len("Captionover the image")
+    assert pages[2].image_coverage == pytest.approx(0.625)
+    assert pages[3].image_coverage == pytest.approx(60 * 40 / (600 * 800))
+    assert [page.label for page in extractor.classify_pages(pages=[1, 3])] == ["scanned", "text"]
+    assert extractor.pdf_contains_text(_pdf([SCANNED_PAGE, TEXT_PAGE]))
+    assert not extractor.pdf_contains_text(_pdf([SCANNED_PAGE, BLANK_PAGE]))
+
+
+def test_classify_page_ignores_unused_images(monkeypatch):
+    """A text page that declares an image but never draws it is not walked token by token."""
+    def no_scan():
+        raise AssertionError("content stream scanned")
+
+    monkeypatch.setattr(pdf_pages, "_ContentScan", no_scan)
+    content, fonts, _ = TEXT_PAGE
+    pages = PDFExtractor(_pdf([(content, fonts, True)])).classify_pages()
+    assert pages == [("text", len("Article one of the text layer"), 0.0, True)]
+
+
+def test_auto_keeps_blank_pages_on_the_text_layer(monkeypatch):
+    """Pages without text are only OCR'd when images cover them."""
+    extractor = PDFExtractor(_pdf([TEXT_PAGE, BLANK_PAGE, SCANNED_PAGE]), scan_or_image="auto")
+    rendered = []
+    monkeypatch.setattr(extractor, "_render_pages", lambda file_obj, pages: rendered.append(pages) or pages)
+    ocr_module = types.ModuleType("doc23.ocr.processor")
+    ocr_module.get_ocr_processor = lambda language: _FakeOCR()
+    monkeypatch.setitem(sys.modules, "doc23.ocr.processor", ocr_module)
+
+    assert extractor.extract_text() == "Article one of the text layer\n\nocr 2"
+    assert rendered == [[2]]
+
+    # A digital PDF with a blank page needs no OCR at all
+    digital = PDFExtractor(_pdf([TEXT_PAGE, BLANK_PAGE]), scan_or_image="auto")
+    assert digital.extract_text() == "Article one of the text layer\n"
+
+
+def test_pdfium_engine_matches_pdfplumber():
+    """Both engines read the same text layer, and do not share cache keys."""
+    pytest.importorskip("pypdfium2")
+    data = _pdf([TEXT_PAGE, LOGO_PAGE, SCANNED_PAGE])
+    plumber = PDFExtractor(data)
+    pdfium = PDFExtractor(data, engine="pdfium")
+
+    assert pdfium.extract_text() == plumber.extract_text()
+    assert pdfium.page_starts == plumber.page_starts
+    assert pdfium.version != plumber.version
+    with pytest.raises(ExtractionError):
+        PDFExtractor(data, engine="poppler")
+
+
+@pytest.mark.parametrize("engine", ["pdfplumber", "pdfium"])
+def test_parallel_text_layer_keeps_page_order(engine):
+    """Page ranges read in worker processes are joined as a serial read joins them."""
+    if engine == "pdfium":
+        pytest.importorskip("pypdfium2")
+    pages = [(b"BT /F1 12 Tf 72 700 Td (Page %d of the text layer) Tj ET" % i, True, False) for i in range(45)]
+    data = _pdf(pages)
+    serial = PDFExtractor(data, engine=engine)
+    parallel = PDFExtractor(data, engine=engine, workers=2)
+    parallel.min_pages_per_worker = 10
+
+    assert parallel._text_layer_parallel(parallel.file_obj) is not None
+    assert parallel.extract_text() == serial.extract_text()
+    assert parallel.page_starts == serial.page_starts
+    assert "Page 44 of" in parallel.extract_text()
+
+    # Too short to split: read in this process
+    parallel.min_pages_per_worker = 30
+    assert parallel._text_layer_parallel(parallel.file_obj) is None
+
+
+def test_iter_pages_streams_the_text_layer(monkeypatch):
+    """Pages are yielded one at a time; in 'auto' mode each page is OCR'd on its own."""
+    data = _pdf([TEXT_PAGE, SCANNED_PAGE, LOGO_PAGE])
+    extractor = PDFExtractor(data)
+    text = extractor.extract_text()
+    assert "\n".join(extractor.iter_pages()) == text
+    assert list(extractor.iter_pages())[0] == text[:extractor.page_starts[1] - 1]
+
+    rendered = []
+    monkeypatch.setattr(extractor, "_render_pages", lambda path, pages: rendered.append(pages) or pages)
+    ocr_module = types.ModuleType("doc23.ocr.processor")
+    ocr_module.get_ocr_processor = lambda language: _FakeOCR()
+    monkeypatch.setitem(sys.modules, "doc23.ocr.processor", ocr_module)
+
+    pages = extractor.iter_pages(scan_or_image="auto")
+    assert next(pages) == "Article one of the text layer"
+    assert next(pages) == "ocr 1"
+    assert "Letter with a logo" in next(pages)
+    assert rendered == [[1]]
+    assert list(extractor.iter_pages(scan_or_image=True)) == ["ocr 0", "ocr 1", "ocr 2"]
+
+    # Blank pages have nothing to OCR
+    rendered.clear()
+    blank = PDFExtractor(_pdf([TEXT_PAGE, BLANK_PAGE]))
+    monkeypatch.setattr(blank, "_render_pages", lambda path, pages: rendered.append(pages) or pages)
+    assert list(blank.iter_pages(scan_or_image="auto")) == ["Article one of the text layer", ""]
+    assert rendered == []
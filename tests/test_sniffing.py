@@ -0,0 +1,89 @@
+"""
+Tests for magic-byte file type detection.
+"""
+
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from doc23.core import detect_file_type
+from doc23.exceptions import FileTypeError
+from doc23.sniffing import sniff_file_type
+
+
+def _zip(entries, stored_first=None):
+    """Build a zip archive in memory, optionally starting with an uncompressed entry."""
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        if stored_first:
+            archive.writestr(zipfile.ZipInfo(stored_first[0]), stored_first[1], zipfile.ZIP_STORED)
+        for name, data in entries.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+DOCX = _zip({
+    "[Content_Types].xml": (
+        '<Types><Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>'
+    ),
+    "word/document.xml": "<document/>",
+})
+ODT = _zip({"content.xml": "<office/>"}, ("mimetype", "application/vnd.oasis.opendocument.text"))
+
+
+@pytest.mark.parametrize("content, expected", [
+    (b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n", "pdf"),
+    (b"\r\n%PDF-1.4\n", "pdf"),
+    (b"{\\rtf1\\ansi Hello}", "rtf"),
+    (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "png"),
+    (b"\xff\xd8\xff\xe0\x00\x10JFIF", "jpg"),
+    (b"II*\x00\x08\x00\x00\x00", "tiff"),
+    (b"MM\x00*\x00\x00\x00\x08", "tiff"),
+    (b"GIF89a\x01\x00", "gif"),
+    (b"BM" + bytes(12) + (40).to_bytes(4, "little"), "bmp"),
+    (DOCX, "docx"),
+    (ODT, "odt"),
+    ("ARTICLE 1. Ámbito\n".encode("utf-8"), None),
+    (b"BMW owners manual\n", None),
+    (_zip({"a.txt": "x"}), None),
+    (b"\x00\x01\x02\x03", None),
+])
+def test_sniff_file_type(content, expected):
+    """Each supported format is recognized from its content alone."""
+    assert sniff_file_type(BytesIO(content)) == expected
+
+
+def test_detect_file_type_hint_skips_reading():
+    """With a type hint the file is not read at all."""
+    class Unreadable(BytesIO):
+        def read(self, *args):
+            raise AssertionError("read")
+
+    assert detect_file_type(Unreadable(), hint=".PDF") == "pdf"
+    assert detect_file_type(Unreadable(), hint="application/vnd.oasis.opendocument.text") == "odt"
+    with pytest.raises(FileTypeError):
+        detect_file_type(Unreadable(), hint="xls")
+
+
+def test_detect_file_type_sniffs_buffers_and_unknown_extensions(tmp_path):
+    """Buffers and files with unknown extensions are sniffed and rewound."""
+    stream = BytesIO(DOCX)
+    assert detect_file_type(stream) == "docx"
+    assert stream.tell() == 0
+    assert detect_file_type(ODT) == "odt"
+
+    path = tmp_path / "upload.bin"
+    path.write_bytes(b"%PDF-1.5\n")
+    assert detect_file_type(path) == "pdf"
+
+
+def test_detect_file_type_leaves_text_to_libmagic(libmagic):
+    """Content without a signature is typed by libmagic, so unnamed HTML is still rejected."""
+    assert detect_file_type(b"ARTICLE 1. Scope\n") == "txt"
+    assert libmagic.queries == 1
+
+    libmagic.mime_type = "text/html"
+    with pytest.raises(FileTypeError):
+        detect_file_type(b"<!DOCTYPE html><html><body>ARTICLE 1.</body></html>")